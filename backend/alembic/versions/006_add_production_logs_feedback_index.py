@@ -0,0 +1,29 @@
+"""Add (source, user_feedback) index on production_logs.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-15 00:00:00.000000
+
+Backs ``IngestionService.get_feedback_stats``, which counts thumbs up/down
+per source in a single conditional-aggregate query.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_production_logs_source_feedback",
+        "production_logs",
+        ["source", "user_feedback"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_production_logs_source_feedback", table_name="production_logs")
@@ -0,0 +1,66 @@
+"""Add composite and partial indexes for hot service queries.
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-15 00:00:00.000000
+
+- production_logs (source, status, ingested_at DESC): ``list_logs`` filters
+  by source/status and pages newest-first without a sort. Supersedes the
+  (source, status) index from 003, which is a prefix of it.
+- evaluation_results (run_id) WHERE rules_passed = false: the release gate's
+  zero-tolerance rule-failure lookup.
+- evaluation_runs (test_set_id, completed_at DESC) WHERE passing+completed:
+  the "last passing baseline" lookup becomes a one-row index probe.
+- test_cases (test_set_id, created_at): ordered test-case listing.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "007"
+down_revision: Union[str, None] = "006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_production_logs_source_status_ingested",
+        "production_logs",
+        ["source", "status", sa.text("ingested_at DESC")],
+    )
+    op.drop_index("ix_production_logs_source_status", table_name="production_logs")
+    op.create_index(
+        "ix_evaluation_results_run_rule_failures",
+        "evaluation_results",
+        ["run_id"],
+        postgresql_where=sa.text("rules_passed = false"),
+    )
+    op.create_index(
+        "ix_evaluation_runs_baseline",
+        "evaluation_runs",
+        ["test_set_id", sa.text("completed_at DESC")],
+        postgresql_where=sa.text("overall_passed AND status = 'completed'"),
+    )
+    op.create_index(
+        "ix_test_cases_test_set_created",
+        "test_cases",
+        ["test_set_id", "created_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_test_cases_test_set_created", table_name="test_cases")
+    op.drop_index("ix_evaluation_runs_baseline", table_name="evaluation_runs")
+    op.drop_index(
+        "ix_evaluation_results_run_rule_failures", table_name="evaluation_results"
+    )
+    op.create_index(
+        "ix_production_logs_source_status",
+        "production_logs",
+        ["source", "status"],
+    )
+    op.drop_index(
+        "ix_production_logs_source_status_ingested", table_name="production_logs"
+    )
@@ -0,0 +1,33 @@
+"""Add (test_set_id, started_at DESC) index on evaluation_runs.
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-15 00:00:00.000000
+
+The per-test-set "last run status" subquery in TestSetService
+(``WHERE test_set_id = ? ORDER BY started_at DESC LIMIT 1``) becomes a
+single index probe instead of fetching and sorting every run of the set.
+``status`` is INCLUDEd so the probe is index-only.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "008"
+down_revision: Union[str, None] = "007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_evaluation_runs_test_set_started",
+        "evaluation_runs",
+        ["test_set_id", sa.text("started_at DESC")],
+        postgresql_include=["status"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_evaluation_runs_test_set_started", table_name="evaluation_runs")
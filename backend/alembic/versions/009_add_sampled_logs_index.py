@@ -0,0 +1,33 @@
+"""Add partial (sampled_into_test_set_id) index on sampled production_logs.
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-15 00:00:00.000000
+
+``evaluate_sampled_traffic`` finds the test sets with sampled-but-unevaluated
+logs, then marks those logs evaluated per set. Both filter on
+``status = 'sampled'`` plus the set id. Indexing only the sampled rows keeps
+the index small: logs leave it once they are marked evaluated.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "009"
+down_revision: Union[str, None] = "008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_production_logs_sampled_test_set",
+        "production_logs",
+        ["sampled_into_test_set_id"],
+        postgresql_where=sa.text("status = 'sampled'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_production_logs_sampled_test_set", table_name="production_logs")
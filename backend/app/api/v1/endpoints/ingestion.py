@@ -11,6 +11,7 @@ import uuid
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.schemas.ingestion import (
@@ -24,6 +25,7 @@ from app.api.v1.schemas.ingestion import (
 )
 from app.core.auth import require_api_key
 from app.db.session import get_db
+from app.services.ingestion_batcher import ingestion_batcher
 from app.services.ingestion_service import IngestionService
 from app.services.sampling_service import SamplingService
 
@@ -38,6 +40,14 @@ def get_sampling_service(db: AsyncSession = Depends(get_db)) -> SamplingService:
     return SamplingService(db)
 
 
+async def _ingest(items: list[ProductionLogIngest], service: IngestionService) -> IngestResponse:
+    # Coalesce with concurrent requests when the app-level batcher is running;
+    # otherwise (batching disabled, or outside the app lifespan) write inline.
+    if ingestion_batcher.running:
+        return await ingestion_batcher.submit(items)
+    return await service.ingest(items)
+
+
 @router.post("/", response_model=IngestResponse, status_code=202)
 async def ingest_single(
     payload: ProductionLogIngest,
@@ -52,7 +62,7 @@ async def ingest_single(
     - 100% of errors and negative feedback are sampled
     - ~20% of normal traffic is sampled (configurable via SAMPLING_RATE)
     """
-    return await service.ingest([payload])
+    return await _ingest([payload], service)
 
 
 @router.post("/bulk", response_model=IngestResponse, status_code=202)
@@ -66,7 +76,7 @@ async def ingest_bulk(
 
     Same sampling logic applies to each entry individually.
     """
-    return await service.ingest(payload.items)
+    return await _ingest(payload.items, service)
 
 
 @router.get("/logs", response_model=list[ProductionLogResponse])
@@ -79,7 +89,8 @@ async def list_production_logs(
     _api_key: str | None = Depends(require_api_key),
 ):
     """List ingested production logs with optional filters."""
-    return await service.list_logs(source=source, status=status, skip=skip, limit=limit)
+    logs = await service.list_logs(source=source, status=status, skip=skip, limit=limit)
+    return ORJSONResponse([log.model_dump() for log in logs])
 
 
 @router.get("/logs/{log_id}", response_model=ProductionLogResponse)
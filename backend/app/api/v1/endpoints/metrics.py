@@ -2,6 +2,7 @@ import uuid
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
@@ -26,7 +27,11 @@ async def get_metric_trends(
     metric: str = Query(..., description="e.g. faithfulness, answer_relevancy"),
     days: int = Query(30, ge=1, le=365),
 ):
-    return await service.get_trends(test_set_id=test_set_id, metric=metric, days=days)
+    # Already a JSON array from Postgres — pass the text through untouched.
+    return Response(
+        content=await service.get_trends(test_set_id=test_set_id, metric=metric, days=days),
+        media_type="application/json",
+    )
 
 
 @router.get("/thresholds/{test_set_id}")
@@ -53,3 +58,29 @@ async def check_release_gate(
 ):
     """Returns gate decision for a completed run."""
     return await gate_service.evaluate_gate(run_id)
+
+
+@router.post("/gate/{run_id}/async", status_code=202)
+async def enqueue_release_gate(run_id: uuid.UUID):
+    """Compute the gate decision and regression diff off-request.
+
+    Returns a task_id; poll ``GET /metrics/gate/tasks/{task_id}`` for the result.
+    """
+    from app.workers.tasks.gate_tasks import compute_release_gate
+
+    task = compute_release_gate.delay(str(run_id))
+    return {"task_id": task.id, "run_id": str(run_id), "status": "accepted"}
+
+
+@router.get("/gate/tasks/{task_id}")
+async def get_release_gate_task(task_id: str):
+    """Poll an enqueued gate computation."""
+    from app.workers.celery_app import celery_app
+
+    result = celery_app.AsyncResult(task_id)
+    body: dict = {"task_id": task_id, "status": result.state}
+    if result.successful():
+        body["result"] = result.result
+    elif result.failed():
+        body["error"] = str(result.result)
+    return body
@@ -2,6 +2,7 @@ import uuid
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.schemas.test_case import (
@@ -46,7 +47,8 @@ async def list_test_cases(
     limit: int = Query(50, ge=1, le=500),
     tag: str | None = Query(None),
 ):
-    return await service.list(test_set_id, skip=skip, limit=limit, tag=tag)
+    cases = await service.list(test_set_id, skip=skip, limit=limit, tag=tag)
+    return ORJSONResponse([c.model_dump() for c in cases])
 
 
 @router.get("/{test_set_id}/cases/{case_id}", response_model=TestCaseResponse)
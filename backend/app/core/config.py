@@ -58,6 +58,24 @@ class Settings(BaseSettings):
     SAMPLING_RATE: float = 0.2  # Default: sample 20% of normal traffic
     SAMPLING_ERROR_RATE: float = 1.0  # Default: sample 100% of errors/low-confidence
 
+    # Ingestion micro-batching: concurrent ingest calls are queued and written
+    # together, up to MAX_ITEMS per transaction or whatever arrived within
+    # MAX_WAIT_MS of the first item. Callers get 503 once QUEUE_MAX_ITEMS
+    # items are waiting.
+    INGEST_BATCHING_ENABLED: bool = True
+    INGEST_BATCH_MAX_ITEMS: int = 1000
+    INGEST_BATCH_MAX_WAIT_MS: int = 50
+    INGEST_QUEUE_MAX_ITEMS: int = 10_000
+
+    # Evaluation worker: pipeline calls and per-case scoring for a run's test
+    # cases run on this many threads at once. Pipeline calls only fan out for
+    # adapters declaring ``thread_safe``; others are called serially in case
+    # order. Set to 1 for evaluators that aren't thread-safe.
+    EVAL_PIPELINE_CONCURRENCY: int = 8
+    # When True, a run whose pipeline adapter fails to set up is marked
+    # failed immediately instead of scoring stored fallback text.
+    EVAL_REQUIRE_PIPELINE: bool = False
+
     # Alerting
     ALERT_WEBHOOK_URL: str = ""  # Slack/Teams/generic webhook for threshold alerts
     ALERT_EMAIL: str = ""  # Email address for alerts (future)
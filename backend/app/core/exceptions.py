@@ -24,3 +24,8 @@ class ValidationError(HTTPException):
 class GateBlockedError(HTTPException):
     def __init__(self, detail: str):
         super().__init__(status_code=status.HTTP_200_OK, detail=detail)
+
+
+class ServiceUnavailableError(HTTPException):
+    def __init__(self, detail: str):
+        super().__init__(status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail)
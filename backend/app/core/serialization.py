@@ -0,0 +1,37 @@
+"""
+orjson-backed JSON encoding shared by the Celery message/result serializer
+and the SQLAlchemy engines' JSON/JSONB columns.
+
+orjson rejects a few types the stdlib ``json`` module accepted (numpy
+scalars such as ``np.float64`` that evaluators return, ``Decimal``), so
+``_default`` converts those rather than failing mid-run.
+"""
+
+from decimal import Decimal
+from typing import Any
+
+import orjson
+
+_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if hasattr(obj, "item"):  # numpy scalar
+        return obj.item()
+    if isinstance(obj, float):  # float subclasses orjson won't take as-is
+        return float(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def dumps(obj: Any) -> bytes:
+    return orjson.dumps(obj, default=_default, option=_OPTIONS)
+
+
+def dumps_str(obj: Any) -> str:
+    """``dumps`` for drivers that expect text (SQLAlchemy json_serializer)."""
+    return dumps(obj).decode()
+
+
+loads = orjson.loads
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Integer, Text, func
+from sqlalchemy import Boolean, DateTime, Float, ForeignKey, Index, Integer, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -62,6 +62,15 @@ class EvaluationResult(Base):
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
+    __table_args__ = (
+        # Release gate's zero-tolerance lookup of rule failures in a run.
+        Index(
+            "ix_evaluation_results_run_rule_failures",
+            "run_id",
+            postgresql_where=text("rules_passed = false"),
+        ),
+    )
+
     # Relationships
     run: Mapped["EvaluationRun"] = relationship(  # noqa: F821
         "EvaluationRun", back_populates="evaluation_results"
@@ -2,7 +2,7 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Enum, Float, ForeignKey, Integer, String, Text, func
+from sqlalchemy import Boolean, DateTime, Enum, Float, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -71,6 +71,23 @@ class EvaluationRun(Base):
     # Budget outcome — cost + latency ceilings and whether they were exceeded.
     budget_summary: Mapped[dict | None] = mapped_column(JSONB, nullable=True)
 
+    __table_args__ = (
+        # Last passing baseline per test set: a one-row index probe.
+        Index(
+            "ix_evaluation_runs_baseline",
+            "test_set_id",
+            completed_at.desc(),
+            postgresql_where=text("overall_passed AND status = 'completed'"),
+        ),
+        # Last run status per test set, index-only.
+        Index(
+            "ix_evaluation_runs_test_set_started",
+            "test_set_id",
+            started_at.desc(),
+            postgresql_include=["status"],
+        ),
+    )
+
     # Relationships
     test_set: Mapped["TestSet"] = relationship(  # noqa: F821
         "TestSet", back_populates="evaluation_runs"
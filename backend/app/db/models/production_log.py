@@ -8,7 +8,7 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Boolean, DateTime, Enum, Float, ForeignKey, Integer, String, Text, func
+from sqlalchemy import Boolean, DateTime, Enum, Float, ForeignKey, Index, Integer, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -88,5 +88,23 @@ class ProductionLog(Base):
         DateTime(timezone=True), nullable=True
     )
 
+    __table_args__ = (
+        # Feedback stats: count thumbs up/down per source in one index scan.
+        Index("ix_production_logs_source_feedback", "source", "user_feedback"),
+        # list_logs: filter by source/status, newest first, no sort step.
+        Index(
+            "ix_production_logs_source_status_ingested",
+            "source",
+            "status",
+            ingested_at.desc(),
+        ),
+        # evaluate_sampled_traffic: sampled-but-unevaluated logs by test set.
+        Index(
+            "ix_production_logs_sampled_test_set",
+            "sampled_into_test_set_id",
+            postgresql_where=text("status = 'sampled'"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<ProductionLog id={self.id} source={self.source} status={self.status}>"
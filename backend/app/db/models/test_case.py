@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import DateTime, ForeignKey, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, Text, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -42,6 +42,11 @@ class TestCase(Base):
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
+    __table_args__ = (
+        # Ordered test-case listing per test set.
+        Index("ix_test_cases_test_set_created", "test_set_id", "created_at"),
+    )
+
     # Relationships
     test_set: Mapped["TestSet"] = relationship("TestSet", back_populates="test_cases")  # noqa: F821
     evaluation_results: Mapped[list["EvaluationResult"]] = relationship(  # noqa: F821
@@ -2,11 +2,14 @@ from collections.abc import AsyncGenerator
 
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from app.core import serialization
 from app.core.config import settings
 
 engine = create_async_engine(
     settings.DATABASE_URL,
     echo=settings.DEBUG,
+    json_serializer=serialization.dumps_str,
+    json_deserializer=serialization.loads,
     pool_pre_ping=True,
     pool_size=10,
     max_overflow=20,
@@ -5,11 +5,15 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1.router import api_router
 from app.core.config import settings
+from app.services.ingestion_batcher import ingestion_batcher
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    if settings.INGEST_BATCHING_ENABLED:
+        ingestion_batcher.start()
     yield
+    await ingestion_batcher.stop()
 
 
 app = FastAPI(
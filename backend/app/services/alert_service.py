@@ -6,15 +6,94 @@ Supports:
   - Rich Slack Block Kit formatting for breach and completion alerts
   - Extensible for email, PagerDuty, etc.
 """
+import functools
 import logging
+import random
+import uuid
 from typing import Any
 
 import httpx
+import orjson
+from sqlalchemy import Integer, func, or_, select
+from sqlalchemy.orm import Session
 
 from app.core.config import settings
+from app.db.models.evaluation_result import EvaluationResult
+from app.db.models.evaluation_run import EvaluationRun
+from app.db.models.test_set import TestSet
 
 logger = logging.getLogger(__name__)
 
+# One Slack mrkdwn line per breached metric; filled straight from the breach
+# dicts built by ``check_and_alert``.
+_BREACH_LINE_TMPL = (
+    ":warning: *{metric}*: {actual:.2%} "
+    "(threshold {threshold:.2%}, deficit -{deficit:.2%})"
+)
+
+# summary key -> (threshold key, display label) for the metrics we alert on.
+_BREACH_METRICS: dict[str, tuple[str, str]] = {
+    "avg_faithfulness": ("faithfulness", "Faithfulness"),
+    "avg_answer_relevancy": ("answer_relevancy", "Answer Relevancy"),
+    "avg_context_precision": ("context_precision", "Context Precision"),
+    "avg_context_recall": ("context_recall", "Context Recall"),
+    "pass_rate": ("pass_rate", "Pass Rate"),
+}
+
+# Per-run aggregates matching the summary keys above, computed server-side
+# by ``check_and_alert_bulk``.
+_BREACH_AGGREGATES = {
+    "avg_faithfulness": func.avg(EvaluationResult.faithfulness),
+    "avg_answer_relevancy": func.avg(EvaluationResult.answer_relevancy),
+    "avg_context_precision": func.avg(EvaluationResult.context_precision),
+    "avg_context_recall": func.avg(EvaluationResult.context_recall),
+    "pass_rate": func.avg(EvaluationResult.passed.cast(Integer)),
+}
+
+# Webhook delivery: Slack answers bursts with 429 + Retry-After, so retry
+# 429/5xx a few times instead of dropping the alert. Retries are scheduled by
+# the send_alert_webhook task (countdown), never slept inside a caller.
+_WEBHOOK_MAX_ATTEMPTS = 3
+_WEBHOOK_MAX_DELAY_S = 30.0
+
+# Shared client (created lazily, per worker process) so retries and later
+# alerts reuse the warm connection instead of a fresh TLS handshake.
+# ``retries`` on the transport covers connect failures only.
+_webhook_client: httpx.Client | None = None
+
+
+def _get_webhook_client() -> httpx.Client:
+    global _webhook_client
+    if _webhook_client is None:
+        _webhook_client = httpx.Client(
+            timeout=10, transport=httpx.HTTPTransport(retries=3)
+        )
+    return _webhook_client
+
+
+def _retry_delay(resp: httpx.Response | None, attempt: int) -> float:
+    """Seconds to wait before the next attempt: Retry-After when the server
+    sent one, otherwise jittered exponential backoff."""
+    try:
+        delay = float(resp.headers["Retry-After"]) if resp is not None else None
+    except (KeyError, ValueError):
+        delay = None
+    if delay is None:
+        delay = 2 ** attempt + random.uniform(0, 0.5)
+    return min(delay, _WEBHOOK_MAX_DELAY_S)
+
+
+@functools.lru_cache(maxsize=256)
+def _completion_label(summary_key: str) -> str | None:
+    """Display label for an ``avg_*`` summary key; ``None`` for non-metric keys.
+
+    Summary keys repeat across runs of a system type, so the prefix check and
+    title-casing happen once per key rather than once per alert.
+    """
+    if not summary_key.startswith("avg_"):
+        return None
+    return summary_key[4:].replace("_", " ").title()
+
 
 class AlertService:
     """Sends threshold breach alerts and run completion notifications."""
@@ -31,26 +110,7 @@ class AlertService:
         Compare summary metrics against thresholds and send alerts for breaches.
         Returns list of breach details.
         """
-        breaches = []
-        metric_labels = {
-            "avg_faithfulness": ("faithfulness", "Faithfulness"),
-            "avg_answer_relevancy": ("answer_relevancy", "Answer Relevancy"),
-            "avg_context_precision": ("context_precision", "Context Precision"),
-            "avg_context_recall": ("context_recall", "Context Recall"),
-            "pass_rate": ("pass_rate", "Pass Rate"),
-        }
-
-        for summary_key, (threshold_key, label) in metric_labels.items():
-            actual = summary_metrics.get(summary_key)
-            threshold = thresholds.get(threshold_key)
-            if actual is not None and threshold is not None and actual < threshold:
-                breaches.append({
-                    "metric": label,
-                    "actual": round(actual, 4),
-                    "threshold": threshold,
-                    "deficit": round(threshold - actual, 4),
-                })
-
+        breaches = AlertService._find_breaches(summary_metrics, thresholds)
         if breaches:
             AlertService._send_breach_alert(
                 run_id=run_id,
@@ -61,6 +121,62 @@ class AlertService:
 
         return breaches
 
+    @staticmethod
+    def check_and_alert_bulk(
+        db: Session,
+        run_ids: list[uuid.UUID],
+        thresholds: dict[str, float],
+    ) -> dict[str, list[dict]]:
+        """
+        Re-check many runs against one threshold policy in a single query.
+
+        Averages are aggregated per run in SQL and the ``metric < threshold``
+        comparison runs in the HAVING clause, so only breaching runs come
+        back over the wire. Intended for backfills after a threshold-policy
+        change. Returns ``{run_id: breaches}`` for runs with at least one
+        breach and sends the usual breach alert for each.
+        """
+        conditions = [
+            _BREACH_AGGREGATES[summary_key] < thresholds[threshold_key]
+            for summary_key, (threshold_key, _) in _BREACH_METRICS.items()
+            if thresholds.get(threshold_key) is not None
+        ]
+        if not run_ids or not conditions:
+            return {}
+
+        result = db.execute(
+            select(
+                EvaluationResult.run_id,
+                EvaluationRun.pipeline_version,
+                TestSet.name.label("test_set_name"),
+                *(agg.label(key) for key, agg in _BREACH_AGGREGATES.items()),
+            )
+            .join(EvaluationRun, EvaluationRun.id == EvaluationResult.run_id)
+            .join(TestSet, TestSet.id == EvaluationRun.test_set_id)
+            .where(EvaluationResult.run_id.in_(run_ids))
+            .group_by(EvaluationResult.run_id, EvaluationRun.pipeline_version, TestSet.name)
+            .having(or_(*conditions))
+        )
+
+        breaches_by_run: dict[str, list[dict]] = {}
+        for row in result:
+            summary = {
+                key: float(row._mapping[key]) if row._mapping[key] is not None else None
+                for key in _BREACH_AGGREGATES
+            }
+            breaches = AlertService._find_breaches(summary, thresholds)
+            if not breaches:
+                continue
+            run_id = str(row.run_id)
+            breaches_by_run[run_id] = breaches
+            AlertService._send_breach_alert(
+                run_id=run_id,
+                test_set_name=row.test_set_name,
+                pipeline_version=row.pipeline_version,
+                breaches=breaches,
+            )
+        return breaches_by_run
+
     @staticmethod
     def send_completion_alert(
         run_id: str,
@@ -82,11 +198,11 @@ class AlertService:
         status_text = "Passed" if gate_passed else "Gate Blocked"
 
         # Build metric fields for the summary
-        metric_fields = []
-        for key, value in summary_metrics.items():
-            if key.startswith("avg_") and value is not None:
-                label = key[4:].replace("_", " ").title()
-                metric_fields.append({"type": "mrkdwn", "text": f"*{label}*\n{value:.2%}"})
+        metric_fields = [
+            {"type": "mrkdwn", "text": f"*{label}*\n{value:.2%}"}
+            for key, value in summary_metrics.items()
+            if value is not None and (label := _completion_label(key))
+        ]
 
         blocks = [
             {
@@ -121,6 +237,25 @@ class AlertService:
     # Internal helpers
     # ------------------------------------------------------------------
 
+    @staticmethod
+    def _find_breaches(
+        summary_metrics: dict[str, Any], thresholds: dict[str, float]
+    ) -> list[dict]:
+        """Breach details for every alerted metric that sits below its threshold."""
+        breaches = []
+        for summary_key, (threshold_key, label) in _BREACH_METRICS.items():
+            actual = summary_metrics.get(summary_key)
+            threshold = thresholds.get(threshold_key)
+            if actual is not None and threshold is not None and actual < threshold:
+                # Raw floats — the Slack lines format them to two decimals.
+                breaches.append({
+                    "metric": label,
+                    "actual": actual,
+                    "threshold": threshold,
+                    "deficit": threshold - actual,
+                })
+        return breaches
+
     @staticmethod
     def _send_breach_alert(
         run_id: str,
@@ -132,12 +267,7 @@ class AlertService:
         if not settings.ALERT_WEBHOOK_URL:
             return
 
-        breach_lines = []
-        for b in breaches:
-            breach_lines.append(
-                f":warning: *{b['metric']}*: {b['actual']:.2%} "
-                f"(threshold {b['threshold']:.2%}, deficit -{b['deficit']:.2%})"
-            )
+        breach_lines = [_BREACH_LINE_TMPL.format_map(b) for b in breaches]
 
         blocks = [
             {
@@ -169,15 +299,47 @@ class AlertService:
 
     @staticmethod
     def _post_webhook(payload: dict) -> None:
-        """POST a JSON payload to the configured webhook URL."""
+        """Queue ``payload`` for delivery to the configured webhook URL.
+
+        Delivery and its retries run in the ``send_alert_webhook`` task, so
+        a slow or failing webhook never holds up the caller. Never raises.
+        """
         try:
-            with httpx.Client(timeout=10) as client:
-                resp = client.post(
-                    settings.ALERT_WEBHOOK_URL,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                )
-                if resp.status_code >= 400:
-                    logger.warning(f"Alert webhook returned {resp.status_code}: {resp.text}")
+            from app.workers.celery_app import celery_app
+
+            celery_app.send_task(
+                "app.workers.tasks.alert_tasks.send_alert_webhook", args=[payload]
+            )
         except Exception as exc:
-            logger.error(f"Failed to send alert webhook: {exc}")
+            logger.error("Failed to queue alert webhook", exc_info=exc)
+
+
+def deliver_webhook(payload: dict, attempt: int) -> float | None:
+    """Make delivery attempt ``attempt`` (0-based) of ``payload``.
+
+    Returns the delay in seconds before the next attempt when a 429/5xx or
+    transport error is worth retrying, honouring ``Retry-After``; otherwise
+    ``None`` (delivered, or given up and logged once).
+    """
+    if not settings.ALERT_WEBHOOK_URL:
+        return None
+    resp = None
+    try:
+        # Pre-serialise with orjson; httpx's ``json=`` goes through stdlib json.
+        resp = _get_webhook_client().post(
+            settings.ALERT_WEBHOOK_URL,
+            content=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+        )
+    except httpx.HTTPError as exc:
+        error = str(exc)
+    else:
+        if resp.status_code < 400:
+            return None
+        error = f"{resp.status_code}: {resp.text}"
+        if resp.status_code != 429 and resp.status_code < 500:
+            attempt = _WEBHOOK_MAX_ATTEMPTS  # other 4xx won't succeed on retry
+    if attempt < _WEBHOOK_MAX_ATTEMPTS - 1:
+        return _retry_delay(resp, attempt)
+    logger.error(f"Failed to send alert webhook: {error}")
+    return None
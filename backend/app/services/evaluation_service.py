@@ -1,11 +1,15 @@
 import uuid
-from datetime import datetime, timezone
 
-from sqlalchemy import Integer, and_, func, select
+from sqlalchemy import Integer, and_, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.schemas.evaluation_result import EvaluationResultResponse, ResultSummary
-from app.api.v1.schemas.evaluation_run import EvaluationRunCreate, EvaluationRunResponse, RunStatusResponse
+from app.api.v1.schemas.evaluation_run import (
+    EvaluationRunCreate,
+    EvaluationRunResponse,
+    RunStatusResponse,
+    ThresholdConfig,
+)
 from app.core.config import settings
 from app.core.exceptions import NotFoundError
 from app.db.models.evaluation_result import EvaluationResult
@@ -66,6 +70,38 @@ DEFAULT_TYPE_THRESHOLDS: dict[str, dict[str, float]] = {
     "translation":    {"sacrebleu": 0.3, "chrf_plus_plus": 0.4},
 }
 
+# RAG / fallback threshold snapshot when the caller sends no thresholds —
+# the common CI path. Built once from settings at import; create_run hands
+# each run its own copy because the JSONB column is mutable.
+_DEFAULT_THRESHOLD_SNAPSHOT: dict[str, float] = {
+    "faithfulness": settings.DEFAULT_FAITHFULNESS_THRESHOLD,
+    "answer_relevancy": settings.DEFAULT_ANSWER_RELEVANCY_THRESHOLD,
+    "context_precision": settings.DEFAULT_CONTEXT_PRECISION_THRESHOLD,
+    "context_recall": settings.DEFAULT_CONTEXT_RECALL_THRESHOLD,
+    "pass_rate": settings.DEFAULT_PASS_RATE_THRESHOLD,
+}
+
+
+def _threshold_snapshot(system_type: str, thresholds: ThresholdConfig | None) -> dict[str, float]:
+    """Immutable gate threshold snapshot for a run of ``system_type``.
+
+    Without per-type thresholds the gate would silently degrade to a
+    pass_rate-only check for every non-RAG system.
+    """
+    if system_type == "rag" or system_type not in DEFAULT_TYPE_THRESHOLDS:
+        return {
+            "faithfulness": thresholds.faithfulness,
+            "answer_relevancy": thresholds.answer_relevancy,
+            "context_precision": thresholds.context_precision,
+            "context_recall": thresholds.context_recall,
+            "pass_rate": thresholds.pass_rate,
+        } if thresholds else dict(_DEFAULT_THRESHOLD_SNAPSHOT)
+    snapshot = dict(DEFAULT_TYPE_THRESHOLDS[system_type])
+    snapshot["pass_rate"] = (
+        thresholds.pass_rate if thresholds else _DEFAULT_THRESHOLD_SNAPSHOT["pass_rate"]
+    )
+    return snapshot
+
 
 class EvaluationService:
     def __init__(self, db: AsyncSession):
@@ -73,15 +109,14 @@ class EvaluationService:
 
     async def create_run(self, payload: EvaluationRunCreate) -> EvaluationRunResponse:
         # Verify test set exists and get system_type
-        ts_result = await self.db.execute(
-            select(TestSet).where(TestSet.id == payload.test_set_id)
-        )
-        test_set = ts_result.scalar_one_or_none()
-        if test_set is None:
+        system_type = (
+            await self.db.execute(
+                select(TestSet.system_type).where(TestSet.id == payload.test_set_id)
+            )
+        ).scalar_one_or_none()
+        if system_type is None:
             raise NotFoundError("TestSet", str(payload.test_set_id))
 
-        system_type = test_set.system_type or "rag"
-
         # Auto-select the correct adapter if no pipeline_config was provided
         pipeline_config = payload.pipeline_config
         if not pipeline_config:
@@ -95,24 +130,6 @@ class EvaluationService:
         if metrics == _RAG_METRICS:
             metrics = DEFAULT_METRICS.get(system_type, _RAG_METRICS)
 
-        # Build the immutable threshold snapshot for this run's system type.
-        # Without per-type thresholds the gate would silently degrade to a
-        # pass_rate-only check for every non-RAG system.
-        thresholds = payload.thresholds
-        if system_type == "rag" or system_type not in DEFAULT_TYPE_THRESHOLDS:
-            threshold_snapshot = {
-                "faithfulness": thresholds.faithfulness if thresholds else settings.DEFAULT_FAITHFULNESS_THRESHOLD,
-                "answer_relevancy": thresholds.answer_relevancy if thresholds else settings.DEFAULT_ANSWER_RELEVANCY_THRESHOLD,
-                "context_precision": thresholds.context_precision if thresholds else settings.DEFAULT_CONTEXT_PRECISION_THRESHOLD,
-                "context_recall": thresholds.context_recall if thresholds else settings.DEFAULT_CONTEXT_RECALL_THRESHOLD,
-                "pass_rate": thresholds.pass_rate if thresholds else settings.DEFAULT_PASS_RATE_THRESHOLD,
-            }
-        else:
-            threshold_snapshot = dict(DEFAULT_TYPE_THRESHOLDS[system_type])
-            threshold_snapshot["pass_rate"] = (
-                thresholds.pass_rate if thresholds else settings.DEFAULT_PASS_RATE_THRESHOLD
-            )
-
         run = EvaluationRun(
             test_set_id=payload.test_set_id,
             pipeline_version=payload.pipeline_version,
@@ -121,7 +138,7 @@ class EvaluationService:
             git_pr_number=payload.git_pr_number,
             triggered_by=payload.triggered_by,
             status=RunStatus.PENDING,
-            gate_threshold_snapshot=threshold_snapshot,
+            gate_threshold_snapshot=_threshold_snapshot(system_type, payload.thresholds),
             notes=payload.notes,
             pipeline_config=pipeline_config,
         )
@@ -178,11 +195,21 @@ class EvaluationService:
         )
 
     async def cancel_run(self, run_id: uuid.UUID) -> None:
-        run = await self._get_run_or_404(run_id)
-        if run.status in (RunStatus.PENDING, RunStatus.RUNNING):
-            run.status = RunStatus.FAILED
-            run.completed_at = datetime.now(timezone.utc)
-            await self.db.flush()
+        # Single conditional UPDATE: the status check and the transition are
+        # atomic, so a cancel can't race a worker marking the run completed.
+        result = await self.db.execute(
+            update(EvaluationRun)
+            .where(
+                EvaluationRun.id == run_id,
+                EvaluationRun.status.in_([RunStatus.PENDING, RunStatus.RUNNING]),
+            )
+            .values(status=RunStatus.FAILED, completed_at=func.now())
+            .returning(EvaluationRun.id)
+        )
+        if result.scalar_one_or_none() is None:
+            # Nothing updated: either the run doesn't exist (404) or it is
+            # already terminal, which stays a no-op.
+            await self._get_run_or_404(run_id)
 
     async def list_results(
         self,
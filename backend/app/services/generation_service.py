@@ -7,6 +7,7 @@ import json
 import logging
 
 import httpx
+import orjson
 
 from app.core.config import settings
 
@@ -79,7 +80,7 @@ class GenerationService:
                         "Authorization": f"Bearer {settings.OPENAI_API_KEY}",
                         "Content-Type": "application/json",
                     },
-                    json={
+                    content=orjson.dumps({
                         "model": settings.OPENAI_MODEL,
                         "messages": [
                             {"role": "system", "content": "You are a test case generator. Output only valid JSON arrays."},
@@ -87,7 +88,7 @@ class GenerationService:
                         ],
                         "temperature": 0.8,
                         "max_tokens": 4000,
-                    },
+                    }),
                 )
                 resp.raise_for_status()
                 data = resp.json()
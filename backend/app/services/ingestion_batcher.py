@@ -0,0 +1,177 @@
+"""
+Micro-batching front end for production traffic ingestion.
+
+Concurrent ingest calls put their items on a bounded in-process queue. One
+background consumer drains up to ``INGEST_BATCH_MAX_ITEMS`` items — or
+whatever arrived within ``INGEST_BATCH_MAX_WAIT_MS`` of the first — and writes
+them through ``IngestionService`` in a single transaction, so many small POSTs
+coalesce into the large batches where the multi-row INSERT / COPY paths pay
+off. Each caller awaits an ack that resolves once its items are committed.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+
+import asyncpg
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.api.v1.schemas.ingestion import IngestResponse, ProductionLogIngest
+from app.core.config import settings
+from app.core.exceptions import ServiceUnavailableError
+from app.db.models.production_log import IngestionStatus
+from app.db.session import AsyncSessionLocal
+from app.services.ingestion_service import IngestionService
+
+logger = logging.getLogger(__name__)
+
+# Failures of one write that are worth retrying per submission. The COPY path
+# talks to asyncpg directly, so its errors arrive unwrapped.
+_WRITE_ERRORS = (SQLAlchemyError, asyncpg.PostgresError)
+
+
+@dataclass
+class _Submission:
+    items: list[ProductionLogIngest]
+    ack: asyncio.Future
+
+
+class IngestionBatcher:
+    def __init__(
+        self,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+        max_items: int = settings.INGEST_BATCH_MAX_ITEMS,
+        max_wait_ms: int = settings.INGEST_BATCH_MAX_WAIT_MS,
+        max_queued_items: int = settings.INGEST_QUEUE_MAX_ITEMS,
+    ):
+        self._session_factory = session_factory
+        self._max_items = max_items
+        self._max_wait_s = max_wait_ms / 1000
+        self._max_queued_items = max_queued_items
+        self._queue: asyncio.Queue[_Submission | None] = asyncio.Queue()
+        self._queued_items = 0
+        self._task: asyncio.Task | None = None
+        self._closed = False
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        if not self.running:
+            self._closed = False
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Flush everything already queued, then stop the consumer."""
+        if not self.running:
+            return
+        # No submission can land behind the sentinel: submit() checks the
+        # flag and enqueues without yielding in between.
+        self._closed = True
+        self._queue.put_nowait(None)
+        await self._task
+        self._task = None
+
+    async def submit(self, items: list[ProductionLogIngest]) -> IngestResponse:
+        """Queue ``items`` and wait until the batch containing them commits."""
+        if self._closed:
+            raise ServiceUnavailableError("Ingestion is shutting down; retry shortly")
+        if self._queued_items + len(items) > self._max_queued_items:
+            raise ServiceUnavailableError("Ingestion queue is full; retry shortly")
+        ack = asyncio.get_running_loop().create_future()
+        self._queued_items += len(items)
+        self._queue.put_nowait(_Submission(items, ack))
+        # Shielded: a client disconnect must not cancel an ack the consumer
+        # still resolves for the rest of the batch.
+        return await asyncio.shield(ack)
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        stopping = False
+        batch: list[_Submission] = []
+        try:
+            while not stopping:
+                first = await self._queue.get()
+                if first is None:
+                    return
+                batch = [first]
+                count = len(first.items)
+                deadline = loop.time() + self._max_wait_s
+                while count < self._max_items:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        sub = await asyncio.wait_for(self._queue.get(), remaining)
+                    except TimeoutError:
+                        break
+                    if sub is None:
+                        stopping = True
+                        break
+                    batch.append(sub)
+                    count += len(sub.items)
+                self._queued_items -= count
+                await self._flush(batch)
+        finally:
+            # However the consumer ends (stop, cancellation, an unexpected
+            # write error), nobody may be left awaiting an ack.
+            self._closed = True
+            self._reject_pending(batch)
+
+    def _reject_pending(self, batch: list[_Submission]) -> None:
+        pending = list(batch)
+        while not self._queue.empty():
+            sub = self._queue.get_nowait()
+            if sub is not None:
+                pending.append(sub)
+                self._queued_items -= len(sub.items)
+        for sub in pending:
+            if not sub.ack.done():
+                sub.ack.set_exception(
+                    ServiceUnavailableError("Ingestion stopped; retry shortly")
+                )
+
+    async def _flush(self, batch: list[_Submission]) -> None:
+        items = [item for sub in batch for item in sub.items]
+        try:
+            sampled = await self._write(items)
+        except _WRITE_ERRORS as exc:
+            if len(batch) > 1:
+                # One bad submission must not fail its neighbours: retry alone.
+                logger.warning(
+                    "Ingest batch of %d failed (%s); retrying per submission",
+                    len(items),
+                    exc,
+                )
+                for sub in batch:
+                    await self._flush([sub])
+                return
+            if not batch[0].ack.done():
+                batch[0].ack.set_exception(exc)
+            return
+
+        offset = 0
+        for sub in batch:
+            flags = sampled[offset : offset + len(sub.items)]
+            offset += len(sub.items)
+            if not sub.ack.done():
+                n_sampled = sum(flags)
+                sub.ack.set_result(
+                    IngestResponse(
+                        ingested=len(flags),
+                        sampled=n_sampled,
+                        skipped=len(flags) - n_sampled,
+                    )
+                )
+
+    async def _write(self, items: list[ProductionLogIngest]) -> list[bool]:
+        """Persist ``items`` in one transaction; returns per-item sampled flags."""
+        async with self._session_factory() as db:
+            logs = await IngestionService(db).write_logs(items)
+            await db.commit()
+        return [log.status == IngestionStatus.SAMPLED for log in logs]
+
+
+ingestion_batcher = IngestionBatcher()
@@ -6,7 +6,8 @@ to the SamplingService, and returns ingestion statistics.
 """
 import uuid
 
-from sqlalchemy import func, select
+import orjson
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.schemas.ingestion import (
@@ -19,6 +20,57 @@ from app.core.exceptions import NotFoundError
 from app.db.models.production_log import IngestionStatus, ProductionLog
 from app.services.sampling_service import SamplingService
 
+# Batches at least this large are written with COPY instead of INSERT —
+# one protocol round trip and no per-row statement overhead.
+_COPY_THRESHOLD = 100
+
+# (column, ORM attribute) pairs written by COPY. ``ingested_at`` is left to
+# its server default.
+_COPY_COLUMNS: tuple[tuple[str, str], ...] = (
+    ("id", "id"),
+    ("source", "source"),
+    ("pipeline_version", "pipeline_version"),
+    ("query", "query"),
+    ("answer", "answer"),
+    ("contexts", "contexts"),
+    ("tool_calls", "tool_calls"),
+    ("latency_ms", "latency_ms"),
+    ("user_feedback", "user_feedback"),
+    ("confidence_score", "confidence_score"),
+    ("is_error", "is_error"),
+    ("error_message", "error_message"),
+    ("tags", "tags"),
+    ("metadata", "extra_metadata"),
+    ("status", "status"),
+    ("sampled_into_test_set_id", "sampled_into_test_set_id"),
+    ("sampled_into_test_case_id", "sampled_into_test_case_id"),
+    ("evaluation_run_id", "evaluation_run_id"),
+    ("produced_at", "produced_at"),
+    ("sampled_at", "sampled_at"),
+)
+_JSONB_COLUMNS = frozenset({"contexts", "tool_calls", "tags", "metadata"})
+
+# Only the columns ProductionLogResponse exposes — list pages skip the JSONB
+# payload columns (contexts, tool_calls, metadata) entirely.
+_LOG_LIST_COLUMNS = tuple(
+    getattr(ProductionLog, field) for field in ProductionLogResponse.model_fields
+)
+
+# Built once at import; per-request calls only bind the id.
+_LOG_BY_ID = select(ProductionLog).where(ProductionLog.id == bindparam("log_id"))
+
+
+def _copy_value(column: str, value):
+    """Adapt an ORM attribute value to what asyncpg's COPY encoder expects."""
+    if value is None:
+        return None
+    if column in _JSONB_COLUMNS:
+        # SQLAlchemy's asyncpg JSONB codec takes pre-serialised text.
+        return orjson.dumps(value).decode()
+    if column == "status":
+        return value.value
+    return value
+
 
 class IngestionService:
     def __init__(self, db: AsyncSession):
@@ -27,11 +79,19 @@ class IngestionService:
 
     async def ingest(self, items: list[ProductionLogIngest]) -> IngestResponse:
         """Ingest one or more production Q&A pairs and apply sampling."""
-        sampled_count = 0
-        skipped_count = 0
+        logs = await self.write_logs(items)
+        sampled_count = sum(log.status == IngestionStatus.SAMPLED for log in logs)
+        return IngestResponse(
+            ingested=len(logs),
+            sampled=sampled_count,
+            skipped=len(logs) - sampled_count,
+        )
 
-        for item in items:
-            log = ProductionLog(
+    async def write_logs(self, items: list[ProductionLogIngest]) -> list[ProductionLog]:
+        """Sample and persist ``items``; returns the logs in input order."""
+        # Client-side UUIDs so rows can be referenced without RETURNING.
+        logs = [
+            ProductionLog(
                 id=uuid.uuid4(),
                 source=item.source,
                 pipeline_version=item.pipeline_version,
@@ -49,19 +109,36 @@ class IngestionService:
                 produced_at=item.produced_at,
                 status=IngestionStatus.RECEIVED,
             )
-            self.db.add(log)
+            for item in items
+        ]
+        # Sample first: test cases are inserted in one batch ahead of the logs
+        # that reference them, and each log is written once with its final
+        # status — no follow-up UPDATE per sampled row.
+        await self.sampler.sample_and_create_test_cases(logs)
+        if len(logs) >= _COPY_THRESHOLD:
+            await self._bulk_copy_logs(logs)
+        else:
+            # One flush: SQLAlchemy batches the whole list into a single
+            # multi-row INSERT instead of one round trip per item.
+            self.db.add_all(logs)
             await self.db.flush()
-
-            was_sampled = await self.sampler.sample_and_create_test_case(log)
-            if was_sampled:
-                sampled_count += 1
-            else:
-                skipped_count += 1
-
-        return IngestResponse(
-            ingested=len(items),
-            sampled=sampled_count,
-            skipped=skipped_count,
+        return logs
+
+    async def _bulk_copy_logs(self, logs: list[ProductionLog]) -> None:
+        """Write ``logs`` with PostgreSQL COPY on the session's connection."""
+        conn = await self.db.connection()
+        # asyncpg's adaptor opens its transaction lazily on the first
+        # statement; make sure COPY runs inside the session's transaction.
+        await conn.exec_driver_sql("SELECT 1")
+        raw = await conn.get_raw_connection()
+        records = [
+            tuple(_copy_value(column, getattr(log, attr)) for column, attr in _COPY_COLUMNS)
+            for log in logs
+        ]
+        await raw.driver_connection.copy_records_to_table(
+            ProductionLog.__tablename__,
+            records=records,
+            columns=[column for column, _ in _COPY_COLUMNS],
         )
 
     async def list_logs(
@@ -71,56 +148,46 @@ class IngestionService:
         skip: int = 0,
         limit: int = 100,
     ) -> list[ProductionLogResponse]:
-        query = select(ProductionLog).order_by(ProductionLog.ingested_at.desc())
+        query = select(*_LOG_LIST_COLUMNS).order_by(ProductionLog.ingested_at.desc())
         if source:
             query = query.where(ProductionLog.source == source)
         if status:
             query = query.where(ProductionLog.status == status)
-        query = query.offset(skip).limit(limit)
-        result = await self.db.execute(query)
-        return [ProductionLogResponse.model_validate(r) for r in result.scalars().all()]
+        result = await self.db.execute(query.offset(skip).limit(limit))
+        # Rows come straight from typed columns; skip re-validating them.
+        return [ProductionLogResponse.model_construct(**row._mapping) for row in result]
 
     async def get_log(self, log_id: uuid.UUID) -> ProductionLogResponse:
-        result = await self.db.execute(
-            select(ProductionLog).where(ProductionLog.id == log_id)
-        )
-        log = result.scalar_one_or_none()
-        if log is None:
-            raise NotFoundError("ProductionLog", str(log_id))
+        log = await self._get_log_or_404(log_id)
         return ProductionLogResponse.model_validate(log)
 
     async def update_feedback(self, log_id: uuid.UUID, feedback: str) -> ProductionLogResponse:
         """Update user feedback on a production log entry."""
-        result = await self.db.execute(
-            select(ProductionLog).where(ProductionLog.id == log_id)
-        )
-        log = result.scalar_one_or_none()
-        if log is None:
-            raise NotFoundError("ProductionLog", str(log_id))
+        log = await self._get_log_or_404(log_id)
         log.user_feedback = feedback
         await self.db.flush()
         return ProductionLogResponse.model_validate(log)
 
+    async def _get_log_or_404(self, log_id: uuid.UUID) -> ProductionLog:
+        result = await self.db.execute(_LOG_BY_ID, {"log_id": log_id})
+        log = result.scalar_one_or_none()
+        if log is None:
+            raise NotFoundError("ProductionLog", str(log_id))
+        return log
+
     async def get_feedback_stats(self, source: str | None = None) -> FeedbackStats:
         """Get aggregated feedback statistics."""
-        base = select(ProductionLog)
-        if source:
-            base = base.where(ProductionLog.source == source)
-
-        total_q = select(func.count(ProductionLog.id)).select_from(base.subquery())
-        up_q = select(func.count(ProductionLog.id)).where(
-            ProductionLog.user_feedback == "thumbs_up"
-        )
-        down_q = select(func.count(ProductionLog.id)).where(
-            ProductionLog.user_feedback == "thumbs_down"
+        # One scan: conditional aggregates instead of three COUNT round trips.
+        query = select(
+            func.count().label("total"),
+            func.count().filter(ProductionLog.user_feedback == "thumbs_up").label("thumbs_up"),
+            func.count().filter(ProductionLog.user_feedback == "thumbs_down").label("thumbs_down"),
         )
         if source:
-            up_q = up_q.where(ProductionLog.source == source)
-            down_q = down_q.where(ProductionLog.source == source)
+            query = query.where(ProductionLog.source == source)
 
-        total = (await self.db.execute(total_q)).scalar() or 0
-        thumbs_up = (await self.db.execute(up_q)).scalar() or 0
-        thumbs_down = (await self.db.execute(down_q)).scalar() or 0
+        # COUNT never yields NULL, even over zero rows.
+        total, thumbs_up, thumbs_down = (await self.db.execute(query)).one()
         no_feedback = total - thumbs_up - thumbs_down
         positive_rate = thumbs_up / (thumbs_up + thumbs_down) if (thumbs_up + thumbs_down) > 0 else None
 
@@ -1,7 +1,8 @@
 import uuid
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select
+from sqlalchemy import Text, func, insert, literal_column, select
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.models.metrics_history import MetricsHistory
@@ -13,28 +14,34 @@ class MetricsService:
 
     async def get_trends(
         self, test_set_id: uuid.UUID, metric: str, days: int = 30
-    ) -> list[dict]:
+    ) -> str:
+        """Trend points as a ready-to-send JSON array, built by Postgres.
+
+        json_agg serialises every row server-side, so one text value comes
+        back instead of N driver rows re-encoded in Python.
+        """
         since = datetime.now(timezone.utc) - timedelta(days=days)
+        point = func.json_build_object(
+            "recorded_at", MetricsHistory.recorded_at,
+            "metric_value", MetricsHistory.metric_value,
+            "metric_name", MetricsHistory.metric_name,
+            "pipeline_version", MetricsHistory.pipeline_version,
+            "git_commit_sha", MetricsHistory.git_commit_sha,
+            "run_id", MetricsHistory.run_id,
+        )
         result = await self.db.execute(
-            select(MetricsHistory)
-            .where(
+            select(
+                func.coalesce(
+                    func.json_agg(aggregate_order_by(point, MetricsHistory.recorded_at.asc())),
+                    literal_column("'[]'::json"),
+                ).cast(Text)
+            ).where(
                 MetricsHistory.test_set_id == test_set_id,
                 MetricsHistory.metric_name == metric,
                 MetricsHistory.recorded_at >= since,
             )
-            .order_by(MetricsHistory.recorded_at.asc())
         )
-        return [
-            {
-                "recorded_at": r.recorded_at.isoformat(),
-                "metric_value": r.metric_value,
-                "metric_name": r.metric_name,
-                "pipeline_version": r.pipeline_version,
-                "git_commit_sha": r.git_commit_sha,
-                "run_id": str(r.run_id),
-            }
-            for r in result.scalars().all()
-        ]
+        return result.scalar_one()
 
     async def record_run_metrics(
         self,
@@ -51,18 +58,18 @@ class MetricsService:
             "context_recall": summary.get("avg_context_recall"),
             "pass_rate": summary.get("pass_rate"),
         }
-        entries = [
-            MetricsHistory(
-                test_set_id=test_set_id,
-                run_id=run_id,
-                metric_name=metric,
-                metric_value=value,
-                pipeline_version=pipeline_version,
-                git_commit_sha=git_commit_sha,
-            )
+        # Write-only rows: a Core executemany skips identity-map bookkeeping.
+        rows = [
+            {
+                "test_set_id": test_set_id,
+                "run_id": run_id,
+                "metric_name": metric,
+                "metric_value": value,
+                "pipeline_version": pipeline_version,
+                "git_commit_sha": git_commit_sha,
+            }
             for metric, value in metric_map.items()
             if value is not None
         ]
-        if entries:
-            self.db.add_all(entries)
-            await self.db.flush()
+        if rows:
+            await self.db.execute(insert(MetricsHistory.__table__), rows)
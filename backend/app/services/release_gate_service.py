@@ -1,16 +1,22 @@
+import asyncio
 import uuid
+from collections.abc import Awaitable, Callable
 from dataclasses import dataclass, field
+from typing import TypeVar
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import false, select, true
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.api.v1.schemas.evaluation_result import RegressionDiff, RegressionItem
 from app.core.exceptions import NotFoundError
 from app.db.models.evaluation_result import EvaluationResult
 from app.db.models.evaluation_run import EvaluationRun, RunStatus
 from app.db.models.test_case import TestCase
+from app.db.session import AsyncSessionLocal
 from app.services._gate_stats import significance_gate
 
+_T = TypeVar("_T")
+
 
 # Per-case column on EvaluationResult that corresponds to each summary key.
 # Drives the significance gate: we pull the raw per-case values here and feed
@@ -50,8 +56,19 @@ class GateDecision:
 
 
 class ReleaseGateService:
-    def __init__(self, db: AsyncSession):
+    def __init__(
+        self,
+        db: AsyncSession,
+        session_factory: async_sessionmaker[AsyncSession] = AsyncSessionLocal,
+    ):
         self.db = db
+        # Used to open extra sessions for queries run concurrently with
+        # asyncio.gather — a single AsyncSession/connection can't serve
+        # overlapping statements, so each gathered task needs its own.
+        self._session_factory = session_factory
+        # Runs already loaded by this instance: evaluate_gate and
+        # compute_regression_diff on the same run share one SELECT.
+        self._runs: dict[uuid.UUID, EvaluationRun] = {}
 
     async def evaluate_gate(self, run_id: uuid.UUID) -> dict:
         run = await self._get_run_or_404(run_id)
@@ -70,11 +87,14 @@ class ReleaseGateService:
         # bootstrap CI + Mann-Whitney vs. the last passing baseline. Falls
         # back to the classic "mean < threshold" check for pass_rate (which
         # is already a derived scalar).
-        current_results = await self._fetch_results_list(run_id)
-        baseline_run = await self._find_last_passing_baseline(run)
-        baseline_results = (
-            await self._fetch_results_list(baseline_run.id) if baseline_run else []
+        # The per-case samples (baseline lookup + results) and the rule
+        # failures are independent; overlap their round trips.
+        (baseline_run, results_by_run), rule_failures = await asyncio.gather(
+            self._in_own_session(lambda svc: svc._load_gate_samples(run)),
+            self._in_own_session(lambda svc: svc._fetch_rule_failures(run_id)),
         )
+        current_results = results_by_run[run_id]
+        baseline_results = results_by_run[baseline_run.id] if baseline_run else []
 
         metric_failures: list[GateFailure] = []
 
@@ -165,22 +185,6 @@ class ReleaseGateService:
                 )
             )
 
-        # Check for zero-tolerance rule failures
-        rule_failures_result = await self.db.execute(
-            select(EvaluationResult).where(
-                EvaluationResult.run_id == run_id,
-                EvaluationResult.rules_passed == False,  # noqa: E712
-            )
-        )
-        rule_failures = [
-            {
-                "result_id": str(r.id),
-                "test_case_id": str(r.test_case_id),
-                "rules_detail": r.rules_detail,
-            }
-            for r in rule_failures_result.scalars().all()
-        ]
-
         gate_passed = len(metric_failures) == 0 and len(rule_failures) == 0
 
         return {
@@ -209,21 +213,13 @@ class ReleaseGateService:
         run = await self._get_run_or_404(run_id)
 
         # Find the last completed passing run for the same test set
-        baseline_result = await self.db.execute(
-            select(EvaluationRun)
-            .where(
-                EvaluationRun.test_set_id == run.test_set_id,
-                EvaluationRun.id != run_id,
-                EvaluationRun.overall_passed == True,  # noqa: E712
-                EvaluationRun.status == RunStatus.COMPLETED,
-            )
-            .order_by(EvaluationRun.completed_at.desc())
-            .limit(1)
-        )
-        baseline = baseline_result.scalar_one_or_none()
+        baseline = await self._find_last_passing_baseline(run)
 
-        # Fetch current run results
-        current_results = await self._fetch_results_map(run_id)
+        # Current + baseline results in one round trip
+        results_maps = await self._fetch_results_maps_for_runs(
+            [run_id, baseline.id] if baseline else [run_id]
+        )
+        current_results = results_maps[run_id]
 
         if baseline is None:
             return RegressionDiff(
@@ -235,21 +231,26 @@ class ReleaseGateService:
                 gate_blocked=not (run.overall_passed or False),
             )
 
-        baseline_results = await self._fetch_results_map(baseline.id)
+        baseline_results = results_maps[baseline.id]
 
         regressions = []
         improvements = []
 
+        # Query text for every case present in both runs, in one round trip.
+        shared_case_ids = [cid for cid in current_results if cid in baseline_results]
+        query_map: dict[uuid.UUID, str] = {}
+        if shared_case_ids:
+            tc_rows = await self.db.execute(
+                select(TestCase.id, TestCase.query).where(TestCase.id.in_(shared_case_ids))
+            )
+            query_map = dict(tc_rows.tuples().all())
+
         for case_id, current in current_results.items():
             baseline_r = baseline_results.get(case_id)
             if baseline_r is None:
                 continue
 
-            # Fetch query text
-            tc_result = await self.db.execute(
-                select(TestCase.query).where(TestCase.id == case_id)
-            )
-            query_text = tc_result.scalar_one_or_none() or ""
+            query_text = query_map.get(case_id) or ""
 
             current_scores = self._extract_scores(current)
             baseline_scores = self._extract_scores(baseline_r)
@@ -320,25 +321,75 @@ class ReleaseGateService:
         return {"test_set_id": str(test_set_id), "thresholds": thresholds}
 
     async def _get_run_or_404(self, run_id: uuid.UUID) -> EvaluationRun:
+        run = self._runs.get(run_id)
+        if run is not None:
+            return run
         result = await self.db.execute(
             select(EvaluationRun).where(EvaluationRun.id == run_id)
         )
         run = result.scalar_one_or_none()
         if run is None:
             raise NotFoundError("EvaluationRun", str(run_id))
+        self._runs[run_id] = run
         return run
 
-    async def _fetch_results_map(self, run_id: uuid.UUID) -> dict[uuid.UUID, EvaluationResult]:
+    async def _in_own_session(
+        self, fn: Callable[["ReleaseGateService"], Awaitable[_T]]
+    ) -> _T:
+        """Run ``fn`` against a service bound to a fresh session so it can be
+        gathered with other queries. Only for reads of committed data."""
+        async with self._session_factory() as session:
+            return await fn(ReleaseGateService(session, self._session_factory))
+
+    async def _load_gate_samples(
+        self, run: EvaluationRun
+    ) -> tuple[EvaluationRun | None, dict[uuid.UUID, list[EvaluationResult]]]:
+        """Last passing baseline for ``run`` plus results for both runs."""
+        baseline_run = await self._find_last_passing_baseline(run)
+        results_by_run = await self._fetch_results_by_run(
+            [run.id, baseline_run.id] if baseline_run else [run.id]
+        )
+        return baseline_run, results_by_run
+
+    async def _fetch_rule_failures(self, run_id: uuid.UUID) -> list[dict]:
+        """Zero-tolerance rule failures for a run."""
         result = await self.db.execute(
-            select(EvaluationResult).where(EvaluationResult.run_id == run_id)
+            select(EvaluationResult).where(
+                EvaluationResult.run_id == run_id,
+                EvaluationResult.rules_passed == false(),
+            )
         )
-        return {r.test_case_id: r for r in result.scalars().all()}
+        return [
+            {
+                "result_id": str(r.id),
+                "test_case_id": str(r.test_case_id),
+                "rules_detail": r.rules_detail,
+            }
+            for r in result.scalars().all()
+        ]
 
-    async def _fetch_results_list(self, run_id: uuid.UUID) -> list[EvaluationResult]:
+    async def _fetch_results_by_run(
+        self, run_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, list[EvaluationResult]]:
+        """Results for several runs in one ``IN`` query, grouped by run id.
+        Every requested run gets an entry, empty if it has no results."""
+        grouped: dict[uuid.UUID, list[EvaluationResult]] = {rid: [] for rid in run_ids}
         result = await self.db.execute(
-            select(EvaluationResult).where(EvaluationResult.run_id == run_id)
+            select(EvaluationResult).where(EvaluationResult.run_id.in_(run_ids))
         )
-        return list(result.scalars().all())
+        for r in result.scalars().all():
+            grouped[r.run_id].append(r)
+        return grouped
+
+    async def _fetch_results_maps_for_runs(
+        self, run_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, dict[uuid.UUID, EvaluationResult]]:
+        """Like ``_fetch_results_by_run`` but keyed by test case id per run."""
+        grouped = await self._fetch_results_by_run(run_ids)
+        return {
+            rid: {r.test_case_id: r for r in results}
+            for rid, results in grouped.items()
+        }
 
     async def _find_last_passing_baseline(
         self, run: EvaluationRun
@@ -351,7 +402,7 @@ class ReleaseGateService:
             .where(
                 EvaluationRun.test_set_id == run.test_set_id,
                 EvaluationRun.id != run.id,
-                EvaluationRun.overall_passed == True,  # noqa: E712
+                EvaluationRun.overall_passed == true(),
                 EvaluationRun.status == RunStatus.COMPLETED,
             )
             .order_by(EvaluationRun.completed_at.desc())
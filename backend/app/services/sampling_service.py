@@ -13,7 +13,9 @@ import random
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import func, select
+import numpy as np
+from sqlalchemy import bindparam, event, func, insert, select
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
@@ -21,10 +23,38 @@ from app.db.models.production_log import IngestionStatus, ProductionLog
 from app.db.models.test_case import TestCase
 from app.db.models.test_set import TestSet
 
+# Built once at import: the hot path only binds parameters, and the engine's
+# compiled cache keys on the same statement object every call.
+_TEST_SET_BY_NAME = select(TestSet.id).where(TestSet.name == bindparam("name"))
+# Serialises creation of one auto-managed set across sessions and processes;
+# released when the creating transaction commits or rolls back.
+_LOCK_TEST_SET_NAME = select(func.pg_advisory_xact_lock(func.hashtext(bindparam("name"))))
+
+# source -> auto-managed TestSet id. Sources are few and long-lived, so after
+# the first lookup a sampled log costs one INSERT instead of SELECT + INSERT.
+# Sets created by a session are only added once its transaction commits; a
+# stale entry (set deleted since) trips the test case FK and is evicted.
+_test_set_ids: dict[str, uuid.UUID] = {}
+
+# get_stats response key -> status it counts.
+_STATUS_TOTALS = (
+    ("total_received", IngestionStatus.RECEIVED),
+    ("total_sampled", IngestionStatus.SAMPLED),
+    ("total_skipped", IngestionStatus.SKIPPED),
+    ("total_evaluated", IngestionStatus.EVALUATED),
+)
+
+# Below this batch size the per-log Python loop beats numpy's array setup.
+_VECTORIZE_MIN_BATCH = 256
+
 
 class SamplingService:
     def __init__(self, db: AsyncSession):
         self.db = db
+        # Sets created in the session's open transaction, published to
+        # _test_set_ids by _publish_created_test_sets after it commits.
+        self._created_test_set_ids: dict[str, uuid.UUID] = {}
+        self._watching_transaction = False
 
     def should_sample(self, log: ProductionLog) -> bool:
         """Decide whether a production log entry should be sampled for evaluation."""
@@ -43,15 +73,52 @@ class SamplingService:
         # Random sample of normal traffic
         return random.random() < settings.SAMPLING_RATE
 
-    async def _get_or_create_test_set(self, source: str) -> TestSet:
+    def should_sample_batch(self, logs: list[ProductionLog]) -> list[bool]:
+        """``should_sample`` over a batch, vectorised with numpy when it pays off."""
+        if len(logs) < _VECTORIZE_MIN_BATCH:
+            return [self.should_sample(log) for log in logs]
+
+        n = len(logs)
+        rands = np.random.random(n)
+        is_error = np.fromiter((bool(log.is_error) for log in logs), dtype=bool, count=n)
+        thumbs_down = np.fromiter(
+            (log.user_feedback == "thumbs_down" for log in logs), dtype=bool, count=n
+        )
+        confidence = np.fromiter(
+            (1.0 if log.confidence_score is None else log.confidence_score for log in logs),
+            dtype=np.float64,
+            count=n,
+        )
+        # Same precedence as should_sample: error > thumbs_down > low confidence > normal.
+        decisions = np.where(
+            is_error,
+            rands < settings.SAMPLING_ERROR_RATE,
+            thumbs_down
+            | np.where(
+                confidence < 0.5,
+                rands < settings.SAMPLING_ERROR_RATE,
+                rands < settings.SAMPLING_RATE,
+            ),
+        )
+        return decisions.tolist()
+
+    async def _get_or_create_test_set_id(self, source: str) -> uuid.UUID:
         """Get or create the auto-managed test set for a production source."""
+        cached = _test_set_ids.get(source) or self._created_test_set_ids.get(source)
+        if cached is not None:
+            return cached
+
         name = f"Production: {source}"
-        result = await self.db.execute(
-            select(TestSet).where(TestSet.name == name)
-        )
-        ts = result.scalar_one_or_none()
-        if ts is not None:
-            return ts
+        ts_id = await self._find_test_set_id(source, name)
+        if ts_id is not None:
+            return ts_id
+
+        # Not there yet: take the per-name lock and look again, so concurrent
+        # first ingests for a new source create one set between them.
+        await self.db.execute(_LOCK_TEST_SET_NAME, {"name": name})
+        ts_id = await self._find_test_set_id(source, name)
+        if ts_id is not None:
+            return ts_id
 
         ts = TestSet(
             id=uuid.uuid4(),
@@ -64,19 +131,76 @@ class SamplingService:
         )
         self.db.add(ts)
         await self.db.flush()
-        return ts
-
-    async def sample_and_create_test_case(self, log: ProductionLog) -> bool:
-        """
-        Apply sampling logic to a production log entry.
-        If sampled, create a test case. Returns True if sampled.
+        self._stage_created_test_set(source, ts.id)
+        return ts.id
+
+    async def _find_test_set_id(self, source: str, name: str) -> uuid.UUID | None:
+        result = await self.db.execute(_TEST_SET_BY_NAME, {"name": name})
+        ts_id = result.scalar_one_or_none()
+        if ts_id is not None:
+            _test_set_ids[source] = ts_id
+        return ts_id
+
+    def _stage_created_test_set(self, source: str, ts_id: uuid.UUID) -> None:
+        """Hold a newly created set's id until its transaction commits, so a
+        rollback can't leave the process-wide cache pointing at no row."""
+        if not self._watching_transaction:
+            sync_session = self.db.sync_session
+            event.listen(sync_session, "after_commit", self._publish_created_test_sets)
+            event.listen(sync_session, "after_rollback", self._discard_created_test_sets)
+            self._watching_transaction = True
+        self._created_test_set_ids[source] = ts_id
+
+    def _publish_created_test_sets(self, _session) -> None:
+        _test_set_ids.update(self._created_test_set_ids)
+        self._created_test_set_ids.clear()
+
+    def _discard_created_test_sets(self, _session) -> None:
+        self._created_test_set_ids.clear()
+
+    async def sample_and_create_test_cases(self, logs: list[ProductionLog]) -> int:
         """
-        if not self.should_sample(log):
-            log.status = IngestionStatus.SKIPPED
-            return False
-
-        ts = await self._get_or_create_test_set(log.source)
+        Apply sampling logic to a batch of production log entries.
 
+        Decisions are made up front (no I/O); test cases for every sampled
+        log are then written with a single multi-row INSERT, and the logs'
+        status/FK attributes are set in memory so they are persisted with
+        their final values. Returns the number of sampled logs.
+        """
+        sampled: list[ProductionLog] = []
+        for log, keep in zip(logs, self.should_sample_batch(logs)):
+            if keep:
+                sampled.append(log)
+            else:
+                log.status = IngestionStatus.SKIPPED
+        if not sampled:
+            return 0
+
+        ts_ids = {
+            source: await self._get_or_create_test_set_id(source)
+            for source in dict.fromkeys(log.source for log in sampled)
+        }
+        sampled_at = datetime.now(timezone.utc)
+        rows = []
+        for log in sampled:
+            tc_id = uuid.uuid4()
+            rows.append(self._test_case_row(log, tc_id, ts_ids[log.source]))
+            log.status = IngestionStatus.SAMPLED
+            log.sampled_into_test_set_id = ts_ids[log.source]
+            log.sampled_into_test_case_id = tc_id
+            log.sampled_at = sampled_at
+
+        try:
+            await self.db.execute(insert(TestCase), rows)
+        except IntegrityError:
+            # A cached test set may have been deleted; look them up afresh next time.
+            for source in ts_ids:
+                _test_set_ids.pop(source, None)
+            raise
+        return len(sampled)
+
+    @staticmethod
+    def _test_case_row(log: ProductionLog, tc_id: uuid.UUID, ts_id: uuid.UUID) -> dict:
         # Build failure rules based on the production context
         failure_rules = []
         if log.is_error:
@@ -95,70 +219,36 @@ class SamplingService:
         if log.user_feedback:
             tags.append(f"feedback:{log.user_feedback}")
 
-        tc = TestCase(
-            id=uuid.uuid4(),
-            test_set_id=ts.id,
-            query=log.query,
-            ground_truth=log.answer,  # Production answer becomes ground truth reference
-            context=log.contexts,
-            failure_rules=failure_rules if failure_rules else None,
-            tags=tags,
-        )
-        self.db.add(tc)
-        await self.db.flush()
-
-        log.status = IngestionStatus.SAMPLED
-        log.sampled_into_test_set_id = ts.id
-        log.sampled_into_test_case_id = tc.id
-        log.sampled_at = datetime.now(timezone.utc)
-
-        return True
+        return {
+            "id": tc_id,
+            "test_set_id": ts_id,
+            "query": log.query,
+            "ground_truth": log.answer,  # Production answer becomes ground truth reference
+            "context": log.contexts,
+            "failure_rules": failure_rules if failure_rules else None,
+            "tags": tags,
+        }
 
     async def get_stats(self, source: str | None = None) -> list[dict]:
         """Get sampling statistics, optionally filtered by source."""
+        # Pivot in SQL: one row per source with a filtered count per status.
         query = select(
             ProductionLog.source,
-            ProductionLog.status,
-            func.count().label("count"),
-        ).group_by(ProductionLog.source, ProductionLog.status)
+            *(
+                func.count().filter(ProductionLog.status == status).label(key)
+                for key, status in _STATUS_TOTALS
+            ),
+        ).group_by(ProductionLog.source)
 
         if source:
             query = query.where(ProductionLog.source == source)
 
         result = await self.db.execute(query)
-        rows = result.all()
-
-        # Aggregate by source
-        stats_by_source: dict[str, dict] = {}
-        for row in rows:
-            src = row.source
-            if src not in stats_by_source:
-                stats_by_source[src] = {
-                    "source": src,
-                    "total_received": 0,
-                    "total_sampled": 0,
-                    "total_skipped": 0,
-                    "total_evaluated": 0,
-                }
-            status_val = row.status
-            count = row.count
-            if status_val == IngestionStatus.RECEIVED:
-                stats_by_source[src]["total_received"] += count
-            elif status_val == IngestionStatus.SAMPLED:
-                stats_by_source[src]["total_sampled"] += count
-            elif status_val == IngestionStatus.SKIPPED:
-                stats_by_source[src]["total_skipped"] += count
-            elif status_val == IngestionStatus.EVALUATED:
-                stats_by_source[src]["total_evaluated"] += count
-
-        result_list = []
-        for src, data in stats_by_source.items():
-            total = sum(data[k] for k in ["total_received", "total_sampled", "total_skipped", "total_evaluated"])
-            sampled = data["total_sampled"] + data["total_evaluated"]
-            result_list.append({
-                **data,
+        return [
+            {
+                **row._mapping,
                 "sampling_rate": settings.SAMPLING_RATE,
                 "error_sampling_rate": settings.SAMPLING_ERROR_RATE,
-            })
-
-        return result_list
+            }
+            for row in result.all()
+        ]
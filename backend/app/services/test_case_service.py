@@ -1,6 +1,6 @@
 import uuid
 
-from sqlalchemy import select
+from sqlalchemy import Integer, func, insert, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.schemas.test_case import TestCaseCreate, TestCaseResponse, TestCaseUpdate
@@ -8,6 +8,9 @@ from app.core.exceptions import NotFoundError
 from app.db.models.test_case import TestCase
 from app.db.models.test_set import TestSet
 
+# Exactly the columns TestCaseResponse exposes, in field order.
+_LIST_COLUMNS = tuple(getattr(TestCase, field) for field in TestCaseResponse.model_fields)
+
 
 class TestCaseService:
     def __init__(self, db: AsyncSession):
@@ -36,24 +39,29 @@ class TestCaseService:
         self, test_set_id: uuid.UUID, cases: list[TestCaseCreate]
     ) -> list[TestCaseResponse]:
         await self._assert_test_set_exists(test_set_id)
-        tcs = [
-            TestCase(
-                test_set_id=test_set_id,
-                query=c.query,
-                expected_output=c.expected_output,
-                ground_truth=c.ground_truth,
-                context=c.context,
-                failure_rules=[r.model_dump(exclude_none=True) for r in c.failure_rules]
+        if not cases:
+            return []
+        rows = [
+            {
+                "test_set_id": test_set_id,
+                "query": c.query,
+                "expected_output": c.expected_output,
+                "ground_truth": c.ground_truth,
+                "context": c.context,
+                "failure_rules": [r.model_dump(exclude_none=True) for r in c.failure_rules]
                 if c.failure_rules
                 else [],
-                tags=c.tags or [],
-            )
+                "tags": c.tags or [],
+            }
             for c in cases
         ]
-        self.db.add_all(tcs)
-        await self.db.flush()
-        for tc in tcs:
-            await self.db.refresh(tc)
+        # ORM bulk INSERT ... RETURNING: one batched statement hands back
+        # fully populated rows (ids + server defaults), no per-row refresh.
+        result = await self.db.scalars(
+            insert(TestCase).returning(TestCase, sort_by_parameter_order=True),
+            rows,
+        )
+        tcs = result.all()
         await self._bump_version(test_set_id)
         return [TestCaseResponse.model_validate(tc) for tc in tcs]
 
@@ -64,12 +72,13 @@ class TestCaseService:
         limit: int = 50,
         tag: str | None = None,
     ) -> list[TestCaseResponse]:
-        query = select(TestCase).where(TestCase.test_set_id == test_set_id)
+        query = select(*_LIST_COLUMNS).where(TestCase.test_set_id == test_set_id)
         if tag:
             query = query.where(TestCase.tags.contains([tag]))
         query = query.order_by(TestCase.created_at.asc()).offset(skip).limit(limit)
         result = await self.db.execute(query)
-        return [TestCaseResponse.model_validate(tc) for tc in result.scalars().all()]
+        # Rows come straight from typed columns; skip re-validating them.
+        return [TestCaseResponse.model_construct(**row._mapping) for row in result]
 
     async def get(self, test_set_id: uuid.UUID, case_id: uuid.UUID) -> TestCaseResponse:
         tc = await self._get_or_404(test_set_id, case_id)
@@ -120,11 +129,16 @@ class TestCaseService:
             raise NotFoundError("TestSet", str(test_set_id))
 
     async def _bump_version(self, test_set_id: uuid.UUID) -> None:
-        result = await self.db.execute(
-            select(TestSet).where(TestSet.id == test_set_id)
+        # "major.minor" -> "major.(minor+1)" computed server-side so the bump is
+        # one atomic statement; non-numeric versions (e.g. "auto") are left as-is.
+        minor = func.split_part(TestSet.version, ".", 2)
+        await self.db.execute(
+            update(TestSet)
+            .where(TestSet.id == test_set_id, TestSet.version.regexp_match(r"^\d+\.\d+$"))
+            .values(
+                version=func.concat(
+                    func.split_part(TestSet.version, ".", 1), ".", minor.cast(Integer) + 1
+                )
+            )
+            .execution_options(synchronize_session="fetch")
         )
-        ts = result.scalar_one_or_none()
-        if ts:
-            major, minor = ts.version.split(".")
-            ts.version = f"{major}.{int(minor) + 1}"
-            await self.db.flush()
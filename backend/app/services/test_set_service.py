@@ -2,7 +2,7 @@ import uuid
 
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import raiseload, selectinload
 
 from app.api.v1.schemas.test_set import TestSetCreate, TestSetResponse, TestSetUpdate
 from app.core.exceptions import NotFoundError
@@ -10,6 +10,26 @@ from app.db.models.evaluation_run import EvaluationRun, RunStatus
 from app.db.models.test_case import TestCase
 from app.db.models.test_set import TestSet
 
+# Per-set stats as correlated scalar subqueries, so a page of test sets is
+# enriched in the same round trip that loads it (each probes an index on
+# test_set_id instead of a follow-up query per set).
+_CASE_COUNT = (
+    select(func.count())
+    .where(TestCase.test_set_id == TestSet.id)
+    .correlate(TestSet)
+    .scalar_subquery()
+)
+# Served by ix_evaluation_runs_test_set_started (migration 008): one
+# index-only probe per test set. Keep the ORDER BY in step with that index.
+_LAST_RUN_STATUS = (
+    select(EvaluationRun.status)
+    .where(EvaluationRun.test_set_id == TestSet.id)
+    .order_by(EvaluationRun.started_at.desc())
+    .limit(1)
+    .correlate(TestSet)
+    .scalar_subquery()
+)
+
 
 class TestSetService:
     def __init__(self, db: AsyncSession):
@@ -24,10 +44,20 @@ class TestSetService:
 
     async def list(self, skip: int = 0, limit: int = 50) -> list[TestSetResponse]:
         result = await self.db.execute(
-            select(TestSet).order_by(TestSet.created_at.desc()).offset(skip).limit(limit)
+            select(TestSet, _CASE_COUNT, _LAST_RUN_STATUS)
+            .options(raiseload("*"))
+            .order_by(TestSet.created_at.desc())
+            .offset(skip)
+            .limit(limit)
         )
-        test_sets = result.scalars().all()
-        return [await self._enrich(ts) for ts in test_sets]
+        return [
+            self._to_response(
+                ts,
+                test_case_count=case_count,
+                last_run_status=last_status.value if last_status else None,
+            )
+            for ts, case_count, last_status in result.all()
+        ]
 
     async def get(self, test_set_id: uuid.UUID) -> TestSetResponse:
         ts = await self._get_or_404(test_set_id)
@@ -46,7 +76,12 @@ class TestSetService:
         return await self._enrich(ts)
 
     async def delete(self, test_set_id: uuid.UUID) -> None:
-        ts = await self._get_or_404(test_set_id)
+        # The ORM delete cascade walks both relationships; load them up front.
+        ts = await self._get_or_404(
+            test_set_id,
+            selectinload(TestSet.test_cases),
+            selectinload(TestSet.evaluation_runs),
+        )
         await self.db.delete(ts)
 
     async def export(self, test_set_id: uuid.UUID) -> dict:
@@ -76,9 +111,13 @@ class TestSetService:
             ],
         }
 
-    async def _get_or_404(self, test_set_id: uuid.UUID) -> TestSet:
+    async def _get_or_404(self, test_set_id: uuid.UUID, *loads) -> TestSet:
+        """Load a test set. Relationships not named in ``loads`` raise on
+        access instead of lazy-loading, so N+1 patterns fail loudly."""
         result = await self.db.execute(
-            select(TestSet).where(TestSet.id == test_set_id)
+            select(TestSet)
+            .where(TestSet.id == test_set_id)
+            .options(*loads, raiseload("*"))
         )
         ts = result.scalar_one_or_none()
         if ts is None:
@@ -86,18 +125,10 @@ class TestSetService:
         return ts
 
     async def _enrich(self, ts: TestSet) -> TestSetResponse:
-        count_result = await self.db.execute(
-            select(func.count()).where(TestCase.test_set_id == ts.id)
-        )
-        test_case_count = count_result.scalar() or 0
-
-        last_run_result = await self.db.execute(
-            select(EvaluationRun.status)
-            .where(EvaluationRun.test_set_id == ts.id)
-            .order_by(EvaluationRun.started_at.desc())
-            .limit(1)
+        result = await self.db.execute(
+            select(_CASE_COUNT, _LAST_RUN_STATUS).where(TestSet.id == ts.id)
         )
-        last_run_status = last_run_result.scalar_one_or_none()
+        test_case_count, last_run_status = result.one()
 
         return self._to_response(
             ts,
@@ -0,0 +1,51 @@
+"""
+Wave scheduling for the evaluation worker's pipeline calls (phase 1).
+
+Kept in its own module so unit tests can import it without pulling in
+Celery / Redis / SQLAlchemy models.
+"""
+
+from __future__ import annotations
+
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable
+
+
+def call_in_waves(
+    pipeline: Any,
+    cases: Iterable[Any],
+    call: Callable[[Any, Any], Any],
+    *,
+    wave: int,
+    stop: Callable[[], bool],
+) -> tuple[list, list, bool]:
+    """Run ``call(case, pipeline)`` for every case, ``wave`` cases at a time.
+
+    ``stop`` is checked before each wave (the budget check); once it returns
+    True no further cases are called. Calls run on a thread pool only when
+    the adapter declares ``thread_safe`` (or there is no adapter). Otherwise
+    they run one at a time in case order, so pipelines that keep
+    conversation state see their turns in sequence.
+
+    Returns ``(cases_called, results, stopped)``.
+    """
+    wave = max(1, wave)
+    cases = iter(cases)
+    called: list = []
+    results: list = []
+    concurrent = wave > 1 and (
+        pipeline is None or getattr(pipeline, "thread_safe", False)
+    )
+    pool = ThreadPoolExecutor(max_workers=wave) if concurrent else None
+    try:
+        run_wave = pool.map if pool is not None else map
+        while wave_cases := list(itertools.islice(cases, wave)):
+            if stop():
+                return called, results, True
+            called.extend(wave_cases)
+            results.extend(run_wave(lambda case: call(case, pipeline), wave_cases))
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return called, results, False
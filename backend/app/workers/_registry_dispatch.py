@@ -53,9 +53,7 @@ def _nan_to_none(v: Any) -> float | None:
         f = float(v)
     except (TypeError, ValueError):
         return None
-    if math.isnan(f) or math.isinf(f):
-        return None
-    return f
+    return f if math.isfinite(f) else None
 
 
 def _build_case_dict(
@@ -1,8 +1,20 @@
 from celery import Celery
 from celery.schedules import crontab
+from kombu.serialization import register
 
+from app.core import serialization
 from app.core.config import settings
 
+# Task payloads carry raw_contexts and other large JSON; orjson encodes them
+# several times faster than the stdlib json serializer.
+register(
+    "orjson",
+    serialization.dumps,
+    serialization.loads,
+    content_type="application/x-orjson",
+    content_encoding="binary",
+)
+
 celery_app = Celery(
     "rageval",
     broker=settings.CELERY_BROKER_URL,
@@ -11,29 +23,46 @@ celery_app = Celery(
         "app.workers.tasks.evaluation_tasks",
         "app.workers.tasks.ingestion_tasks",
         "app.workers.tasks.generation_tasks",
+        "app.workers.tasks.gate_tasks",
+        "app.workers.tasks.alert_tasks",
     ],
 )
 
 celery_app.conf.update(
-    task_serializer="json",
-    accept_content=["json"],
-    result_serializer="json",
+    task_serializer="orjson",
+    # "json" stays accepted so messages queued before the switch still run.
+    accept_content=["json", "orjson"],
+    result_serializer="orjson",
+    result_accept_content=["json", "orjson"],
+    # zstd-compress message bodies and stored results to cut Redis memory
+    # and bandwidth; needs the zstandard package on producers and workers.
+    task_compression="zstd",
+    result_compression="zstd",
     timezone="UTC",
     enable_utc=True,
     task_track_started=True,
     task_acks_late=True,
     task_reject_on_worker_lost=True,
+    # Long LLM-bound tasks go to ``evaluations``; quick DB-only tasks go to
+    # ``short_tasks`` so they never queue behind a multi-minute run. Run a
+    # worker per queue with its own prefetch (a CLI flag overrides this):
+    #   celery -A app.workers.celery_app worker -Q evaluations --prefetch-multiplier=1 -c 4
+    #   celery -A app.workers.celery_app worker -Q short_tasks --prefetch-multiplier=4 -c 8
     worker_prefetch_multiplier=1,
+    task_default_queue="short_tasks",
     task_routes={
         "app.workers.tasks.evaluation_tasks.run_evaluation": {"queue": "evaluations"},
-        "app.workers.tasks.ingestion_tasks.evaluate_sampled_traffic": {"queue": "evaluations"},
+        "app.workers.tasks.generation_tasks.generate_test_cases": {"queue": "evaluations"},
+        "app.workers.tasks.ingestion_tasks.evaluate_sampled_traffic": {"queue": "short_tasks"},
+        "app.workers.tasks.gate_tasks.compute_release_gate": {"queue": "short_tasks"},
+        "app.workers.tasks.alert_tasks.send_alert_webhook": {"queue": "short_tasks"},
     },
     # Celery Beat — periodic tasks
     beat_schedule={
         "evaluate-sampled-traffic-hourly": {
             "task": "app.workers.tasks.ingestion_tasks.evaluate_sampled_traffic",
             "schedule": crontab(minute=0),  # Every hour at :00
-            "options": {"queue": "evaluations"},
+            "options": {"queue": "short_tasks"},
         },
     },
 )
@@ -0,0 +1,31 @@
+"""
+Synchronous database engine shared by the Celery tasks.
+
+One pooled engine per worker process, so tasks reuse connections instead of
+paying a fresh connect + auth handshake on every run. Celery's prefork pool
+forks children after this module is imported; ``worker_process_init``
+drops any connections a child inherited so no socket is shared across
+processes.
+"""
+
+from celery.signals import worker_process_init
+from sqlalchemy import create_engine
+
+from app.core import serialization
+from app.core.config import settings
+
+engine = create_engine(
+    settings.SYNC_DATABASE_URL,
+    json_serializer=serialization.dumps_str,
+    json_deserializer=serialization.loads,
+    pool_pre_ping=True,
+    pool_size=5,
+    max_overflow=10,
+    pool_recycle=1800,
+)
+
+
+@worker_process_init.connect
+def _reset_pool_after_fork(**_kwargs) -> None:
+    # close=False: leave the parent's connections alone, just forget them here.
+    engine.dispose(close=False)
@@ -0,0 +1,21 @@
+"""
+Celery task for alert webhook delivery.
+
+Alerts are queued here instead of being POSTed inline, so a slow or failing
+webhook (Slack rate limits, outages) never holds an evaluation run's
+transaction open. Retries are rescheduled with a countdown rather than
+slept inside the worker.
+"""
+from app.services.alert_service import _WEBHOOK_MAX_ATTEMPTS, deliver_webhook
+from app.workers.celery_app import celery_app
+
+
+@celery_app.task(
+    bind=True,
+    name="app.workers.tasks.alert_tasks.send_alert_webhook",
+    max_retries=_WEBHOOK_MAX_ATTEMPTS - 1,
+)
+def send_alert_webhook(self, payload: dict) -> None:
+    delay = deliver_webhook(payload, self.request.retries)
+    if delay is not None:
+        raise self.retry(countdown=delay)
@@ -3,21 +3,39 @@ Celery evaluation task.
 
 Runs the full evaluation loop for a given EvaluationRun:
 1. Boots the pipeline adapter (dynamic — reads adapter_module/adapter_class from pipeline_config)
-2. For each test case: calls the pipeline → gets real answer + retrieved contexts
+2. Calls the pipeline for every test case (concurrently, EVAL_PIPELINE_CONCURRENCY
+   at a time, for adapters declaring ``thread_safe``; serially in case order
+   otherwise) → gets real answers + retrieved contexts
 3. Scores results with system-specific evaluators (Ragas for RAG; Agent,
    Conversation, Ranking, Code, Classification, Similarity, and Translation
-   evaluators for their respective system types)
+   evaluators for their respective system types), on the same thread pool
 4. Stores EvaluationResult rows and MetricsHistory entries
 5. Updates the run status and summary_metrics
 """
+import functools
+import hashlib
 import importlib
+import itertools
+import json
+import logging
 import math
+import re
+import sys
+import threading
+import time
 import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any
 
-from sqlalchemy import create_engine, select
-from sqlalchemy.orm import Session
+import numpy as np
+import redis
+from celery.signals import worker_process_shutdown
+from sqlalchemy import Float, func, insert, inspect, literal, select, update
+from sqlalchemy.orm import Session, defer
+from sqlalchemy.orm.attributes import set_committed_value
 
 from app.core.config import settings
 from app.db.models.evaluation_result import EvaluationResult
@@ -26,7 +44,9 @@ from app.db.models.metrics_history import MetricsHistory
 from app.db.models.test_case import TestCase
 from app.db.models.test_set import TestSet
 from app.services.alert_service import AlertService
+from app.workers._pipeline_waves import call_in_waves
 from app.workers.celery_app import celery_app
+from app.workers.db import engine
 
 # runner.* is importable because docker-compose mounts ./runner into the
 # worker container and PYTHONPATH=/app makes it resolvable. These helpers
@@ -49,6 +69,183 @@ from app.workers._registry_dispatch import (  # noqa: E402
     run_registry_evaluators,
 )
 
+# EvaluationRun JSON columns the task only ever assigns; deferred so the run
+# fetch doesn't pull them (e.g. a previous attempt's manifest) over the wire.
+_RUN_WRITE_ONLY = (
+    defer(EvaluationRun.summary_metrics),
+    defer(EvaluationRun.manifest),
+    defer(EvaluationRun.budget_summary),
+)
+
+# EvaluationResult columns written by the end-of-run bulk insert (each is a
+# _CaseResult field); ``evaluated_at`` is left to its server default.
+_RESULT_INSERT_KEYS = tuple(
+    attr.key for attr in inspect(EvaluationResult).column_attrs if attr.key != "evaluated_at"
+)
+
+logger = logging.getLogger(__name__)
+
+# Minimum composite average (mean of a case's non-null scores) to pass.
+COMPOSITE_THRESHOLD = 0.5
+
+# Gate checks per system type: (threshold key, summary key) pairs, all
+# higher-is-better. pass_rate is checked for every system type.
+_PASS_RATE_CHECK: tuple[tuple[str, str], ...] = (("pass_rate", "pass_rate"),)
+_GATE_CHECKS_BY_SYSTEM: dict[str, tuple[tuple[str, str], ...]] = {
+    "rag": _PASS_RATE_CHECK + (
+        ("faithfulness", "avg_faithfulness"),
+        ("answer_relevancy", "avg_answer_relevancy"),
+        ("context_precision", "avg_context_precision"),
+        ("context_recall", "avg_context_recall"),
+    ),
+    "agent": _PASS_RATE_CHECK + (
+        ("tool_call_f1", "avg_tool_call_f1"),
+        ("tool_call_accuracy", "avg_tool_call_accuracy"),
+        ("goal_accuracy", "avg_goal_accuracy"),
+        ("step_efficiency", "avg_step_efficiency"),
+    ),
+    "chatbot": _PASS_RATE_CHECK + (
+        ("coherence", "avg_coherence"),
+        ("knowledge_retention", "avg_knowledge_retention"),
+        ("role_adherence", "avg_role_adherence"),
+        ("response_relevance", "avg_response_relevance"),
+    ),
+    "search": _PASS_RATE_CHECK + (
+        ("ndcg_at_k", "avg_ndcg_at_k"),
+        ("map_at_k", "avg_map_at_k"),
+        ("mrr", "avg_mrr"),
+        ("recall_at_k", "avg_recall_at_k"),
+    ),
+    "code_gen": _PASS_RATE_CHECK + (
+        ("syntax_valid", "avg_syntax_valid"),
+        ("security_score", "avg_security_score"),
+        ("pass_at_k", "avg_pass_at_k"),
+    ),
+    "classification": _PASS_RATE_CHECK + (
+        ("accuracy", "avg_accuracy"),
+        ("f1", "avg_f1"),
+        ("macro_f1", "avg_macro_f1"),
+        ("precision", "avg_precision"),
+        ("recall", "avg_recall"),
+    ),
+    "summarization": _PASS_RATE_CHECK + (
+        ("rouge_l", "avg_rouge_l"),
+        ("bleu", "avg_bleu"),
+        ("semantic_similarity", "avg_semantic_similarity"),
+    ),
+    # TER is lower-is-better and the simple gate loop only supports
+    # higher-is-better thresholds, so it stays out.
+    "translation": _PASS_RATE_CHECK + (
+        ("sacrebleu", "avg_sacrebleu"),
+        ("chrf_plus_plus", "avg_chrf_plus_plus"),
+    ),
+}
+
+# Leading doc ID in search contexts such as "[doc-001] Title: content".
+_CTX_ID_RE = re.compile(r"\[([\w-]+)\]")
+
+# Stored raw_contexts are capped per result row: evaluators score the full
+# contexts, but persisting every long retrieved document bloats rows (TOAST)
+# and the run's results payloads.
+MAX_STORED_CONTEXTS = 10
+MAX_CONTEXT_CHARS = 4096
+
+# Rows per server-side cursor fetch when streaming a run's test cases.
+_TEST_CASE_BATCH = 100
+
+_RAGAS_METRICS = ("faithfulness", "answer_relevancy", "context_precision", "context_recall")
+
+# Per-run totals and RAG score means, computed by Postgres over the rows just
+# inserted. NULLIF drops NaN scores from the averages.
+_SCORE_AVERAGES = {
+    f"avg_{name}": func.avg(func.nullif(getattr(EvaluationResult, name), literal(float("nan"), Float)))
+    for name in _RAGAS_METRICS
+}
+_RUN_SUMMARY = select(
+    func.count().label("total_cases"),
+    func.count().filter(EvaluationResult.passed).label("passed_cases"),
+    *(agg.label(key) for key, agg in _SCORE_AVERAGES.items()),
+)
+
+# Ragas scores are memoized in Redis: same case + pipeline version + judge
+# model + answer + contexts + ground truth gives the same scores, so re-runs
+# and gate reruns skip the judge calls. Only complete, finite score rows are
+# stored.
+_RAGAS_CACHE_TTL_S = 30 * 24 * 3600
+_redis = redis.Redis.from_url(settings.REDIS_URL)
+
+
+@dataclass
+class _PipelineCall:
+    """What the pipeline produced for one test case (or the stored fallback)."""
+    raw_output: str | None
+    raw_contexts: list = field(default_factory=list)
+    tool_calls_data: list[dict] = field(default_factory=list)
+    pipeline_output: Any = None
+    failure_reason: str | None = None
+    elapsed_s: float = 0.0
+
+
+@dataclass(slots=True)
+class _CaseResult:
+    """One scored case: a plain-attribute stand-in for an EvaluationResult
+    row. The summary passes read these fields case by case; bulk-inserting
+    them skips ORM construction and instrumented attribute access."""
+    id: uuid.UUID
+    run_id: uuid.UUID
+    test_case_id: uuid.UUID
+    passed: bool
+    faithfulness: float | None = None
+    answer_relevancy: float | None = None
+    context_precision: float | None = None
+    context_recall: float | None = None
+    rules_passed: bool | None = None
+    rules_detail: list | None = None
+    llm_judge_score: float | None = None
+    llm_judge_reasoning: str | None = None
+    failure_reason: str | None = None
+    raw_output: str | None = None
+    raw_contexts: list | None = None
+    tool_calls: list | None = None
+    eval_cost_usd: float | None = None
+    tokens_used: int | None = None
+    extended_metrics: dict | None = None
+    duration_ms: int | None = None
+
+
+# Per-case evaluators by name: (module, class, constructor kwargs). They keep
+# no per-case state, so one instance per worker process is shared across
+# cases, runs and scoring threads (and keeps lazily-built clients warm).
+_EVALUATORS: dict[str, tuple[str, str, dict]] = {
+    "agent": ("runner.evaluators.agent_evaluator", "AgentEvaluator", {}),
+    "conversation": ("runner.evaluators.conversation_evaluator", "ConversationEvaluator", {}),
+    "ranking": ("runner.evaluators.ranking_evaluator", "RankingEvaluator", {"k": 5}),
+    "code": ("runner.evaluators.code_evaluator", "CodeEvaluator", {}),
+    "classification": ("runner.evaluators.classification_evaluator", "ClassificationEvaluator", {}),
+    "similarity": (
+        "runner.evaluators.similarity_evaluator", "SimilarityEvaluator",
+        {"openai_api_key": getattr(settings, "OPENAI_API_KEY", None)},
+    ),
+    "translation": ("runner.evaluators.translation_evaluator", "TranslationEvaluator", {}),
+    "rule": ("runner.evaluators.rule_evaluator", "RuleEvaluator", {}),
+}
+
+
+@functools.cache
+def _get_evaluator(name: str):
+    module_path, class_name, kwargs = _EVALUATORS[name]
+    return getattr(importlib.import_module(module_path), class_name)(**kwargs)
+
+
+# (adapter_module, adapter_class) -> resolved class, so repeat runs skip the
+# import machinery.
+_adapter_classes: dict[tuple[str, str], type] = {}
+
+
+# pipeline_config keys that never reach the adapter constructor. ``budget``
+# is read by the run itself and differs run to run.
+_NON_ADAPTER_KEYS = frozenset({"adapter_module", "adapter_class", "budget"})
+
 
 def _load_adapter(pipeline_config: dict | None):
     """
@@ -61,39 +258,113 @@ def _load_adapter(pipeline_config: dict | None):
     module_path = config.get("adapter_module", "runner.adapters.demo_rag")
     class_name = config.get("adapter_class", "DemoRAGAdapter")
 
-    mod = importlib.import_module(module_path)
-    adapter_cls = getattr(mod, class_name)
+    key = (module_path, class_name)
+    adapter_cls = _adapter_classes.get(key)
+    if adapter_cls is None:
+        mod = sys.modules.get(module_path) or importlib.import_module(module_path)
+        adapter_cls = _adapter_classes[key] = getattr(mod, class_name)
 
-    # Pass any extra config keys as constructor kwargs (excluding meta fields)
-    meta_keys = {"adapter_module", "adapter_class"}
-    init_kwargs = {k: v for k, v in config.items() if k not in meta_keys}
+    # Pass any extra config keys as constructor kwargs (excluding meta and
+    # run-level fields)
+    init_kwargs = {k: v for k, v in config.items() if k not in _NON_ADAPTER_KEYS}
     return adapter_cls(**init_kwargs) if init_kwargs else adapter_cls()
 
 
-@celery_app.task(bind=True, name="app.workers.tasks.evaluation_tasks.run_evaluation", max_retries=2)
+# Set-up adapters kept across runs by the worker process, least recently used
+# first. Only adapters declaring ``reusable`` are cached, which spares e.g.
+# DemoRAGAdapter from re-embedding its corpus on every run; the oldest is
+# torn down once more than _ADAPTER_CACHE_SIZE configs are in use.
+_ADAPTER_CACHE_SIZE = 4
+_adapters: OrderedDict[str, Any] = OrderedDict()
+
+
+def _adapter_key(pipeline_config: dict | None) -> str:
+    """Digest of the adapter-relevant part of ``pipeline_config``.
+
+    Hashed so endpoint credentials in the config aren't kept as dict keys.
+    """
+    config = {k: v for k, v in (pipeline_config or {}).items() if k != "budget"}
+    return hashlib.sha256(
+        json.dumps(config, sort_keys=True, default=str).encode()
+    ).hexdigest()
+
+
+def _cached_adapter(key: str):
+    pipeline = _adapters.get(key)
+    if pipeline is not None:
+        _adapters.move_to_end(key)
+    return pipeline
+
+
+def _cache_adapter(key: str, pipeline) -> None:
+    _adapters[key] = pipeline
+    while len(_adapters) > _ADAPTER_CACHE_SIZE:
+        _, evicted = _adapters.popitem(last=False)
+        _teardown_adapter(evicted)
+
+
+def _teardown_adapter(pipeline) -> None:
+    try:
+        pipeline.teardown()
+    except Exception:
+        logger.warning("Adapter teardown failed for %s", type(pipeline).__name__, exc_info=True)
+
+
+@worker_process_shutdown.connect
+def _teardown_cached_adapters(**_kwargs) -> None:
+    while _adapters:
+        _teardown_adapter(_adapters.popitem()[1])
+
+
+# Acked on receipt, unlike the global acks_late default: the claim below is
+# committed before the work starts, so a redelivered message could only ever
+# find the run RUNNING and skip it.
+@celery_app.task(
+    bind=True,
+    name="app.workers.tasks.evaluation_tasks.run_evaluation",
+    max_retries=2,
+    acks_late=False,
+)
 def run_evaluation(self, run_id: str, metrics: list[str]) -> dict:
     """
     Main evaluation Celery task. Uses a synchronous SQLAlchemy session
     (Celery workers are synchronous by default).
     """
-    engine = create_engine(settings.SYNC_DATABASE_URL, pool_pre_ping=True)
-
-    # ── Read run config to determine which adapter to load ─────────────
+    # ── Claim the run and read the config that picks its adapter ───────
     pipeline = None
     pipeline_config_captured: dict = {}
     run_pipeline_config: dict | None = None
 
+    # Atomic PENDING → RUNNING transition. A duplicate apply_async must not
+    # redo the LLM loop and write a second set of EvaluationResult rows.
+    # Cancelled (FAILED) runs are skipped the same way.
     with Session(engine) as db:
-        run_row = db.execute(
-            select(EvaluationRun).where(EvaluationRun.id == uuid.UUID(run_id))
-        ).scalar_one_or_none()
-        if run_row is not None:
-            run_pipeline_config = run_row.pipeline_config
+        claimed = db.execute(
+            update(EvaluationRun)
+            .where(EvaluationRun.id == uuid.UUID(run_id))
+            .where(EvaluationRun.status == RunStatus.PENDING)
+            .values(status=RunStatus.RUNNING)
+            .returning(EvaluationRun.pipeline_config)
+        ).one_or_none()
+        if claimed is None:
+            status = db.execute(
+                select(EvaluationRun.status).where(EvaluationRun.id == uuid.UUID(run_id))
+            ).scalar_one_or_none()
+            if status is None:
+                return {"error": f"Run {run_id} not found"}
+            return {"run_id": run_id, "status": status.value, "skipped": True}
+        db.commit()
+        run_pipeline_config = claimed.pipeline_config
 
     # ── Boot the pipeline adapter ──────────────────────────────────────
     try:
-        pipeline = _load_adapter(run_pipeline_config)
-        pipeline.setup()
+        adapter_key = _adapter_key(run_pipeline_config)
+        pipeline = _cached_adapter(adapter_key)
+        if pipeline is None:
+            pipeline = _load_adapter(run_pipeline_config)
+            pipeline.setup()
+            if getattr(pipeline, "reusable", False):
+                _cache_adapter(adapter_key, pipeline)
         # Capture structured config for the audit trail
         for attr in ("model", "top_k", "_embed_model", "max_tool_rounds"):
             if hasattr(pipeline, attr):
@@ -101,42 +372,72 @@ def run_evaluation(self, run_id: str, metrics: list[str]) -> dict:
                 pipeline_config_captured[key] = getattr(pipeline, attr)
         pipeline_config_captured["adapter"] = type(pipeline).__name__
     except Exception as exc:
-        # Pipeline failure is non-fatal; evaluation falls back to stored text
-        print(f"[warn] Pipeline setup failed: {exc}")
+        logger.warning("Pipeline setup failed for run %s", run_id, exc_info=exc)
+        if settings.EVAL_REQUIRE_PIPELINE:
+            # Scoring stored fallback text would spend judge calls on a run
+            # whose results mean nothing; fail it up front instead.
+            with Session(engine) as db:
+                db.execute(
+                    update(EvaluationRun)
+                    .where(EvaluationRun.id == uuid.UUID(run_id))
+                    .values(status=RunStatus.FAILED, completed_at=func.now())
+                )
+                db.commit()
+            return {
+                "run_id": run_id,
+                "status": RunStatus.FAILED.value,
+                "error": f"Pipeline setup failed: {exc}",
+            }
+        # Otherwise non-fatal; evaluation falls back to stored text
 
     try:
         with Session(engine) as db:
-            run = db.execute(
-                select(EvaluationRun).where(EvaluationRun.id == uuid.UUID(run_id))
-            ).scalar_one_or_none()
-
-            if run is None:
+            # Only the test-set columns the task reads (system type, name for
+            # alerts) come back in the same round trip, and the run's
+            # write-only JSON columns are never loaded. Test cases are
+            # streamed separately below.
+            row = db.execute(
+                select(EvaluationRun, TestSet.system_type, TestSet.name)
+                .outerjoin(TestSet, TestSet.id == EvaluationRun.test_set_id)
+                .options(*_RUN_WRITE_ONLY)
+                .where(EvaluationRun.id == uuid.UUID(run_id))
+            ).one_or_none()
+
+            if row is None:
                 return {"error": f"Run {run_id} not found"}
 
-            run.status = RunStatus.RUNNING
+            run, system_type, ts_name = row
+            system_type = system_type or "rag"
+            ts_name = ts_name or str(run.test_set_id)
+
             # Merge auto-captured config with any config provided at trigger time
+            config_merge: dict[str, Any] = {}
             if pipeline_config_captured:
-                run.pipeline_config = {**pipeline_config_captured, **(run.pipeline_config or {})}
+                config_merge["pipeline_config"] = {
+                    **pipeline_config_captured, **(run.pipeline_config or {}),
+                }
                 # Auto-generate pipeline_version from config if not set at trigger time
                 if not run.pipeline_version:
                     adapter = pipeline_config_captured.get("adapter", "pipeline")
                     model = pipeline_config_captured.get("model", "unknown")
                     extra = pipeline_config_captured.get("top_k")
                     version_suffix = f"/top-{extra}" if extra else ""
-                    run.pipeline_version = f"{adapter}/{model}{version_suffix}"
-            db.commit()
-
-            # Look up the test set to determine system type
-            test_set = db.execute(
-                select(TestSet).where(TestSet.id == run.test_set_id)
-            ).scalar_one_or_none()
-            system_type = test_set.system_type if test_set else "rag"
-
-            test_cases = db.execute(
-                select(TestCase).where(TestCase.test_set_id == run.test_set_id)
-            ).scalars().all()
+                    config_merge["pipeline_version"] = f"{adapter}/{model}{version_suffix}"
+
+            # Streamed from a server-side cursor: the first wave of pipeline
+            # calls starts after _TEST_CASE_BATCH rows, not the whole set.
+            test_case_rows = db.scalars(
+                select(TestCase)
+                .where(TestCase.test_set_id == run.test_set_id)
+                .execution_options(yield_per=_TEST_CASE_BATCH)
+            )
+            pending_cases = iter(test_case_rows)
+            first_case = next(pending_cases, None)
 
-            if not test_cases:
+            if first_case is None:
+                # Empty set: the config merge and the outcome share one commit.
+                for key, value in config_merge.items():
+                    setattr(run, key, value)
                 run.status = RunStatus.COMPLETED
                 run.overall_passed = True
                 run.completed_at = datetime.now(timezone.utc)
@@ -147,6 +448,21 @@ def run_evaluation(self, run_id: str, metrics: list[str]) -> dict:
                 db.commit()
                 return {"run_id": run_id, "status": "completed", "total_cases": 0}
 
+            # Publish the merge right away in its own short transaction. This
+            # session's transaction stays open behind the cursor for the whole
+            # run; flushing the UPDATE here would hold the run's row lock (and
+            # hide the captured config) until the run finishes.
+            if config_merge:
+                with Session(engine) as config_db:
+                    config_db.execute(
+                        update(EvaluationRun)
+                        .where(EvaluationRun.id == run.id)
+                        .values(**config_merge)
+                    )
+                    config_db.commit()
+                for key, value in config_merge.items():
+                    set_committed_value(run, key, value)
+
             # ── Budget + Manifest setup ───────────────────────────────────
             # Budget ceilings come from pipeline_config.budget at trigger time:
             #   {"budget": {"max_usd": 5.0, "max_seconds": 600}}
@@ -169,25 +485,92 @@ def run_evaluation(self, run_id: str, metrics: list[str]) -> dict:
                 manifest.record_seed("llm_judge_base", 0)
 
             results = []
-            passed_count = 0
-            budget_exceeded = False
-
-            for tc in test_cases:
-                if budget is not None:
-                    try:
-                        budget.check()
-                    except BudgetExceeded:
+
+            def _budget_tripped() -> bool:
+                if budget is None:
+                    return False
+                try:
+                    budget.check()
+                except BudgetExceeded:
+                    logger.warning("Budget exceeded for run %s: %s", run_id, budget.exceeded_reason)
+                    return True
+                return False
+
+            # Phase 1: pipeline calls, EVAL_PIPELINE_CONCURRENCY at a time,
+            # fed from the test-case stream. They're I/O-bound, so threads
+            # overlap the network waits; the budget is checked between waves.
+            # Adapters that don't declare thread_safe are called serially,
+            # in case order.
+            wave = max(1, settings.EVAL_PIPELINE_CONCURRENCY)
+            test_cases, calls, budget_exceeded = call_in_waves(
+                pipeline,
+                itertools.chain([first_case], pending_cases),
+                _call_pipeline,
+                wave=wave,
+                stop=_budget_tripped,
+            )
+            test_case_rows.close()
+
+            # Phase 2: one Ragas evaluate() over every case, so Ragas can
+            # run the judge calls concurrently instead of one dataset per case.
+            # Cases with no answer and no contexts are left out (phase 3
+            # fails them) rather than spending judge calls on blank input.
+            ragas_outcomes: list[dict | Exception | None] = [None] * len(calls)
+            scorable = [
+                i for i, (tc, call) in enumerate(zip(test_cases, calls))
+                if _has_ragas_input(tc, call)
+            ] if system_type == "rag" and any(m in metrics for m in _RAGAS_METRICS) else []
+            if scorable:
+                ragas_started = time.monotonic()
+                try:
+                    scored = _run_ragas_cached(
+                        [test_cases[i] for i in scorable], [calls[i] for i in scorable],
+                        metrics, run.pipeline_version,
+                    )
+                    if manifest is not None:
+                        _record_evaluator(manifest, "runner.evaluators.ragas_evaluator", "RagasEvaluator")
+                except Exception as exc:
+                    scored = [exc] * len(scorable)
+                # Attribute the batch's wall time evenly across its cases.
+                ragas_share = (time.monotonic() - ragas_started) / len(scorable)
+                for i, outcome in zip(scorable, scored):
+                    ragas_outcomes[i] = outcome
+                    calls[i].elapsed_s += ragas_share
+
+            # Phase 3: per-case scoring, rules and pass/fail, on the same
+            # thread pool width — agent/chatbot/registry judges are LLM calls.
+            # Cases whose pipeline call already ran are scored even if phase 1
+            # tripped. Scoring threads only build _CaseResult records;
+            # every DB write stays on this thread.
+            shared_manifest = _Serialized(manifest) if manifest is not None else None
+            shared_budget = _Serialized(budget) if budget is not None else None
+            _ = run.pipeline_config  # never lazy-load run columns from a worker thread
+
+            def _score(item) -> _CaseResult:
+                tc, call, ragas_outcome = item
+                return _evaluate_test_case(
+                    tc, run, metrics, call, system_type,
+                    ragas_outcome=ragas_outcome,
+                    manifest=shared_manifest, budget=shared_budget,
+                )
+
+            scoring = zip(test_cases, calls, ragas_outcomes)
+            with ThreadPoolExecutor(max_workers=wave) as pool:
+                while wave_items := list(itertools.islice(scoring, wave)):
+                    if not budget_exceeded and _budget_tripped():
                         budget_exceeded = True
-                        print(f"[warn] Budget exceeded: {budget.exceeded_reason}")
                         break
+                    results.extend(pool.map(_score, wave_items))
 
-                result = _evaluate_test_case(
-                    tc, run, metrics, db, pipeline, system_type,
-                    manifest=manifest, budget=budget,
+            if system_type == "rag":
+                _apply_rag_composite(results)
+
+            # All per-case rows in one batched INSERT instead of a flush per case.
+            if results:
+                db.execute(
+                    insert(EvaluationResult),
+                    [{k: getattr(r, k) for k in _RESULT_INSERT_KEYS} for r in results],
                 )
-                results.append(result)
-                if result.passed:
-                    passed_count += 1
 
             # ── Batch-level evaluators (calibration) ──────────────────────
             # CalibrationEvaluator is batch-scoped — it needs ALL cases'
@@ -198,7 +581,9 @@ def run_evaluation(self, run_id: str, metrics: list[str]) -> dict:
                 try:
                     batch = extract_calibration_batch(results, test_cases)
                     if batch:
-                        from runner.evaluators.calibration_evaluator import CalibrationEvaluator
+                        from runner.evaluators.calibration_evaluator import (
+                            CalibrationEvaluator,
+                        )
                         calibrator = CalibrationEvaluator()
                         if manifest is not None:
                             _record_evaluator(
@@ -213,7 +598,7 @@ def run_evaluation(self, run_id: str, metrics: list[str]) -> dict:
                                 if v is not None
                             }
                 except Exception as exc:
-                    print(f"[warn] Calibration evaluation failed: {exc}")
+                    logger.warning("Calibration evaluation failed", exc_info=exc)
 
             # ── Batch-level classification metrics ────────────────────────
             # Macro/micro/weighted F1, Cohen's kappa, and MCC need the full
@@ -221,7 +606,6 @@ def run_evaluation(self, run_id: str, metrics: list[str]) -> dict:
             classification_scores: dict[str, float] = {}
             if system_type == "classification":
                 try:
-                    from runner.evaluators.classification_evaluator import ClassificationEvaluator
                     preds: list = []
                     exps: list = []
                     for tc_, r_ in zip(test_cases, results):
@@ -230,29 +614,21 @@ def run_evaluation(self, run_id: str, metrics: list[str]) -> dict:
                             preds.append(r_.raw_output.strip())
                             exps.append(expected)
                     if preds:
-                        batch_scores = ClassificationEvaluator().evaluate_batch(preds, exps)
+                        batch_scores = _get_evaluator("classification").evaluate_batch(preds, exps)
                         classification_scores = {
                             k: float(v) for k, v in batch_scores.items()
                             if isinstance(v, (int, float)) and not isinstance(v, bool)
-                            and not math.isnan(float(v)) and not math.isinf(float(v))
+                            and math.isfinite(v)
                         }
                 except Exception as exc:
-                    print(f"[warn] Batch classification metrics failed: {exc}")
+                    logger.warning("Batch classification metrics failed", exc_info=exc)
 
             # ── Summary metrics ───────────────────────────────────────────
-            def _clean(v):
-                if v is None:
-                    return None
-                try:
-                    return None if (math.isnan(v) or math.isinf(v)) else float(v)
-                except (TypeError, ValueError):
-                    return None
-
-            def avg(vals):
-                vals = [_clean(v) for v in vals if _clean(v) is not None]
-                return sum(vals) / len(vals) if vals else None
-
-            total = len(results)
+            totals = db.execute(
+                _RUN_SUMMARY.where(EvaluationResult.run_id == run.id)
+            ).one()._mapping
+            total = totals["total_cases"]
+            passed_count = totals["passed_cases"]
             summary = {
                 "total_cases": total,
                 "passed_cases": passed_count,
@@ -268,27 +644,15 @@ def run_evaluation(self, run_id: str, metrics: list[str]) -> dict:
             # RAG-specific summary metrics
             if system_type == "rag":
                 summary.update({
-                    "avg_faithfulness": avg([r.faithfulness for r in results]),
-                    "avg_answer_relevancy": avg([r.answer_relevancy for r in results]),
-                    "avg_context_precision": avg([r.context_precision for r in results]),
-                    "avg_context_recall": avg([r.context_recall for r in results]),
+                    key: float(totals[key]) if totals[key] is not None else None
+                    for key in _SCORE_AVERAGES
                 })
 
             # System-specific extended metrics aggregation
             if system_type in ("agent", "chatbot", "search", "code_gen",
                                "classification", "summarization", "translation"):
-                ext_keys: set[str] = set()
-                for r in results:
-                    if r.extended_metrics:
-                        ext_keys.update(r.extended_metrics.keys())
-                for key in ext_keys:
-                    vals = [
-                        r.extended_metrics.get(key) for r in results
-                        if r.extended_metrics and r.extended_metrics.get(key) is not None
-                    ]
-                    avg_val = avg(vals)
-                    if avg_val is not None:
-                        summary[f"avg_{key}"] = avg_val
+                for key, avg_val in _extended_averages(results).items():
+                    summary[f"avg_{key}"] = avg_val
 
             # Batch-level classification metrics override the naive per-case
             # averages (identical for precision/recall/f1/accuracy) and add
@@ -298,72 +662,8 @@ def run_evaluation(self, run_id: str, metrics: list[str]) -> dict:
 
             # ── Gate evaluation ───────────────────────────────────────────
             thresholds = run.gate_threshold_snapshot or {}
-            gate_passed = True
-
-            # Build metric-key to summary-key pairs based on system type
-            gate_checks: list[tuple[str, str]] = [("pass_rate", "pass_rate")]
-            if system_type == "rag":
-                gate_checks.extend([
-                    ("faithfulness", "avg_faithfulness"),
-                    ("answer_relevancy", "avg_answer_relevancy"),
-                    ("context_precision", "avg_context_precision"),
-                    ("context_recall", "avg_context_recall"),
-                ])
-            elif system_type == "agent":
-                gate_checks.extend([
-                    ("tool_call_f1", "avg_tool_call_f1"),
-                    ("tool_call_accuracy", "avg_tool_call_accuracy"),
-                    ("goal_accuracy", "avg_goal_accuracy"),
-                    ("step_efficiency", "avg_step_efficiency"),
-                ])
-            elif system_type == "chatbot":
-                gate_checks.extend([
-                    ("coherence", "avg_coherence"),
-                    ("knowledge_retention", "avg_knowledge_retention"),
-                    ("role_adherence", "avg_role_adherence"),
-                    ("response_relevance", "avg_response_relevance"),
-                ])
-            elif system_type == "search":
-                gate_checks.extend([
-                    ("ndcg_at_k", "avg_ndcg_at_k"),
-                    ("map_at_k", "avg_map_at_k"),
-                    ("mrr", "avg_mrr"),
-                    ("recall_at_k", "avg_recall_at_k"),
-                ])
-            elif system_type == "code_gen":
-                gate_checks.extend([
-                    ("syntax_valid", "avg_syntax_valid"),
-                    ("security_score", "avg_security_score"),
-                    ("pass_at_k", "avg_pass_at_k"),
-                ])
-            elif system_type == "classification":
-                gate_checks.extend([
-                    ("accuracy", "avg_accuracy"),
-                    ("f1", "avg_f1"),
-                    ("macro_f1", "avg_macro_f1"),
-                    ("precision", "avg_precision"),
-                    ("recall", "avg_recall"),
-                ])
-            elif system_type == "summarization":
-                gate_checks.extend([
-                    ("rouge_l", "avg_rouge_l"),
-                    ("bleu", "avg_bleu"),
-                    ("semantic_similarity", "avg_semantic_similarity"),
-                ])
-            elif system_type == "translation":
-                # TER is lower-is-better and the simple gate loop only
-                # supports higher-is-better thresholds, so it stays out.
-                gate_checks.extend([
-                    ("sacrebleu", "avg_sacrebleu"),
-                    ("chrf_plus_plus", "avg_chrf_plus_plus"),
-                ])
-
-            for metric_key, summary_key in gate_checks:
-                threshold = thresholds.get(metric_key)
-                actual = summary.get(summary_key)
-                if threshold is not None and actual is not None and actual < threshold:
-                    gate_passed = False
-                    break
+            gate_checks = _GATE_CHECKS_BY_SYSTEM.get(system_type, _PASS_RATE_CHECK)
+            gate_passed = not _gate_blocked(summary, thresholds, gate_checks)
 
             run.status = RunStatus.COMPLETED if gate_passed else RunStatus.GATE_BLOCKED
             run.overall_passed = gate_passed
@@ -376,7 +676,9 @@ def run_evaluation(self, run_id: str, metrics: list[str]) -> dict:
                     budget.exceeded_reason if budget else "budget_exceeded"
                 )
                 summary["cases_evaluated"] = len(results)
-                summary["cases_total"] = len(test_cases)
+                summary["cases_total"] = db.scalar(
+                    select(func.count()).where(TestCase.test_set_id == run.test_set_id)
+                )
             run.summary_metrics = summary
 
             # Persist the reproducibility manifest + budget summary.
@@ -388,71 +690,69 @@ def run_evaluation(self, run_id: str, metrics: list[str]) -> dict:
                 run.budget_summary = budget.summary()
 
             # ── Metrics history ───────────────────────────────────────────
-            # Write all avg_* keys to metrics history for trend tracking
-            for summary_key, value in summary.items():
-                if summary_key.startswith("avg_") and value is not None:
-                    metric_name = summary_key[4:]  # strip "avg_" prefix
-                    db.add(MetricsHistory(
-                        test_set_id=run.test_set_id,
-                        run_id=run.id,
-                        metric_name=metric_name,
-                        metric_value=value,
-                        pipeline_version=run.pipeline_version,
-                        git_commit_sha=run.git_commit_sha,
-                    ))
-            # Always write pass_rate
+            # Write all avg_* keys (plus pass_rate) to metrics history for
+            # trend tracking, as one multi-row INSERT.
+            history = {
+                summary_key[4:]: value  # strip "avg_" prefix
+                for summary_key, value in summary.items()
+                if summary_key.startswith("avg_") and value is not None
+            }
             if summary.get("pass_rate") is not None:
-                db.add(MetricsHistory(
-                    test_set_id=run.test_set_id,
-                    run_id=run.id,
-                    metric_name="pass_rate",
-                    metric_value=summary["pass_rate"],
-                    pipeline_version=run.pipeline_version,
-                    git_commit_sha=run.git_commit_sha,
-                ))
-
-            # ── Alerting ─────────────────────────────────────────────────
-            try:
-                ts_row = db.execute(
-                    select(TestSet).where(TestSet.id == run.test_set_id)
-                ).scalar_one_or_none()
-                ts_name = ts_row.name if ts_row else str(run.test_set_id)
-
-                # Threshold breach alerts (gate failures)
-                if not gate_passed and thresholds:
-                    AlertService.check_and_alert(
-                        run_id=run_id,
-                        test_set_name=ts_name,
-                        pipeline_version=run.pipeline_version,
-                        summary_metrics=summary,
-                        thresholds=thresholds,
-                    )
-
-                # Completion alert (all runs, or failures only based on config)
-                AlertService.send_completion_alert(
-                    run_id=run_id,
-                    test_set_name=ts_name,
-                    pipeline_version=run.pipeline_version,
-                    summary_metrics=summary,
-                    gate_passed=gate_passed,
+                history["pass_rate"] = summary["pass_rate"]
+            if history:
+                db.execute(
+                    insert(MetricsHistory),
+                    [
+                        {
+                            "test_set_id": run.test_set_id,
+                            "run_id": run.id,
+                            "metric_name": metric_name,
+                            "metric_value": value,
+                            "pipeline_version": run.pipeline_version,
+                            "git_commit_sha": run.git_commit_sha,
+                        }
+                        for metric_name, value in history.items()
+                    ],
                 )
-            except Exception as exc:
-                print(f"[warn] Alert dispatch failed: {exc}")
-
-            db.commit()
 
             # Capture return values while still inside session
+            pipeline_version = run.pipeline_version
             final_status = run.status.value
             final_total = total
             final_passed = passed_count
             final_gate = gate_passed
 
+            db.commit()
+
+        # ── Alerting ─────────────────────────────────────────────────────
+        # After the commit: alerts only queue send_alert_webhook tasks, and
+        # nothing here may hold the finished run's transaction open.
+        try:
+            # Threshold breach alerts (gate failures)
+            if not gate_passed and thresholds:
+                AlertService.check_and_alert(
+                    run_id=run_id,
+                    test_set_name=ts_name,
+                    pipeline_version=pipeline_version,
+                    summary_metrics=summary,
+                    thresholds=thresholds,
+                )
+
+            # Completion alert (all runs, or failures only based on config)
+            AlertService.send_completion_alert(
+                run_id=run_id,
+                test_set_name=ts_name,
+                pipeline_version=pipeline_version,
+                summary_metrics=summary,
+                gate_passed=gate_passed,
+            )
+        except Exception as exc:
+            logger.warning("Alert dispatch failed", exc_info=exc)
+
     finally:
-        if pipeline is not None:
-            try:
-                pipeline.teardown()
-            except Exception:
-                pass
+        # Cached adapters are torn down on worker shutdown instead.
+        if pipeline is not None and not getattr(pipeline, "reusable", False):
+            _teardown_adapter(pipeline)
 
     return {
         "run_id": run_id,
@@ -463,24 +763,78 @@ def run_evaluation(self, run_id: str, metrics: list[str]) -> dict:
     }
 
 
+def _call_pipeline(tc: TestCase, pipeline=None) -> _PipelineCall:
+    """Run the pipeline for one test case, falling back to stored text.
+
+    Never raises: errors are captured on the returned record, so a failing
+    case can't take down its siblings in the worker's thread pool.
+    """
+    start = time.monotonic()
+    # No pipeline (or a failed call) — use stored ground truth as a stand-in
+    # answer so evaluators can still score.
+    call = _PipelineCall(
+        raw_output=tc.expected_output or tc.ground_truth or "",
+        raw_contexts=tc.context or [],
+    )
+    if pipeline is not None:
+        try:
+            output = pipeline.run(tc.query, tc.context or {})
+            call = _PipelineCall(
+                raw_output=output.answer,
+                raw_contexts=output.retrieved_contexts,
+                tool_calls_data=[
+                    {"tool": tc_call.tool, "args": tc_call.args, "result": tc_call.result}
+                    for tc_call in output.tool_calls
+                ],
+                pipeline_output=output,
+            )
+        except Exception as exc:
+            call.failure_reason = f"Pipeline error: {exc}"
+    call.elapsed_s = time.monotonic() - start
+    return call
+
+
+class _Serialized:
+    """Proxy that serialises method calls on a shared runner object.
+
+    ``Manifest.record_evaluator`` and ``Budget.record`` do unguarded
+    read-modify-writes; scoring threads go through this instead.
+    """
+
+    def __init__(self, target):
+        self._target = target
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+
+        def locked(*args, **kwargs):
+            with self._lock:
+                return attr(*args, **kwargs)
+
+        return locked
+
+
 def _evaluate_test_case(
     tc: TestCase,
     run: EvaluationRun,
     metrics: list[str],
-    db: Session,
-    pipeline=None,
+    call: _PipelineCall,
     system_type: str = "rag",
+    ragas_outcome: dict | Exception | None = None,
     manifest=None,
     budget=None,
-) -> EvaluationResult:
-    """Score a single test case using the pipeline + system-specific evaluator.
-
-    ``manifest`` and ``budget`` are optional runner-side objects used for
-    reproducibility + cost control. When present we record the evaluators
-    used and tick the budget with any per-case cost returned by evaluators.
+) -> _CaseResult:
+    """Score a single test case from its pipeline call + system-specific evaluator.
+
+    ``ragas_outcome`` is this case's row of the run-wide Ragas batch (scores,
+    or the exception the batch raised). ``manifest`` and ``budget`` are
+    optional runner-side objects used for reproducibility + cost control.
+    When present we record the evaluators used and tick the budget with any
+    per-case cost returned by evaluators.
     """
-    import time
-
     start = time.monotonic()
 
     faithfulness = None
@@ -489,85 +843,43 @@ def _evaluate_test_case(
     context_recall = None
     rules_passed = None
     rules_detail = []
-    failure_reason = None
-    raw_output = None
-    raw_contexts: list[str] = []
-    tool_calls_data: list[dict] = []
     extended_metrics: dict | None = None
-    pipeline_output = None
-
-    # ── Step 1: call the pipeline ──────────────────────────────────────
-    if pipeline is not None:
-        try:
-            output = pipeline.run(tc.query, tc.context or {})
-            pipeline_output = output
-            raw_output = output.answer
-            raw_contexts = output.retrieved_contexts
-            tool_calls_data = [
-                {"tool": tc_call.tool, "args": tc_call.args, "result": tc_call.result}
-                for tc_call in output.tool_calls
-            ]
-        except Exception as exc:
-            failure_reason = f"Pipeline error: {exc}"
-            # Fall back to stored text so evaluators can still score
-            raw_output = tc.expected_output or tc.ground_truth or ""
-            raw_contexts = tc.context or []
-    else:
-        # No pipeline — use stored ground truth as a stand-in answer
-        raw_output = tc.expected_output or tc.ground_truth or ""
-        raw_contexts = tc.context or []
+    failure_reason = call.failure_reason
+    raw_output = call.raw_output
+    raw_contexts = call.raw_contexts
+    tool_calls_data = call.tool_calls_data
+    pipeline_output = call.pipeline_output
+    nothing_to_score = False
 
     # ── Step 2: System-specific evaluation ─────────────────────────────
 
-    def _nan_to_none(v):
-        if v is None:
-            return None
-        try:
-            return None if (math.isnan(v) or math.isinf(v)) else float(v)
-        except (TypeError, ValueError):
-            return None
-
     if system_type == "rag":
-        # Ragas evaluation for RAG systems
-        if any(m in metrics for m in ("faithfulness", "answer_relevancy", "context_precision", "context_recall")):
-            try:
-                scores = _run_ragas(tc, metrics, answer=raw_output, contexts=raw_contexts)
-                faithfulness = _nan_to_none(scores.get("faithfulness"))
-                answer_relevancy = _nan_to_none(scores.get("answer_relevancy"))
-                context_precision = _nan_to_none(scores.get("context_precision"))
-                context_recall = _nan_to_none(scores.get("context_recall"))
-                if manifest is not None:
-                    _record_evaluator(manifest, "runner.evaluators.ragas_evaluator", "RagasEvaluator")
-            except Exception as exc:
-                if failure_reason is None:
-                    failure_reason = f"Ragas evaluation failed: {exc}"
+        # Ragas scores come from the run-wide batch in run_evaluation
+        if isinstance(ragas_outcome, Exception):
+            if failure_reason is None:
+                failure_reason = f"Ragas evaluation failed: {ragas_outcome}"
+        elif ragas_outcome:
+            faithfulness = _nan_to_none(ragas_outcome.get("faithfulness"))
+            answer_relevancy = _nan_to_none(ragas_outcome.get("answer_relevancy"))
+            context_precision = _nan_to_none(ragas_outcome.get("context_precision"))
+            context_recall = _nan_to_none(ragas_outcome.get("context_recall"))
+        elif any(m in _RAGAS_METRICS for m in metrics) and not _has_ragas_input(tc, call):
+            # Left out of the Ragas batch: there is nothing to judge.
+            nothing_to_score = True
+            if failure_reason is None:
+                failure_reason = "Empty pipeline output: no answer or contexts to score"
 
     elif system_type == "agent":
         # Agent evaluator: tool call F1, accuracy, goal, efficiency
         try:
-            from runner.evaluators.agent_evaluator import AgentEvaluator
-            agent_eval = AgentEvaluator()
+            agent_eval = _get_evaluator("agent")
 
             # Map pipeline tool_calls format to evaluator format
             predicted_calls = [
                 {"name": tc_call.get("tool", ""), "arguments": tc_call.get("args")}
                 for tc_call in tool_calls_data
             ]
-            # Expected tool calls from test case (stored in failure_rules or context)
-            expected_calls = []
-            if tc.context and isinstance(tc.context, dict):
-                expected_calls = tc.context.get("expected_tool_calls", [])
-            elif tc.context and isinstance(tc.context, list):
-                # Try to find expected_tool_calls in context items
-                for item in tc.context:
-                    if isinstance(item, dict) and "expected_tool_calls" in item:
-                        expected_calls = item["expected_tool_calls"]
-                        break
-            # Also check failure_rules for expected tool info
-            if not expected_calls and tc.failure_rules:
-                for rule in tc.failure_rules:
-                    if rule.get("type") == "must_call_tool":
-                        expected_calls.append({"name": rule.get("tool", "")})
+            expected_calls = _expected_tool_calls(tc)
 
             scores = agent_eval.evaluate(
                 predicted_tool_calls=predicted_calls,
@@ -587,8 +899,7 @@ def _evaluate_test_case(
     elif system_type == "chatbot":
         # Conversation evaluator: coherence, retention, role adherence, relevance
         try:
-            from runner.evaluators.conversation_evaluator import ConversationEvaluator
-            conv_eval = ConversationEvaluator()
+            conv_eval = _get_evaluator("conversation")
 
             # Evaluate each test case independently: use only the current
             # query + response pair. The chatbot adapter accumulates history
@@ -620,8 +931,7 @@ def _evaluate_test_case(
     elif system_type == "search":
         # Ranking evaluator: NDCG, MAP, MRR, Precision, Recall
         try:
-            from runner.evaluators.ranking_evaluator import RankingEvaluator
-            rank_eval = RankingEvaluator(k=5)
+            rank_eval = _get_evaluator("ranking")
 
             # Get predicted ranking from pipeline output metadata
             predicted_ranking = []
@@ -629,11 +939,9 @@ def _evaluate_test_case(
                 predicted_ranking = pipeline_output.metadata.get("ranked_ids", [])
             elif raw_contexts:
                 # Extract doc IDs from context strings like "[doc-001] Title: content"
-                import re
-                for ctx in raw_contexts:
-                    match = re.match(r"\[([\w-]+)\]", ctx)
-                    if match:
-                        predicted_ranking.append(match.group(1))
+                predicted_ranking = [
+                    m.group(1) for ctx in raw_contexts if (m := _CTX_ID_RE.match(ctx))
+                ]
 
             # Expected ranking from test case
             expected_ranking = tc.expected_ranking or []
@@ -659,8 +967,7 @@ def _evaluate_test_case(
     elif system_type == "code_gen":
         # Code evaluator: syntax validity, code-block presence, security scan
         try:
-            from runner.evaluators.code_evaluator import CodeEvaluator
-            code_eval = CodeEvaluator()
+            code_eval = _get_evaluator("code")
 
             # Optional unit-test outcomes stored on the test case enable pass@k
             test_results = None
@@ -684,8 +991,7 @@ def _evaluate_test_case(
     elif system_type == "classification":
         # Classification evaluator: per-case precision/recall/F1/accuracy
         try:
-            from runner.evaluators.classification_evaluator import ClassificationEvaluator
-            cls_eval = ClassificationEvaluator()
+            cls_eval = _get_evaluator("classification")
 
             expected = tc.expected_labels or tc.expected_output or tc.ground_truth
             if expected:
@@ -707,10 +1013,7 @@ def _evaluate_test_case(
     elif system_type == "summarization":
         # Similarity evaluator: ROUGE / BLEU / semantic similarity vs reference
         try:
-            from runner.evaluators.similarity_evaluator import SimilarityEvaluator
-            sim_eval = SimilarityEvaluator(
-                openai_api_key=getattr(settings, "OPENAI_API_KEY", None),
-            )
+            sim_eval = _get_evaluator("similarity")
 
             reference = tc.expected_output or tc.ground_truth
             if reference:
@@ -730,8 +1033,7 @@ def _evaluate_test_case(
     elif system_type == "translation":
         # Translation evaluator: sacreBLEU / chrF++ / TER vs reference
         try:
-            from runner.evaluators.translation_evaluator import TranslationEvaluator
-            trans_eval = TranslationEvaluator()
+            trans_eval = _get_evaluator("translation")
 
             reference = tc.expected_output or tc.ground_truth
             if reference:
@@ -797,13 +1099,12 @@ def _evaluate_test_case(
         # run_registry_evaluators swallows per-evaluator errors; reaching
         # here means something broke at the dispatch layer itself. Log but
         # don't fail the case.
-        print(f"[warn] Registry dispatch failed: {exc}")
+        logger.warning("Registry dispatch failed", exc_info=exc)
 
     # ── Step 3: Rule evaluation ────────────────────────────────────────
     if "rule_evaluation" in metrics and tc.failure_rules:
         try:
-            from runner.evaluators.rule_evaluator import RuleEvaluator
-            rule_eval = RuleEvaluator()
+            rule_eval = _get_evaluator("rule")
             if manifest is not None:
                 _record_evaluator(manifest, "runner.evaluators.rule_evaluator", "RuleEvaluator")
             rule_result = rule_eval.evaluate_single(
@@ -829,21 +1130,12 @@ def _evaluate_test_case(
     # decisions, not individual cases — a single quirky metric (e.g.
     # Ragas faithfulness=0.0 for a correct answer, or answer_relevancy=0.0
     # for a valid refusal) should not fail an otherwise correct case.
+    #
+    # RAG composites are applied to the whole run at once by
+    # _apply_rag_composite(); other system types are checked here.
     per_case_passed = True
-    COMPOSITE_THRESHOLD = 0.5  # minimum composite average to pass
 
-    if system_type == "rag":
-        metric_values = [
-            v for v in [faithfulness, answer_relevancy, context_precision, context_recall]
-            if v is not None
-        ]
-        if metric_values:
-            composite = sum(metric_values) / len(metric_values)
-            if composite < COMPOSITE_THRESHOLD:
-                per_case_passed = False
-                if failure_reason is None:
-                    failure_reason = f"Composite metric average {composite:.3f} below {COMPOSITE_THRESHOLD}"
-    elif extended_metrics:
+    if system_type != "rag" and extended_metrics:
         metric_values = [v for v in extended_metrics.values() if v is not None]
         if metric_values:
             composite = sum(metric_values) / len(metric_values)
@@ -852,12 +1144,14 @@ def _evaluate_test_case(
                 if failure_reason is None:
                     failure_reason = f"Composite metric average {composite:.3f} below {COMPOSITE_THRESHOLD}"
 
-    if rules_passed is False:
+    if rules_passed is False or nothing_to_score:
         per_case_passed = False
 
-    duration_ms = int((time.monotonic() - start) * 1000)
+    duration_ms = int((call.elapsed_s + time.monotonic() - start) * 1000)
 
-    result = EvaluationResult(
+    # run_evaluation bulk-inserts all results at once.
+    return _CaseResult(
+        id=uuid.uuid4(),
         run_id=run.id,
         test_case_id=tc.id,
         faithfulness=faithfulness,
@@ -869,23 +1163,211 @@ def _evaluate_test_case(
         passed=per_case_passed,
         failure_reason=failure_reason,
         raw_output=raw_output,
-        raw_contexts=raw_contexts,
+        raw_contexts=_cap_contexts(raw_contexts),
         tool_calls=tool_calls_data if tool_calls_data else None,
         extended_metrics=extended_metrics,
         duration_ms=duration_ms,
     )
-    db.add(result)
-    db.flush()
-    return result
 
 
-def _run_ragas(
-    tc: TestCase,
+def _expected_tool_calls(tc: TestCase) -> list[dict]:
+    """Expected tool calls for an agent case: ``expected_tool_calls`` from its
+    context (a dict, or the first list item carrying the key), else one
+    entry per ``must_call_tool`` failure rule."""
+    context = tc.context
+    if isinstance(context, dict):
+        expected = context.get("expected_tool_calls")
+    elif isinstance(context, list):
+        expected = next(
+            (item["expected_tool_calls"] for item in context
+             if isinstance(item, dict) and "expected_tool_calls" in item),
+            None,
+        )
+    else:
+        expected = None
+    if expected:
+        return list(expected)
+    return [
+        {"name": rule.get("tool", "")}
+        for rule in tc.failure_rules or []
+        if rule.get("type") == "must_call_tool"
+    ]
+
+
+def _nan_to_none(v) -> float | None:
+    """``v`` as a float; None if it's missing, non-numeric, NaN or inf."""
+    try:
+        return float(v) if math.isfinite(v) else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _gate_blocked(
+    summary: dict, thresholds: dict, gate_checks: tuple[tuple[str, str], ...]
+) -> bool:
+    """True if any thresholded summary metric falls below its threshold.
+    Metrics without a threshold or a summary value never block."""
+    return any(
+        (threshold := thresholds.get(metric_key)) is not None
+        and (actual := summary.get(summary_key)) is not None
+        and actual < threshold
+        for metric_key, summary_key in gate_checks
+    )
+
+
+def _finite_mean(values: list) -> float | None:
+    """Mean of the finite numeric values (None, NaN, inf and non-numbers are
+    skipped; bools count as 0/1); None when nothing is left."""
+    numeric = [v for v in values if isinstance(v, (int, float))]
+    arr = np.fromiter(numeric, dtype=np.float64, count=len(numeric))
+    arr = arr[np.isfinite(arr)]
+    return float(arr.mean()) if arr.size else None
+
+
+def _extended_averages(results: list[_CaseResult]) -> dict[str, float]:
+    """Per-key ``_finite_mean`` over the results' extended_metrics; keys with
+    no finite values are left out."""
+    rows = [r.extended_metrics for r in results if r.extended_metrics]
+    keys = list(dict.fromkeys(key for row in rows for key in row))
+    # (cases x keys) matrix, NaN where a case lacks a key or its value isn't
+    # a finite number, reduced column-wise in one pass.
+    column = {key: j for j, key in enumerate(keys)}
+    scores = np.full((len(rows), len(keys)), np.nan)
+    for i, row in enumerate(rows):
+        for key, value in row.items():
+            if isinstance(value, (int, float)):
+                scores[i, column[key]] = value
+    present = np.isfinite(scores)
+    counts = present.sum(axis=0)
+    sums = np.where(present, scores, 0.0).sum(axis=0)
+    return {key: float(sums[j] / counts[j]) for j, key in enumerate(keys) if counts[j]}
+
+
+def _cap_contexts(contexts):
+    """Trim contexts to what's worth storing on an EvaluationResult row."""
+    if not isinstance(contexts, list):
+        return contexts
+    return [
+        c[:MAX_CONTEXT_CHARS] if isinstance(c, str) else c
+        for c in contexts[:MAX_STORED_CONTEXTS]
+    ]
+
+
+def _rag_composites(results: list[_CaseResult]) -> list[float | None]:
+    """Mean of each result's non-null Ragas scores (None if it has none)."""
+    rows = [
+        [r.faithfulness, r.answer_relevancy, r.context_precision, r.context_recall]
+        for r in results
+    ]
+    scores = np.array(rows, dtype=np.float64)  # None -> NaN
+    counts = (~np.isnan(scores)).sum(axis=1)
+    means = np.nansum(scores, axis=1) / np.maximum(counts, 1)
+    return [float(m) if c else None for m, c in zip(means, counts)]
+
+
+def _apply_rag_composite(results: list[_CaseResult]) -> None:
+    """Fail RAG cases whose composite score is below COMPOSITE_THRESHOLD."""
+    for result, composite in zip(results, _rag_composites(results)):
+        if composite is not None and composite < COMPOSITE_THRESHOLD:
+            result.passed = False
+            if result.failure_reason is None:
+                result.failure_reason = (
+                    f"Composite metric average {composite:.3f} below {COMPOSITE_THRESHOLD}"
+                )
+
+
+def _ragas_inputs(tc: TestCase, call: _PipelineCall) -> tuple[str, list, str]:
+    """(answer, contexts, ground_truth) as fed to Ragas for one case."""
+    answer = call.raw_output or tc.expected_output or tc.ground_truth or ""
+    return answer, call.raw_contexts or tc.context or [""], tc.ground_truth or ""
+
+
+def _has_ragas_input(tc: TestCase, call: _PipelineCall) -> bool:
+    """False when both the answer and every context Ragas would see are
+    blank, so an LLM judge call could only return noise."""
+    answer, contexts, _ = _ragas_inputs(tc, call)
+    return bool(answer.strip()) or any(c.strip() if isinstance(c, str) else c for c in contexts)
+
+
+def _ragas_judge_id() -> str:
+    """Which LLM Ragas judges with, so a provider/model switch misses the cache."""
+    try:
+        from runner.evaluators.ragas_evaluator import ragas_judge_id
+        return ragas_judge_id()
+    except Exception:
+        return "unknown"
+
+
+def _ragas_cache_key(
+    tc: TestCase, call: _PipelineCall, requested: list[str],
+    pipeline_version: str | None, judge: str,
+) -> str:
+    answer, contexts, ground_truth = _ragas_inputs(tc, call)
+    payload = json.dumps(
+        [str(tc.id), pipeline_version, judge, requested, answer, contexts, ground_truth],
+        sort_keys=True, default=str,
+    )
+    return "ragas:" + hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _cacheable_ragas_row(row: dict, requested: list[str]) -> bool:
+    """Only complete, finite rows are cached. Ragas turns judge failures
+    (timeouts, 429s, unparseable output) into NaN; caching those would pin a
+    transient failure until the TTL expires."""
+    return bool(requested) and all(
+        isinstance(v := row.get(m), (int, float)) and math.isfinite(v) for m in requested
+    )
+
+
+def _run_ragas_cached(
+    test_cases: list[TestCase],
+    calls: list[_PipelineCall],
+    metrics: list[str],
+    pipeline_version: str | None,
+) -> list[dict]:
+    """``_run_ragas_batch`` behind the Redis score cache.
+
+    Hits are served from Redis; the misses go to Ragas as one batch and rows
+    with a finite score for every requested metric are written back. Redis
+    errors degrade to an uncached run.
+    """
+    requested = sorted(m for m in metrics if m in _RAGAS_METRICS)
+    judge = _ragas_judge_id()
+    keys = [
+        _ragas_cache_key(tc, call, requested, pipeline_version, judge)
+        for tc, call in zip(test_cases, calls)
+    ]
+    try:
+        cached = _redis.mget(keys)
+    except redis.RedisError:
+        logger.warning("Ragas cache read failed; scoring uncached", exc_info=True)
+        cached = [None] * len(keys)
+
+    scores: list[dict | None] = [json.loads(v) if v is not None else None for v in cached]
+    misses = [i for i, v in enumerate(scores) if v is None]
+    if misses:
+        fresh = _run_ragas_batch(
+            [test_cases[i] for i in misses], [calls[i] for i in misses], metrics,
+        )
+        pipe = _redis.pipeline(transaction=False)
+        for i, row in zip(misses, fresh):
+            scores[i] = row
+            if _cacheable_ragas_row(row, requested):
+                pipe.setex(keys[i], _RAGAS_CACHE_TTL_S, json.dumps(row))
+        try:
+            pipe.execute()
+        except redis.RedisError:
+            logger.warning("Ragas cache write failed", exc_info=True)
+    return scores
+
+
+def _run_ragas_batch(
+    test_cases: list[TestCase],
+    calls: list[_PipelineCall],
     metrics: list[str],
-    answer: str = "",
-    contexts: Optional[list[str]] = None,
-) -> dict:
-    """Run Ragas evaluation for a single test case. Returns metric scores.
+) -> list[dict]:
+    """Run Ragas over every case in one ``evaluate`` call. Returns one score
+    dict per case, in input order.
 
     Honours the active LLM provider: when OPENROUTER_API_KEY / LLM_PROVIDER
     routing is configured, we wrap Ragas' internal LLM via
@@ -918,22 +1400,22 @@ def _run_ragas(
     }
     active_metrics = [metric_map[m] for m in metrics if m in metric_map]
     if not active_metrics:
-        return {}
+        return [{} for _ in test_cases]
 
-    eval_contexts = contexts if contexts else (tc.context if tc.context else [""])
-    if not eval_contexts:
-        eval_contexts = [""]
+    data: dict[str, list] = {"question": [], "answer": [], "contexts": [], "ground_truth": []}
+    for tc, call in zip(test_cases, calls):
+        answer, contexts, ground_truth = _ragas_inputs(tc, call)
+        data["question"].append(tc.query)
+        data["answer"].append(answer)
+        data["contexts"].append(contexts)
+        data["ground_truth"].append(ground_truth)
 
-    data = {
-        "question": [tc.query],
-        "answer": [answer or tc.expected_output or tc.ground_truth or ""],
-        "contexts": [eval_contexts],
-        "ground_truth": [tc.ground_truth or ""],
-    }
     dataset = Dataset.from_dict(data)
     kwargs = {"dataset": dataset, "metrics": active_metrics}
     if ragas_llm is not None:
         kwargs["llm"] = ragas_llm
     result = ragas_evaluate(**kwargs)
-    scores = result.to_pandas().iloc[0].to_dict()
-    return {k: float(v) for k, v in scores.items() if k in metric_map}
+    return [
+        {k: float(v) for k, v in row.items() if k in metric_map}
+        for row in result.to_pandas().to_dict("records")
+    ]
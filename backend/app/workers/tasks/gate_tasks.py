@@ -0,0 +1,44 @@
+"""
+Celery task for off-request release-gate computation.
+
+``evaluate_gate`` and ``compute_regression_diff`` fan out into several
+aggregate queries; callers that don't need the answer inline enqueue this
+task and poll the result backend instead of holding an API request open.
+"""
+
+import asyncio
+import uuid
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core import serialization
+from app.core.config import settings
+from app.services.release_gate_service import ReleaseGateService
+from app.workers.celery_app import celery_app
+
+
+async def _compute(run_id: uuid.UUID) -> dict:
+    # Each task runs in a fresh event loop, so it can't borrow pooled asyncpg
+    # connections from the API engine — use an unpooled engine of its own.
+    engine = create_async_engine(
+        settings.DATABASE_URL,
+        poolclass=NullPool,
+        json_serializer=serialization.dumps_str,
+        json_deserializer=serialization.loads,
+    )
+    sessions = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    try:
+        async with sessions() as db:
+            service = ReleaseGateService(db, session_factory=sessions)
+            gate = await service.evaluate_gate(run_id)
+            diff = await service.compute_regression_diff(run_id)
+        return {"gate": gate, "diff": diff.model_dump(mode="json")}
+    finally:
+        await engine.dispose()
+
+
+@celery_app.task(name="app.workers.tasks.gate_tasks.compute_release_gate")
+def compute_release_gate(run_id: str) -> dict:
+    """Compute the gate decision and regression diff for a finished run."""
+    return asyncio.run(_compute(uuid.UUID(run_id)))
@@ -4,10 +4,11 @@ Celery tasks for auto-evaluating sampled production traffic.
 Runs periodically (via Celery Beat) to find sampled-but-unevaluated
 production test cases and trigger evaluation runs for them.
 """
+
 import uuid
-from datetime import datetime, timezone
 
-from sqlalchemy import and_, create_engine, func, select, update
+from sqlalchemy import and_, column, insert, select, update, values
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Session
 
 from app.core.config import settings
@@ -16,6 +17,15 @@ from app.db.models.production_log import IngestionStatus, ProductionLog
 from app.db.models.test_case import TestCase
 from app.db.models.test_set import TestSet
 from app.workers.celery_app import celery_app
+from app.workers.db import engine
+
+_SAMPLED_TRAFFIC_METRICS = (
+    "faithfulness",
+    "answer_relevancy",
+    "context_precision",
+    "context_recall",
+    "rule_evaluation",
+)
 
 
 @celery_app.task(name="app.workers.tasks.ingestion_tasks.evaluate_sampled_traffic")
@@ -24,79 +34,81 @@ def evaluate_sampled_traffic() -> dict:
     Periodic task: find all sampled production logs that haven't been
     evaluated yet, group them by test set, and trigger evaluation runs.
     """
-    engine = create_engine(settings.SYNC_DATABASE_URL, pool_pre_ping=True)
-    runs_created = 0
-
     with Session(engine) as db:
-        # Find test sets that have sampled-but-unevaluated production logs
-        test_set_ids = db.execute(
+        # Test sets with sampled-but-unevaluated production logs and at least
+        # one test case, in one query instead of a COUNT per set. The sampled
+        # side is served by ix_production_logs_sampled_test_set (migration 009).
+        sampled_sets = (
             select(ProductionLog.sampled_into_test_set_id)
             .where(ProductionLog.status == IngestionStatus.SAMPLED)
             .where(ProductionLog.sampled_into_test_set_id.isnot(None))
-            .group_by(ProductionLog.sampled_into_test_set_id)
-        ).scalars().all()
-
-        for ts_id in test_set_ids:
-            if ts_id is None:
-                continue
-
-            # Count pending cases
-            case_count = db.execute(
-                select(func.count()).select_from(TestCase).where(
-                    TestCase.test_set_id == ts_id
-                )
-            ).scalar() or 0
+            .distinct()
+        )
+        test_set_ids = (
+            db.execute(
+                select(TestCase.test_set_id)
+                .where(TestCase.test_set_id.in_(sampled_sets))
+                .distinct()
+            )
+            .scalars()
+            .all()
+        )
 
-            if case_count == 0:
-                continue
+        if not test_set_ids:
+            return {"runs_created": 0}
 
-            # Create evaluation run
-            threshold_snapshot = {
-                "faithfulness": settings.DEFAULT_FAITHFULNESS_THRESHOLD,
-                "answer_relevancy": settings.DEFAULT_ANSWER_RELEVANCY_THRESHOLD,
-                "context_precision": settings.DEFAULT_CONTEXT_PRECISION_THRESHOLD,
-                "context_recall": settings.DEFAULT_CONTEXT_RECALL_THRESHOLD,
-                "pass_rate": settings.DEFAULT_PASS_RATE_THRESHOLD,
+        threshold_snapshot = {
+            "faithfulness": settings.DEFAULT_FAITHFULNESS_THRESHOLD,
+            "answer_relevancy": settings.DEFAULT_ANSWER_RELEVANCY_THRESHOLD,
+            "context_precision": settings.DEFAULT_CONTEXT_PRECISION_THRESHOLD,
+            "context_recall": settings.DEFAULT_CONTEXT_RECALL_THRESHOLD,
+            "pass_rate": settings.DEFAULT_PASS_RATE_THRESHOLD,
+        }
+        runs = [
+            {
+                "id": uuid.uuid4(),
+                "test_set_id": ts_id,
+                "status": RunStatus.PENDING,
+                "triggered_by": "auto-sample",
+                "gate_threshold_snapshot": threshold_snapshot,
             }
+            for ts_id in test_set_ids
+        ]
+        db.execute(insert(EvaluationRun), runs)
 
-            run = EvaluationRun(
-                id=uuid.uuid4(),
-                test_set_id=ts_id,
-                status=RunStatus.PENDING,
-                triggered_by="auto-sample",
-                gate_threshold_snapshot=threshold_snapshot,
-            )
-            db.add(run)
-            db.flush()
-
-            # Mark production logs as evaluated
-            db.execute(
-                update(ProductionLog)
-                .where(
-                    and_(
-                        ProductionLog.sampled_into_test_set_id == ts_id,
-                        ProductionLog.status == IngestionStatus.SAMPLED,
-                    )
-                )
-                .values(
-                    status=IngestionStatus.EVALUATED,
-                    evaluation_run_id=run.id,
+        # Mark every set's production logs as evaluated in one UPDATE ... FROM
+        # (VALUES (test_set_id, run_id), ...).
+        run_for_set = values(
+            column("test_set_id", UUID(as_uuid=True)),
+            column("run_id", UUID(as_uuid=True)),
+            name="run_for_set",
+        ).data([(run["test_set_id"], run["id"]) for run in runs])
+        db.execute(
+            update(ProductionLog)
+            .where(
+                and_(
+                    ProductionLog.sampled_into_test_set_id == run_for_set.c.test_set_id,
+                    ProductionLog.status == IngestionStatus.SAMPLED,
                 )
             )
-            db.commit()
+            .values(
+                status=IngestionStatus.EVALUATED,
+                evaluation_run_id=run_for_set.c.run_id,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
 
-            # Dispatch evaluation
-            from app.workers.tasks.evaluation_tasks import run_evaluation
-            run_evaluation.apply_async(
-                args=[str(run.id), [
-                    "faithfulness",
-                    "answer_relevancy",
-                    "context_precision",
-                    "context_recall",
-                    "rule_evaluation",
-                ]],
-                queue="evaluations",
+    # Dispatch all runs by task name over one broker connection (routed to the
+    # evaluations queue by celery_app.task_routes). Sending by name skips
+    # building a signature per run and keeps this short task from importing
+    # the evaluation module and its scoring dependencies.
+    with celery_app.producer_or_acquire() as producer:
+        for run in runs:
+            celery_app.send_task(
+                "app.workers.tasks.evaluation_tasks.run_evaluation",
+                args=[str(run["id"]), _SAMPLED_TRAFFIC_METRICS],
+                producer=producer,
             )
-            runs_created += 1
 
-    return {"runs_created": runs_created}
+    return {"runs_created": len(runs)}
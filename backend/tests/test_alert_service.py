@@ -0,0 +1,145 @@
+"""Unit tests for the Slack alert payload builders.
+
+The webhook POST is monkeypatched out so these run without network access
+or an ``ALERT_WEBHOOK_URL``; we only pin the breach detection and the
+Block Kit text the team reads in Slack."""
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT))
+
+from app.services import alert_service  # noqa: E402
+from app.services.alert_service import AlertService  # noqa: E402
+
+
+def _capture_posts(monkeypatch) -> list[dict]:
+    sent: list[dict] = []
+    monkeypatch.setattr(alert_service.settings, "ALERT_WEBHOOK_URL", "https://hooks.example/x")
+    monkeypatch.setattr(AlertService, "_post_webhook", staticmethod(sent.append))
+    return sent
+
+
+def test_check_and_alert_reports_only_breached_metrics(monkeypatch):
+    sent = _capture_posts(monkeypatch)
+    breaches = AlertService.check_and_alert(
+        run_id="12345678-aaaa",
+        test_set_name="demo",
+        pipeline_version="v1",
+        summary_metrics={"avg_faithfulness": 0.5, "avg_answer_relevancy": 0.9, "pass_rate": 0.6},
+        thresholds={"faithfulness": 0.7, "answer_relevancy": 0.7, "pass_rate": 0.8},
+    )
+    assert [b["metric"] for b in breaches] == ["Faithfulness", "Pass Rate"]
+    assert abs(breaches[0]["deficit"] - 0.2) < 1e-9
+    assert len(sent) == 1
+
+
+def test_breach_line_formatting(monkeypatch):
+    sent = _capture_posts(monkeypatch)
+    AlertService.check_and_alert(
+        run_id="12345678-aaaa",
+        test_set_name="demo",
+        pipeline_version=None,
+        summary_metrics={"avg_faithfulness": 0.5},
+        thresholds={"faithfulness": 0.7},
+    )
+    section = sent[0]["blocks"][2]["text"]["text"]
+    assert section == ":warning: *Faithfulness*: 50.00% (threshold 70.00%, deficit -20.00%)"
+
+
+def test_no_alert_when_all_metrics_pass(monkeypatch):
+    sent = _capture_posts(monkeypatch)
+    breaches = AlertService.check_and_alert(
+        run_id="12345678-aaaa",
+        test_set_name="demo",
+        pipeline_version=None,
+        summary_metrics={"avg_faithfulness": 0.9},
+        thresholds={"faithfulness": 0.7},
+    )
+    assert breaches == []
+    assert sent == []
+
+
+def test_bulk_check_builds_breaches_from_aggregate_rows(monkeypatch):
+    from decimal import Decimal
+    from types import SimpleNamespace
+
+    sent = _capture_posts(monkeypatch)
+    aggregates = {
+        "avg_faithfulness": 0.4, "avg_answer_relevancy": None,
+        "avg_context_precision": None, "avg_context_recall": None,
+        "pass_rate": Decimal("0.9"),  # avg over an integer cast comes back as numeric
+    }
+    row = SimpleNamespace(
+        run_id="run-1", pipeline_version="v2", test_set_name="demo", _mapping=aggregates,
+    )
+
+    class _DB:
+        def execute(self, stmt):
+            return [row]
+
+    out = AlertService.check_and_alert_bulk(
+        _DB(), ["run-1"], {"faithfulness": 0.7, "pass_rate": 0.8},
+    )
+    assert list(out) == ["run-1"]
+    assert [b["metric"] for b in out["run-1"]] == ["Faithfulness"]
+    assert len(sent) == 1
+
+
+def test_completion_alert_lists_every_avg_metric(monkeypatch):
+    sent = _capture_posts(monkeypatch)
+    AlertService.send_completion_alert(
+        run_id="12345678-aaaa",
+        test_set_name="demo",
+        pipeline_version="v1",
+        summary_metrics={
+            "total_cases": 4, "passed_cases": 2, "pass_rate": 0.5,
+            "avg_tool_call_f1": 0.75, "avg_goal_accuracy": None,
+        },
+        gate_passed=False,
+    )
+    fields = sent[0]["blocks"][2]["fields"]
+    assert fields == [{"type": "mrkdwn", "text": "*Tool Call F1*\n75.00%"}]
+
+
+def _mock_webhook(monkeypatch, handler) -> None:
+    import httpx
+
+    monkeypatch.setattr(alert_service.settings, "ALERT_WEBHOOK_URL", "https://hooks.example/x")
+    monkeypatch.setattr(
+        alert_service, "_webhook_client", httpx.Client(transport=httpx.MockTransport(handler)),
+    )
+
+
+def test_deliver_webhook_schedules_retry_after_429(monkeypatch):
+    import httpx
+
+    _mock_webhook(monkeypatch, lambda request: httpx.Response(429, headers={"Retry-After": "2"}))
+    assert alert_service.deliver_webhook({"text": "hi"}, attempt=0) == 2.0
+    # The last attempt gives up instead of scheduling another.
+    last = alert_service._WEBHOOK_MAX_ATTEMPTS - 1
+    assert alert_service.deliver_webhook({"text": "hi"}, attempt=last) is None
+
+
+def test_deliver_webhook_gives_up_on_client_error(monkeypatch):
+    import httpx
+
+    calls: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(1)
+        return httpx.Response(404)
+
+    _mock_webhook(monkeypatch, handler)
+    assert alert_service.deliver_webhook({"text": "hi"}, attempt=0) is None
+    assert len(calls) == 1
+
+
+def test_deliver_webhook_success_needs_no_retry(monkeypatch):
+    import httpx
+
+    _mock_webhook(monkeypatch, lambda request: httpx.Response(200))
+    assert alert_service.deliver_webhook({"text": "hi"}, attempt=0) is None
@@ -0,0 +1,120 @@
+"""Unit tests for the ingestion micro-batcher.
+
+``_write`` is replaced with an in-memory recorder, so these pin the
+coalescing, per-caller ack accounting, failure isolation, backpressure and
+shutdown without a database."""
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+import pytest
+from sqlalchemy.exc import SQLAlchemyError
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT))
+
+from app.api.v1.schemas.ingestion import ProductionLogIngest  # noqa: E402
+from app.core.exceptions import ServiceUnavailableError  # noqa: E402
+from app.services.ingestion_batcher import IngestionBatcher  # noqa: E402
+
+
+def _items(n: int, answer: str = "a") -> list[ProductionLogIngest]:
+    return [ProductionLogIngest(source="bot", query="q", answer=answer) for _ in range(n)]
+
+
+def _batcher(writes: list[list], **kwargs) -> IngestionBatcher:
+    batcher = IngestionBatcher(session_factory=None, **kwargs)
+
+    async def write(items):
+        writes.append(items)
+        if any(item.answer == "boom" for item in items):
+            raise SQLAlchemyError("bad row")
+        # Sample every other item so per-caller counts are checkable.
+        return [i % 2 == 0 for i in range(len(items))]
+
+    batcher._write = write
+    return batcher
+
+
+def test_concurrent_submissions_share_one_write():
+    writes: list[list] = []
+
+    async def scenario():
+        batcher = _batcher(writes, max_wait_ms=20)
+        batcher.start()
+        acks = await asyncio.gather(*(batcher.submit(_items(n)) for n in (1, 2, 3)))
+        await batcher.stop()
+        return acks
+
+    acks = asyncio.run(scenario())
+    assert [len(w) for w in writes] == [6]
+    assert [(a.ingested, a.sampled, a.skipped) for a in acks] == [(1, 1, 0), (2, 1, 1), (3, 1, 2)]
+
+
+def test_failing_submission_does_not_fail_its_neighbours():
+    writes: list[list] = []
+
+    async def scenario():
+        batcher = _batcher(writes, max_wait_ms=20)
+        batcher.start()
+        results = await asyncio.gather(
+            batcher.submit(_items(2)),
+            batcher.submit(_items(1, answer="boom")),
+            return_exceptions=True,
+        )
+        await batcher.stop()
+        return results
+
+    ok, failed = asyncio.run(scenario())
+    assert ok.ingested == 2
+    assert isinstance(failed, SQLAlchemyError)
+
+
+def test_full_queue_rejects_with_503():
+    async def scenario():
+        batcher = _batcher([], max_queued_items=2)  # consumer not started
+        with pytest.raises(ServiceUnavailableError):
+            await batcher.submit(_items(3))
+
+    asyncio.run(scenario())
+
+
+def test_submit_after_stop_is_rejected():
+    writes: list[list] = []
+
+    async def scenario():
+        batcher = _batcher(writes)
+        batcher.start()
+        await batcher.stop()
+        with pytest.raises(ServiceUnavailableError):
+            await batcher.submit(_items(1))
+
+    asyncio.run(scenario())
+    assert writes == []
+
+
+def test_consumer_crash_rejects_queued_submissions():
+    async def scenario():
+        batcher = _batcher([], max_wait_ms=0)
+
+        async def write(items):
+            raise KeyError("unexpected")
+
+        batcher._write = write
+        batcher.start()
+        results = await asyncio.gather(
+            batcher.submit(_items(1)),
+            batcher.submit(_items(1)),
+            return_exceptions=True,
+        )
+        with pytest.raises(KeyError):
+            await batcher._task
+        return results, batcher
+
+    results, batcher = asyncio.run(scenario())
+    assert all(isinstance(r, ServiceUnavailableError) for r in results)
+    assert batcher._queued_items == 0
+    assert not batcher.running
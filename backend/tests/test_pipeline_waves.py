@@ -0,0 +1,78 @@
+"""Unit tests for the worker's phase-1 pipeline call scheduling.
+
+A chatbot-style adapter that appends every turn to shared history must see
+its turns in case order even with concurrency > 1; adapters declaring
+``thread_safe`` fan out across the pool."""
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT))
+
+from app.workers._pipeline_waves import call_in_waves  # noqa: E402
+
+
+class _HistoryAdapter:
+    """Stateful like ChatbotAdapter: run() reads then extends _history."""
+
+    def __init__(self):
+        self._history: list[str] = []
+
+    def run(self, query: str) -> int:
+        turn = len(self._history)
+        time.sleep(0.001)  # widen the race window if calls overlap
+        self._history.append(query)
+        return turn
+
+
+class _ThreadSafeAdapter:
+    thread_safe = True
+
+    def __init__(self):
+        self.threads: set[int] = set()
+        self._barrier = threading.Barrier(4, timeout=5)
+
+    def run(self, query: str) -> str:
+        self.threads.add(threading.get_ident())
+        self._barrier.wait()  # only passes if 4 calls are in flight at once
+        return query
+
+
+def _call(case, pipeline):
+    return pipeline.run(case)
+
+
+def test_stateful_adapter_keeps_turn_order_with_concurrency():
+    adapter = _HistoryAdapter()
+    cases = [f"turn {i}" for i in range(20)]
+    called, results, stopped = call_in_waves(adapter, cases, _call, wave=8, stop=lambda: False)
+    assert not stopped
+    assert called == cases
+    assert adapter._history == cases
+    assert results == list(range(20))
+
+
+def test_thread_safe_adapter_runs_concurrently():
+    adapter = _ThreadSafeAdapter()
+    called, results, _ = call_in_waves(adapter, list("abcd"), _call, wave=4, stop=lambda: False)
+    assert results == list("abcd")
+    assert len(adapter.threads) == 4
+
+
+def test_stop_ends_before_the_next_wave():
+    checks = iter([False, True])
+    called, results, stopped = call_in_waves(
+        _HistoryAdapter(), range(10), _call_index, wave=3, stop=lambda: next(checks)
+    )
+    assert stopped
+    assert called == [0, 1, 2]
+    assert results == [0, 1, 2]
+
+
+def _call_index(case, pipeline):
+    return case
@@ -0,0 +1,153 @@
+"""Unit tests for production-traffic sampling.
+
+A tiny in-memory stand-in replaces the AsyncSession: it records executed
+statements and flushed objects so we can pin round-trip counts without a
+database."""
+from __future__ import annotations
+
+import asyncio
+import sys
+import uuid
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT))
+
+from sqlalchemy.orm import Session  # noqa: E402
+
+from app.db.models.production_log import IngestionStatus, ProductionLog  # noqa: E402
+from app.services import sampling_service  # noqa: E402
+from app.services.sampling_service import SamplingService  # noqa: E402
+
+
+class _Result:
+    def __init__(self, value):
+        self._value = value
+
+    def scalar_one_or_none(self):
+        return self._value
+
+
+class _FakeSession:
+    def __init__(self, existing_test_set_id=None):
+        self.executed: list = []
+        self.added: list = []
+        self.flushes = 0
+        self._existing = existing_test_set_id
+        # Real (unbound) sync session, so transaction events fire on
+        # begin/commit/rollback like they do under an AsyncSession.
+        self.sync_session = Session()
+
+    async def execute(self, stmt, params=None):
+        self.executed.append((stmt, params))
+        return _Result(self._existing)
+
+    def add(self, obj):
+        self.added.append(obj)
+
+    async def flush(self):
+        self.flushes += 1
+
+
+def _log(source: str = "bot") -> ProductionLog:
+    return ProductionLog(
+        id=uuid.uuid4(), source=source, query="q", answer="a",
+        is_error=False, status=IngestionStatus.RECEIVED,
+    )
+
+
+def _selects(db: _FakeSession) -> int:
+    return sum(1 for _, params in db.executed if isinstance(params, dict))
+
+
+def test_batch_writes_test_cases_in_one_insert(monkeypatch):
+    monkeypatch.setattr(sampling_service, "_test_set_ids", {})
+    monkeypatch.setattr(sampling_service.settings, "SAMPLING_RATE", 1.0)
+    ts_id = uuid.uuid4()
+    db = _FakeSession(existing_test_set_id=ts_id)
+
+    logs = [_log(), _log(), _log()]
+    assert asyncio.run(SamplingService(db).sample_and_create_test_cases(logs)) == 3
+
+    inserts = [params for _, params in db.executed if isinstance(params, list)]
+    assert len(inserts) == 1 and len(inserts[0]) == 3
+    assert [row["id"] for row in inserts[0]] == [log.sampled_into_test_case_id for log in logs]
+    assert {log.sampled_into_test_set_id for log in logs} == {ts_id}
+    assert all(log.status == IngestionStatus.SAMPLED for log in logs)
+
+
+def test_test_set_lookup_is_cached_per_source(monkeypatch):
+    monkeypatch.setattr(sampling_service, "_test_set_ids", {})
+    monkeypatch.setattr(sampling_service.settings, "SAMPLING_RATE", 1.0)
+    db = _FakeSession(existing_test_set_id=uuid.uuid4())
+    sampler = SamplingService(db)
+
+    for _ in range(3):
+        asyncio.run(sampler.sample_and_create_test_cases([_log()]))
+
+    assert _selects(db) == 1
+
+
+def test_skipped_logs_create_nothing(monkeypatch):
+    monkeypatch.setattr(sampling_service, "_test_set_ids", {})
+    monkeypatch.setattr(sampling_service.settings, "SAMPLING_RATE", 0.0)
+    db = _FakeSession()
+    logs = [_log(), _log()]
+
+    assert asyncio.run(SamplingService(db).sample_and_create_test_cases(logs)) == 0
+    assert all(log.status == IngestionStatus.SKIPPED for log in logs)
+    assert db.executed == [] and db.added == []
+
+
+def test_vectorised_batch_matches_scalar_policy(monkeypatch):
+    # Rates of 0/1 make every branch deterministic, so the numpy path and
+    # should_sample must agree row for row.
+    monkeypatch.setattr(sampling_service.settings, "SAMPLING_RATE", 0.0)
+    monkeypatch.setattr(sampling_service.settings, "SAMPLING_ERROR_RATE", 1.0)
+    logs = []
+    for i in range(sampling_service._VECTORIZE_MIN_BATCH):
+        log = _log()
+        log.is_error = i % 5 == 0
+        log.user_feedback = "thumbs_down" if i % 3 == 0 else None
+        log.confidence_score = (0.2, 0.9, None)[i % 3]
+        logs.append(log)
+    sampler = SamplingService(_FakeSession())
+
+    assert sampler.should_sample_batch(logs) == [sampler.should_sample(log) for log in logs]
+
+
+def test_created_test_set_is_cached_only_after_commit(monkeypatch):
+    cache: dict = {}
+    monkeypatch.setattr(sampling_service, "_test_set_ids", cache)
+    monkeypatch.setattr(sampling_service.settings, "SAMPLING_RATE", 1.0)
+    db = _FakeSession()
+    sampler = SamplingService(db)
+
+    db.sync_session.begin()
+    asyncio.run(sampler.sample_and_create_test_cases([_log()]))
+    asyncio.run(sampler.sample_and_create_test_cases([_log()]))
+    (ts,) = db.added  # the second batch reuses the set staged in this transaction
+    assert cache == {}
+
+    db.sync_session.commit()
+    assert cache == {"bot": ts.id}
+
+
+def test_rolled_back_test_set_is_not_cached(monkeypatch):
+    cache: dict = {}
+    monkeypatch.setattr(sampling_service, "_test_set_ids", cache)
+    monkeypatch.setattr(sampling_service.settings, "SAMPLING_RATE", 1.0)
+    db = _FakeSession()
+    sampler = SamplingService(db)
+
+    db.sync_session.begin()
+    asyncio.run(sampler.sample_and_create_test_cases([_log()]))
+    db.sync_session.rollback()
+    assert cache == {}
+
+    # The retry creates the set afresh instead of reusing the rolled-back id.
+    db.sync_session.begin()
+    asyncio.run(sampler.sample_and_create_test_cases([_log()]))
+    first, second = db.added
+    assert first.id != second.id
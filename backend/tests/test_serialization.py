@@ -0,0 +1,32 @@
+"""Unit tests for the orjson encoder shared by Celery and the DB engines.
+
+Pins the types the stdlib json module accepted but orjson rejects by
+default, so switching serializers can't fail a run mid-write."""
+from __future__ import annotations
+
+import sys
+from decimal import Decimal
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(ROOT / "backend"))
+sys.path.insert(0, str(ROOT))
+
+from app.core.serialization import dumps, dumps_str, loads  # noqa: E402
+
+
+def test_numpy_and_decimal_values_round_trip():
+    payload = {"score": np.float64(0.75), "count": np.int64(3), "cost": Decimal("0.5")}
+    assert loads(dumps(payload)) == {"score": 0.75, "count": 3, "cost": 0.5}
+
+
+def test_non_string_keys_and_text_output():
+    assert dumps_str({1: "a"}) == '{"1":"a"}'
+
+
+def test_unknown_types_still_raise():
+    with pytest.raises(TypeError):
+        dumps({"x": object()})
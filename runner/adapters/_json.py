@@ -0,0 +1,31 @@
+"""
+JSON encoding for the HTTP adapters' request and response bodies.
+
+Uses orjson when it is installed (it is in the backend worker image), which
+parses large label/score maps and code blobs several times faster than the
+stdlib ``json`` that httpx's ``json=`` / ``response.json()`` go through.
+Falls back to the stdlib otherwise.
+"""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+def loads(content: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
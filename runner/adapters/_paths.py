@@ -0,0 +1,28 @@
+"""
+Dot-notation response paths shared by the HTTP adapters.
+
+``compile_path("data.items.0.text")`` splits the path once, when the adapter
+is constructed; ``extract`` then walks a decoded JSON response with it. Dict
+segments are looked up by key and all-digit segments index into lists. Any
+miss (absent key, index out of range, wrong container type, or a ``None``
+along the way) yields ``None``.
+"""
+from __future__ import annotations
+
+from typing import Any
+
+Path = tuple[tuple[str, int | None], ...]
+
+
+def compile_path(path: str) -> Path:
+    return tuple((part, int(part) if part.isdigit() else None) for part in path.split("."))
+
+
+def extract(data: Any, path: Path) -> Any:
+    current = data
+    try:
+        for key, index in path:
+            current = current[index if isinstance(current, list) else key]
+    except (KeyError, IndexError, TypeError):
+        return None
+    return current
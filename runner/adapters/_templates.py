@@ -0,0 +1,100 @@
+"""
+Request-body templates shared by the HTTP adapters.
+
+A template is a JSON-like value whose strings may contain ``{{name}}``
+placeholders (``{{query}}``, ``{{context.<key>}}``, plus adapter-specific
+ones such as ``{{history}}``). ``compile_template`` walks the template once,
+when the adapter is constructed, and returns a render function; per request
+only the placeholder slots are filled in. Subtrees without placeholders are
+reused as-is instead of being rebuilt on every call.
+"""
+from __future__ import annotations
+
+import re
+from typing import Any, Callable
+
+_PLACEHOLDER = re.compile(r"\{\{([^{}]+)\}\}")
+
+Render = Callable[[dict[str, Any]], Any]
+
+
+def compile_template(template: Any) -> Render:
+    """Compile ``template`` into ``render(fields)``.
+
+    ``fields`` maps placeholder names to values. A string that is exactly one
+    placeholder renders to the field value itself (so ``{{history}}`` can
+    become a list); inside a longer string only ``str`` fields are
+    substituted. Placeholders without a matching field are left verbatim.
+    """
+    render = _compile(template)
+    if render is None:
+        return lambda fields: template
+    return render
+
+
+def template_fields(query: str, context: dict, **extra: Any) -> dict[str, Any]:
+    """Placeholder values for one request: query, ``context.*`` and extras.
+
+    ``context.*`` entries are resolved on lookup rather than copied up front,
+    so a template that never references the context costs nothing per key.
+    """
+    return _Fields(context, query=query, **extra)
+
+
+class _Fields(dict):
+    """Query and extra fields, with ``context.<key>`` looked up lazily."""
+
+    __slots__ = ("_context",)
+
+    def __init__(self, context: dict, **fields: Any):
+        super().__init__(fields)
+        self._context = context
+
+    def get(self, name: str, default: Any = None) -> Any:
+        if name in self:
+            return self[name]
+        if name.startswith("context.") and (key := name[8:]) in self._context:
+            return str(self._context[key])
+        return default
+
+
+def _compile(value: Any) -> Render | None:
+    """Render function for ``value``, or None if it holds no placeholders."""
+    if isinstance(value, str):
+        return _compile_str(value)
+    if isinstance(value, dict):
+        items = [(key, _compile(item), item) for key, item in value.items()]
+        if not any(render for _, render, _ in items):
+            return None
+        return lambda fields: {
+            key: render(fields) if render else item for key, render, item in items
+        }
+    if isinstance(value, list):
+        items = [(_compile(item), item) for item in value]
+        if not any(render for render, _ in items):
+            return None
+        return lambda fields: [render(fields) if render else item for render, item in items]
+    return None
+
+
+def _compile_str(value: str) -> Render | None:
+    pieces = _PLACEHOLDER.split(value)  # literal, name, literal, name, ..., literal
+    if len(pieces) == 1:
+        return None
+    if len(pieces) == 3 and not pieces[0] and not pieces[2]:
+        name = pieces[1]
+        return lambda fields: fields.get(name, value)
+
+    literals = pieces[0::2]
+    slots = list(zip(pieces[1::2], literals[1:]))
+    head = literals[0]
+
+    def render(fields: dict[str, Any]) -> str:
+        out = [head]
+        for name, literal in slots:
+            field = fields.get(name)
+            out.append(field if isinstance(field, str) else f"{{{{{name}}}}}")
+            out.append(literal)
+        return "".join(out)
+
+    return render
@@ -49,6 +49,18 @@ class RAGAdapter(ABC):
     vector stores, etc.), override setup() and teardown().
     """
 
+    # True when run() keeps no per-run state (history, session ids), so the
+    # worker may keep one set-up instance per process across evaluation runs
+    # instead of calling setup() each time. Worth it for adapters with costly
+    # setup: a keep-alive connection pool, an embedded corpus. Instances are
+    # cached per adapter config and torn down when evicted.
+    reusable: bool = False
+
+    # True when run() may be called from several threads at once on one
+    # instance. Left False, the worker calls run() serially in test-case
+    # order, which stateful pipelines (conversation history) rely on.
+    thread_safe: bool = False
+
     def setup(self) -> None:
         """Called once before the evaluation run starts. Load models, connect clients."""
         pass
@@ -19,8 +19,15 @@ Usage in pipeline_config::
             "history": "{{history}}"
         },
         "response_answer_path": "data.reply",
+        "incremental_history": false,
         "timeout": 30
     }
+
+Set ``incremental_history`` to ``true`` only for endpoints that keep their
+own conversation store keyed on the session header: after the first turn
+``{{history}}`` then renders as an empty list, so each request carries just
+the new message instead of the whole transcript. An endpoint that does not
+keep server-side state will silently lose context in this mode.
 """
 from __future__ import annotations
 
@@ -29,26 +36,12 @@ from typing import Any
 
 import httpx
 
+from runner.adapters import _json
+from runner.adapters._paths import compile_path, extract
+from runner.adapters._templates import compile_template, template_fields
 from runner.adapters.base import PipelineOutput, RAGAdapter
 
 
-def _extract_nested(data: dict | list, path: str) -> Any:
-    """Extract a nested value using dot-notation path (e.g., 'data.reply')."""
-    parts = path.split(".")
-    current = data
-    for part in parts:
-        if isinstance(current, dict):
-            current = current.get(part)
-        elif isinstance(current, list) and part.isdigit():
-            idx = int(part)
-            current = current[idx] if idx < len(current) else None
-        else:
-            return None
-        if current is None:
-            return None
-    return current
-
-
 class ChatbotAdapter(RAGAdapter):
     """
     Multi-turn HTTP adapter for conversational AI systems.
@@ -67,6 +60,8 @@ class ChatbotAdapter(RAGAdapter):
         request_template: dict[str, Any] | None = None,
         response_answer_path: str = "answer",
         timeout: int = 30,
+        http2: bool = False,
+        incremental_history: bool = False,
         **kwargs,
     ):
         self.endpoint_url = endpoint_url
@@ -76,8 +71,12 @@ class ChatbotAdapter(RAGAdapter):
             "message": "{{query}}",
             "history": "{{history}}",
         }
+        self._render_body = compile_template(self.request_template)
         self.response_answer_path = response_answer_path
+        self._answer_path = compile_path(response_answer_path)
         self.timeout = timeout
+        self.http2 = http2
+        self.incremental_history = incremental_history
 
         # Mutable state -- reset on each setup()
         self.session_id: str = ""
@@ -101,7 +100,7 @@ class ChatbotAdapter(RAGAdapter):
             headers["Authorization"] = self.auth_token
         headers[self.session_header] = self.session_id
 
-        self._client = httpx.Client(timeout=self.timeout, headers=headers)
+        self._client = httpx.Client(timeout=self.timeout, headers=headers, http2=self.http2)
 
     def teardown(self) -> None:
         if self._client is not None:
@@ -115,22 +114,10 @@ class ChatbotAdapter(RAGAdapter):
 
     def _build_request_body(self, query: str, context: dict) -> dict:
         """Replace ``{{query}}``, ``{{history}}``, and ``{{context.*}}`` placeholders."""
-
-        def _replace(value: Any) -> Any:
-            if isinstance(value, str):
-                if value == "{{history}}":
-                    return list(self._history)
-                value = value.replace("{{query}}", query)
-                for key, val in context.items():
-                    value = value.replace(f"{{{{context.{key}}}}}", str(val))
-                return value
-            if isinstance(value, dict):
-                return {k: _replace(v) for k, v in value.items()}
-            if isinstance(value, list):
-                return [_replace(v) for v in value]
-            return value
-
-        return _replace(self.request_template)
+        # The live history list: the body is serialised by the POST in run()
+        # before this turn is appended, so no defensive copy is needed.
+        history = [] if self.incremental_history and self._history else self._history
+        return self._render_body(template_fields(query, context, history=history))
 
     # ------------------------------------------------------------------
     # Run
@@ -143,12 +130,14 @@ class ChatbotAdapter(RAGAdapter):
             )
 
         body = self._build_request_body(query, context)
-        response = self._client.post(self.endpoint_url, json=body)
+        response = self._client.post(
+            self.endpoint_url, content=_json.dumps(body), headers=_json.JSON_HEADERS
+        )
         response.raise_for_status()
-        data = response.json()
+        data = _json.loads(response.content)
 
         # Extract answer
-        answer = _extract_nested(data, self.response_answer_path)
+        answer = extract(data, self._answer_path)
         if answer is None:
             answer = str(data)
 
@@ -25,26 +25,12 @@ from typing import Any
 
 import httpx
 
+from runner.adapters import _json
+from runner.adapters._paths import compile_path, extract
+from runner.adapters._templates import compile_template, template_fields
 from runner.adapters.base import PipelineOutput, RAGAdapter
 
 
-def _extract_nested(data: dict | list, path: str) -> Any:
-    """Extract a nested value using dot-notation path (e.g., 'data.labels')."""
-    parts = path.split(".")
-    current = data
-    for part in parts:
-        if isinstance(current, dict):
-            current = current.get(part)
-        elif isinstance(current, list) and part.isdigit():
-            idx = int(part)
-            current = current[idx] if idx < len(current) else None
-        else:
-            return None
-        if current is None:
-            return None
-    return current
-
-
 class ClassificationAdapter(RAGAdapter):
     """
     HTTP adapter for classification / moderation systems.
@@ -55,6 +41,10 @@ class ClassificationAdapter(RAGAdapter):
     and the full scores mapping is placed in ``metadata``.
     """
 
+    # Stateless between calls; keeps its connection pool across runs.
+    reusable = True
+    thread_safe = True
+
     def __init__(
         self,
         endpoint_url: str = "",
@@ -63,14 +53,19 @@ class ClassificationAdapter(RAGAdapter):
         response_labels_path: str = "labels",
         response_scores_path: str = "scores",
         timeout: int = 30,
+        http2: bool = False,
         **kwargs,
     ):
         self.endpoint_url = endpoint_url
         self.auth_token = auth_token
         self.request_template = request_template or {"text": "{{query}}"}
+        self._render_body = compile_template(self.request_template)
         self.response_labels_path = response_labels_path
+        self._labels_path = compile_path(response_labels_path)
         self.response_scores_path = response_scores_path
+        self._scores_path = compile_path(response_scores_path)
         self.timeout = timeout
+        self.http2 = http2
         self._client: httpx.Client | None = None
 
     # ------------------------------------------------------------------
@@ -86,7 +81,7 @@ class ClassificationAdapter(RAGAdapter):
         if self.auth_token:
             headers["Authorization"] = self.auth_token
 
-        self._client = httpx.Client(timeout=self.timeout, headers=headers)
+        self._client = httpx.Client(timeout=self.timeout, headers=headers, http2=self.http2)
 
     def teardown(self) -> None:
         if self._client is not None:
@@ -99,20 +94,7 @@ class ClassificationAdapter(RAGAdapter):
 
     def _build_request_body(self, query: str, context: dict) -> dict:
         """Replace ``{{query}}`` and ``{{context.*}}`` placeholders in the template."""
-
-        def _replace(value: Any) -> Any:
-            if isinstance(value, str):
-                value = value.replace("{{query}}", query)
-                for key, val in context.items():
-                    value = value.replace(f"{{{{context.{key}}}}}", str(val))
-                return value
-            if isinstance(value, dict):
-                return {k: _replace(v) for k, v in value.items()}
-            if isinstance(value, list):
-                return [_replace(v) for v in value]
-            return value
-
-        return _replace(self.request_template)
+        return self._render_body(template_fields(query, context))
 
     # ------------------------------------------------------------------
     # Run
@@ -125,12 +107,14 @@ class ClassificationAdapter(RAGAdapter):
             )
 
         body = self._build_request_body(query, context)
-        response = self._client.post(self.endpoint_url, json=body)
+        response = self._client.post(
+            self.endpoint_url, content=_json.dumps(body), headers=_json.JSON_HEADERS
+        )
         response.raise_for_status()
-        data = response.json()
+        data = _json.loads(response.content)
 
         # Extract labels
-        raw_labels = _extract_nested(data, self.response_labels_path)
+        raw_labels = extract(data, self._labels_path)
         if isinstance(raw_labels, list):
             labels = [str(lbl) for lbl in raw_labels]
         elif raw_labels is not None:
@@ -139,7 +123,7 @@ class ClassificationAdapter(RAGAdapter):
             labels = []
 
         # Extract scores
-        raw_scores = _extract_nested(data, self.response_scores_path)
+        raw_scores = extract(data, self._scores_path)
         if isinstance(raw_scores, dict):
             scores = {str(k): v for k, v in raw_scores.items()}
         elif isinstance(raw_scores, list):
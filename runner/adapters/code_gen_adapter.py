@@ -28,26 +28,12 @@ from typing import Any
 
 import httpx
 
+from runner.adapters import _json
+from runner.adapters._paths import compile_path, extract
+from runner.adapters._templates import compile_template, template_fields
 from runner.adapters.base import PipelineOutput, RAGAdapter
 
 
-def _extract_nested(data: dict | list, path: str) -> Any:
-    """Extract a nested value using dot-notation path (e.g., 'data.code')."""
-    parts = path.split(".")
-    current = data
-    for part in parts:
-        if isinstance(current, dict):
-            current = current.get(part)
-        elif isinstance(current, list) and part.isdigit():
-            idx = int(part)
-            current = current[idx] if idx < len(current) else None
-        else:
-            return None
-        if current is None:
-            return None
-    return current
-
-
 class CodeGenAdapter(RAGAdapter):
     """
     HTTP adapter for code generation systems (Copilot, CodeGen, StarCoder, etc.).
@@ -59,6 +45,10 @@ class CodeGenAdapter(RAGAdapter):
     linting, test execution).
     """
 
+    # Stateless between calls; keeps its connection pool across runs.
+    reusable = True
+    thread_safe = True
+
     def __init__(
         self,
         endpoint_url: str = "",
@@ -67,6 +57,7 @@ class CodeGenAdapter(RAGAdapter):
         request_template: dict[str, Any] | None = None,
         response_code_path: str = "code",
         timeout: int = 60,
+        http2: bool = False,
         **kwargs,
     ):
         self.endpoint_url = endpoint_url
@@ -76,8 +67,11 @@ class CodeGenAdapter(RAGAdapter):
             "prompt": "{{query}}",
             "language": "{{language}}",
         }
+        self._render_body = compile_template(self.request_template)
         self.response_code_path = response_code_path
+        self._code_path = compile_path(response_code_path)
         self.timeout = timeout
+        self.http2 = http2
         self._client: httpx.Client | None = None
 
     # ------------------------------------------------------------------
@@ -93,7 +87,7 @@ class CodeGenAdapter(RAGAdapter):
         if self.auth_token:
             headers["Authorization"] = self.auth_token
 
-        self._client = httpx.Client(timeout=self.timeout, headers=headers)
+        self._client = httpx.Client(timeout=self.timeout, headers=headers, http2=self.http2)
 
     def teardown(self) -> None:
         if self._client is not None:
@@ -106,21 +100,7 @@ class CodeGenAdapter(RAGAdapter):
 
     def _build_request_body(self, query: str, context: dict) -> dict:
         """Replace ``{{query}}``, ``{{language}}``, and ``{{context.*}}`` placeholders."""
-
-        def _replace(value: Any) -> Any:
-            if isinstance(value, str):
-                value = value.replace("{{query}}", query)
-                value = value.replace("{{language}}", self.language)
-                for key, val in context.items():
-                    value = value.replace(f"{{{{context.{key}}}}}", str(val))
-                return value
-            if isinstance(value, dict):
-                return {k: _replace(v) for k, v in value.items()}
-            if isinstance(value, list):
-                return [_replace(v) for v in value]
-            return value
-
-        return _replace(self.request_template)
+        return self._render_body(template_fields(query, context, language=self.language))
 
     # ------------------------------------------------------------------
     # Run
@@ -133,12 +113,14 @@ class CodeGenAdapter(RAGAdapter):
             )
 
         body = self._build_request_body(query, context)
-        response = self._client.post(self.endpoint_url, json=body)
+        response = self._client.post(
+            self.endpoint_url, content=_json.dumps(body), headers=_json.JSON_HEADERS
+        )
         response.raise_for_status()
-        data = response.json()
+        data = _json.loads(response.content)
 
         # Extract generated code
-        code = _extract_nested(data, self.response_code_path)
+        code = extract(data, self._code_path)
         if code is None:
             code = str(data)
 
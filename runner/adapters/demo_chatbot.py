@@ -5,7 +5,9 @@ Uses OpenAI GPT-4o-mini with a system prompt that plays a "TechStore" support ag
 Maintains conversation history across turns within a single test case.
 Returns PipelineOutput with turn_history for conversation evaluators.
 """
+import heapq
 import os
+from collections import Counter
 from openai import OpenAI
 
 from runner.adapters.base import PipelineOutput, RAGAdapter, ToolCall
@@ -28,7 +30,7 @@ an online electronics retailer. Follow these rules strictly:
 """
 
 # Knowledge base for grounding responses
-KNOWLEDGE_BASE = [
+KNOWLEDGE_BASE = (
     "TechStore offers free shipping on orders over $50. Standard shipping takes 3-5 business days.",
     "Our return policy allows returns within 30 days of purchase. Items must be unused and in original packaging. Refunds are processed within 5-7 business days.",
     "TechStore's laptop lineup: Budget Pro ($499), WorkStation X ($899), UltraBook Air ($1299), Gaming Beast ($1599), Creator Studio ($1999).",
@@ -39,7 +41,15 @@ KNOWLEDGE_BASE = [
     "TechStore warranty: All products come with a 1-year manufacturer warranty. Extended 2-year warranty available for $49.",
     "Order tracking: Customers can track orders at techstore.com/track or by contacting support with order number (format: TS-XXXXX).",
     "Payment methods accepted: Visa, Mastercard, Amex, PayPal, Apple Pay, Google Pay. Financing available on orders over $500.",
-]
+)
+
+# Inverted index of lower-cased word -> chunk indices, built once; the
+# knowledge base is static. Retrieval only touches chunks sharing a word with
+# the query, so its cost tracks the query rather than the size of the KB.
+KB_POSTINGS: dict[str, list[int]] = {}
+for _idx, _chunk in enumerate(KNOWLEDGE_BASE):
+    for _word in set(_chunk.lower().split()):
+        KB_POSTINGS.setdefault(_word, []).append(_idx)
 
 
 class DemoChatbotAdapter(RAGAdapter):
@@ -49,11 +59,14 @@ class DemoChatbotAdapter(RAGAdapter):
         self.model = model
         self._client: OpenAI | None = None
         self._history: list[dict] = []
+        # Whether _history[1] currently holds this turn's knowledge hint.
+        self._has_kb_slot = False
 
     def setup(self) -> None:
         api_key = os.environ.get("OPENAI_API_KEY", "")
         self._client = OpenAI(api_key=api_key)
         self._history = []
+        self._has_kb_slot = False
 
     def run(self, query: str, context: dict | None = None) -> PipelineOutput:
         context = context or {}
@@ -61,6 +74,7 @@ class DemoChatbotAdapter(RAGAdapter):
         # Check if this is a new conversation (reset history)
         if context.get("new_conversation", False) or not self._history:
             self._history = [{"role": "system", "content": SYSTEM_PROMPT}]
+            self._has_kb_slot = False
 
         # Add user message
         self._history.append({"role": "user", "content": query})
@@ -68,19 +82,28 @@ class DemoChatbotAdapter(RAGAdapter):
         # Find relevant knowledge chunks
         relevant_knowledge = self._retrieve_knowledge(query)
 
-        # Inject knowledge as a system hint (not visible to user)
-        messages = list(self._history)
+        # Inject knowledge as a system hint (not visible to user) in the slot
+        # right after the system prompt, overwritten in place on later turns
+        # instead of copying the whole history into a fresh message list.
         if relevant_knowledge:
             knowledge_text = "\n".join(f"- {k}" for k in relevant_knowledge)
-            messages.insert(1, {
+            kb_msg = {
                 "role": "system",
                 "content": f"Relevant knowledge for answering:\n{knowledge_text}",
-            })
+            }
+            if self._has_kb_slot:
+                self._history[1] = kb_msg
+            else:
+                self._history.insert(1, kb_msg)
+                self._has_kb_slot = True
+        elif self._has_kb_slot:
+            del self._history[1]
+            self._has_kb_slot = False
 
         # Call OpenAI
         response = self._client.chat.completions.create(
             model=self.model,
-            messages=messages,
+            messages=self._history,
             temperature=0.7,
             max_tokens=500,
         )
@@ -108,20 +131,18 @@ class DemoChatbotAdapter(RAGAdapter):
 
     def teardown(self) -> None:
         self._history = []
+        self._has_kb_slot = False
         self._client = None
 
     def _retrieve_knowledge(self, query: str) -> list[str]:
         """Simple keyword-based retrieval from the knowledge base."""
-        query_lower = query.lower()
-        scored = []
-        for chunk in KNOWLEDGE_BASE:
-            chunk_lower = chunk.lower()
-            # Count keyword overlaps
-            query_words = set(query_lower.split())
-            chunk_words = set(chunk_lower.split())
-            overlap = len(query_words & chunk_words)
-            if overlap >= 2:
-                scored.append((overlap, chunk))
-
-        scored.sort(key=lambda x: x[0], reverse=True)
-        return [chunk for _, chunk in scored[:3]]
+        overlaps = Counter(
+            idx for word in set(query.lower().split()) for idx in KB_POSTINGS.get(word, ())
+        )
+        # Scan in knowledge-base order: nlargest is stable, so ties keep it.
+        top = heapq.nlargest(
+            3,
+            ((count, idx) for idx, count in sorted(overlaps.items()) if count >= 2),
+            key=lambda x: x[0],
+        )
+        return [KNOWLEDGE_BASE[idx] for _, idx in top]
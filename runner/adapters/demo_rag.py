@@ -14,6 +14,8 @@ from __future__ import annotations
 import os
 from typing import Optional
 
+import numpy as np
+
 from runner.adapters.base import PipelineOutput, RAGAdapter
 
 # ---------------------------------------------------------------------------
@@ -127,14 +129,19 @@ class DemoRAGAdapter(RAGAdapter):
             to answer using only those chunks.
     """
 
+    # The corpus is a module constant, so its embeddings stay valid across runs.
+    reusable = True
+    thread_safe = True
+
     def __init__(self, top_k: int = 3, model: str = "gpt-4o-mini"):
         self.top_k = top_k
         self.model = model
-        self._corpus_embeddings: Optional[list[list[float]]] = None
+        # Row-normalised float32 embeddings: CORPUS first, then user docs.
+        self._corpus_matrix: Optional[np.ndarray] = None
+        self._embedding_matrix: Optional[np.ndarray] = None
         self._client = None
         self._embed_model = "text-embedding-3-small"
         self._user_docs: list[str] = []
-        self._user_doc_embeddings: list[list[float]] = []
 
     # ------------------------------------------------------------------
     def setup(self) -> None:
@@ -145,7 +152,8 @@ class DemoRAGAdapter(RAGAdapter):
             model=self._embed_model,
             input=CORPUS,
         )
-        self._corpus_embeddings = [item.embedding for item in response.data]
+        self._corpus_matrix = _normalized_rows([item.embedding for item in response.data])
+        self._embedding_matrix = self._corpus_matrix
 
     # ------------------------------------------------------------------
     def add_documents(self, texts: list[str]) -> int:
@@ -155,9 +163,10 @@ class DemoRAGAdapter(RAGAdapter):
         if not texts:
             return 0
         response = self._client.embeddings.create(model=self._embed_model, input=texts)
-        for i, text in enumerate(texts):
-            self._user_docs.append(text)
-            self._user_doc_embeddings.append(response.data[i].embedding)
+        self._user_docs.extend(texts)
+        self._embedding_matrix = np.vstack(
+            (self._embedding_matrix, _normalized_rows([item.embedding for item in response.data]))
+        )
         return len(texts)
 
     def get_user_documents(self) -> list[str]:
@@ -167,13 +176,13 @@ class DemoRAGAdapter(RAGAdapter):
     def clear_user_documents(self) -> int:
         """Remove all user-uploaded documents. Returns count removed."""
         count = len(self._user_docs)
+        self._embedding_matrix = self._corpus_matrix
         self._user_docs.clear()
-        self._user_doc_embeddings.clear()
         return count
 
     # ------------------------------------------------------------------
     def run(self, query: str, context: dict) -> PipelineOutput:
-        if self._client is None or self._corpus_embeddings is None:
+        if self._client is None or self._embedding_matrix is None:
             raise RuntimeError("DemoRAGAdapter.setup() must be called before run()")
 
         # 1. Embed the query
@@ -181,25 +190,18 @@ class DemoRAGAdapter(RAGAdapter):
             model=self._embed_model,
             input=[query],
         )
-        q_vec = q_resp.data[0].embedding
-
-        # 2. Cosine similarity against corpus + user docs
-        import math
-        def cosine(a: list[float], b: list[float]) -> float:
-            dot = sum(x * y for x, y in zip(a, b))
-            mag_a = math.sqrt(sum(x * x for x in a))
-            mag_b = math.sqrt(sum(x * x for x in b))
-            return dot / (mag_a * mag_b + 1e-9)
-
-        all_embeddings = list(self._corpus_embeddings) + list(self._user_doc_embeddings)
-        all_chunks = list(CORPUS) + list(self._user_docs)
-
-        scores = [
-            (cosine(q_vec, emb), chunk)
-            for emb, chunk in zip(all_embeddings, all_chunks)
+        q_vec = _normalized_rows([q_resp.data[0].embedding])[0]
+
+        # 2. Cosine similarity against corpus + user docs: one matvec over the
+        #    pre-normalised rows, then order only the top-k candidates.
+        scores = self._embedding_matrix @ q_vec
+        k = min(self.top_k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k] if 0 < k < len(scores) else np.arange(k)
+        top = top[np.argsort(-scores[top], kind="stable")]
+        n_corpus = len(CORPUS)
+        top_chunks = [
+            CORPUS[i] if i < n_corpus else self._user_docs[i - n_corpus] for i in top.tolist()
         ]
-        scores.sort(key=lambda t: t[0], reverse=True)
-        top_chunks = [chunk for _, chunk in scores[: self.top_k]]
 
         # 3. Generate answer grounded in retrieved chunks
         context_block = "\n\n".join(
@@ -230,13 +232,20 @@ class DemoRAGAdapter(RAGAdapter):
             metadata={
                 "model": self.model,
                 "top_k": self.top_k,
-                "scores": [round(s, 4) for s, _ in scores[: self.top_k]],
+                "scores": [round(float(scores[i]), 4) for i in top],
             },
         )
 
     # ------------------------------------------------------------------
     def teardown(self) -> None:
         self._client = None
-        self._corpus_embeddings = None
+        self._corpus_matrix = None
+        self._embedding_matrix = None
         self._user_docs.clear()
-        self._user_doc_embeddings.clear()
+
+
+def _normalized_rows(embeddings: list[list[float]]) -> np.ndarray:
+    """Stack embeddings into a float32 matrix with unit-length rows."""
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True) + 1e-9
+    return matrix
@@ -176,6 +176,10 @@ class DemoSearchAdapter(RAGAdapter):
     # Minimum cosine similarity to consider a result relevant
     RELEVANCE_THRESHOLD = 0.25
 
+    # DOCUMENTS is a module constant, so its embeddings stay valid across runs.
+    reusable = True
+    thread_safe = True
+
     def __init__(self, model: str = "gpt-4o-mini", top_k: int = 5, **kwargs):
         self.model = model
         self.top_k = top_k
@@ -279,6 +279,9 @@ class DemoToolAgentAdapter(RAGAdapter):
             locally, then returns the final answer with tool call records.
     """
 
+    # Each run() builds its own message list; the OpenAI client is thread-safe.
+    thread_safe = True
+
     def __init__(self, model: str = "gpt-4o-mini", max_tool_rounds: int = 3):
         self.model = model
         self.max_tool_rounds = max_tool_rounds
@@ -26,26 +26,12 @@ from typing import Any, Optional
 
 import httpx
 
+from runner.adapters import _json
+from runner.adapters._paths import compile_path, extract
+from runner.adapters._templates import compile_template, template_fields
 from runner.adapters.base import PipelineOutput, RAGAdapter, ToolCall
 
 
-def _extract_nested(data: dict | list, path: str) -> Any:
-    """Extract a nested value using dot-notation path (e.g., 'data.answer')."""
-    parts = path.split(".")
-    current = data
-    for part in parts:
-        if isinstance(current, dict):
-            current = current.get(part)
-        elif isinstance(current, list) and part.isdigit():
-            idx = int(part)
-            current = current[idx] if idx < len(current) else None
-        else:
-            return None
-        if current is None:
-            return None
-    return current
-
-
 class HTTPAdapter(RAGAdapter):
     """
     Generic HTTP adapter for evaluating any deployed AI system.
@@ -54,6 +40,10 @@ class HTTPAdapter(RAGAdapter):
     the response fields back to PipelineOutput.
     """
 
+    # Stateless between calls; keeps its connection pool across runs.
+    reusable = True
+    thread_safe = True
+
     def __init__(
         self,
         endpoint_url: str = "",
@@ -64,39 +54,32 @@ class HTTPAdapter(RAGAdapter):
         response_contexts_path: str | None = None,
         response_tool_calls_path: str | None = None,
         timeout: int = 30,
+        http2: bool = False,
         **kwargs,
     ):
         self.endpoint_url = endpoint_url
         self.method = method.upper()
         self.headers = headers or {}
         self.request_body_template = request_body_template or {"query": "{{query}}"}
+        self._render_body = compile_template(self.request_body_template)
         self.response_answer_path = response_answer_path
+        self._answer_path = compile_path(response_answer_path)
         self.response_contexts_path = response_contexts_path
+        self._contexts_path = compile_path(response_contexts_path) if response_contexts_path else None
         self.response_tool_calls_path = response_tool_calls_path
+        self._tool_calls_path = compile_path(response_tool_calls_path) if response_tool_calls_path else None
         self.timeout = timeout
+        self.http2 = http2
         self._client: httpx.Client | None = None
 
     def setup(self) -> None:
         if not self.endpoint_url:
             raise ValueError("HTTPAdapter requires 'endpoint_url' in pipeline_config")
-        self._client = httpx.Client(timeout=self.timeout, headers=self.headers)
+        self._client = httpx.Client(timeout=self.timeout, headers=self.headers, http2=self.http2)
 
     def _build_request_body(self, query: str, context: dict) -> dict:
         """Replace {{query}} and {{context.*}} placeholders in the template."""
-        def _replace(value: Any) -> Any:
-            if isinstance(value, str):
-                value = value.replace("{{query}}", query)
-                # Replace {{context.key}} placeholders
-                for key, val in context.items():
-                    value = value.replace(f"{{{{context.{key}}}}}", str(val))
-                return value
-            if isinstance(value, dict):
-                return {k: _replace(v) for k, v in value.items()}
-            if isinstance(value, list):
-                return [_replace(v) for v in value]
-            return value
-
-        return _replace(self.request_body_template)
+        return self._render_body(template_fields(query, context))
 
     def run(self, query: str, context: dict) -> PipelineOutput:
         if self._client is None:
@@ -105,24 +88,26 @@ class HTTPAdapter(RAGAdapter):
         body = self._build_request_body(query, context)
 
         if self.method == "POST":
-            response = self._client.post(self.endpoint_url, json=body)
+            response = self._client.post(
+                self.endpoint_url, content=_json.dumps(body), headers=_json.JSON_HEADERS
+            )
         elif self.method == "GET":
             response = self._client.get(self.endpoint_url, params=body)
         else:
             raise ValueError(f"Unsupported HTTP method: {self.method}")
 
         response.raise_for_status()
-        data = response.json()
+        data = _json.loads(response.content)
 
         # Extract answer
-        answer = _extract_nested(data, self.response_answer_path)
+        answer = extract(data, self._answer_path)
         if answer is None:
             answer = str(data)
 
         # Extract contexts
         contexts = []
         if self.response_contexts_path:
-            raw_contexts = _extract_nested(data, self.response_contexts_path)
+            raw_contexts = extract(data, self._contexts_path)
             if isinstance(raw_contexts, list):
                 contexts = [str(c) for c in raw_contexts]
             elif raw_contexts is not None:
@@ -131,7 +116,7 @@ class HTTPAdapter(RAGAdapter):
         # Extract tool calls
         tool_calls = []
         if self.response_tool_calls_path:
-            raw_tc = _extract_nested(data, self.response_tool_calls_path)
+            raw_tc = extract(data, self._tool_calls_path)
             if isinstance(raw_tc, list):
                 for tc in raw_tc:
                     if isinstance(tc, dict):
@@ -26,26 +26,12 @@ from typing import Any
 
 import httpx
 
+from runner.adapters import _json
+from runner.adapters._paths import compile_path, extract
+from runner.adapters._templates import compile_template, template_fields
 from runner.adapters.base import PipelineOutput, RAGAdapter
 
 
-def _extract_nested(data: dict | list, path: str) -> Any:
-    """Extract a nested value using dot-notation path (e.g., 'data.results')."""
-    parts = path.split(".")
-    current = data
-    for part in parts:
-        if isinstance(current, dict):
-            current = current.get(part)
-        elif isinstance(current, list) and part.isdigit():
-            idx = int(part)
-            current = current[idx] if idx < len(current) else None
-        else:
-            return None
-        if current is None:
-            return None
-    return current
-
-
 class SearchAdapter(RAGAdapter):
     """
     HTTP adapter for search / retrieval systems.
@@ -56,6 +42,10 @@ class SearchAdapter(RAGAdapter):
     plus relevance scores are stored in ``metadata``.
     """
 
+    # Stateless between calls; keeps its connection pool across runs.
+    reusable = True
+    thread_safe = True
+
     def __init__(
         self,
         endpoint_url: str = "",
@@ -65,15 +55,19 @@ class SearchAdapter(RAGAdapter):
         response_id_field: str = "id",
         response_score_field: str = "score",
         timeout: int = 30,
+        http2: bool = False,
         **kwargs,
     ):
         self.endpoint_url = endpoint_url
         self.auth_token = auth_token
         self.request_template = request_template or {"query": "{{query}}"}
+        self._render_body = compile_template(self.request_template)
         self.response_results_path = response_results_path
+        self._results_path = compile_path(response_results_path)
         self.response_id_field = response_id_field
         self.response_score_field = response_score_field
         self.timeout = timeout
+        self.http2 = http2
         self._client: httpx.Client | None = None
 
     # ------------------------------------------------------------------
@@ -89,7 +83,7 @@ class SearchAdapter(RAGAdapter):
         if self.auth_token:
             headers["Authorization"] = self.auth_token
 
-        self._client = httpx.Client(timeout=self.timeout, headers=headers)
+        self._client = httpx.Client(timeout=self.timeout, headers=headers, http2=self.http2)
 
     def teardown(self) -> None:
         if self._client is not None:
@@ -102,20 +96,7 @@ class SearchAdapter(RAGAdapter):
 
     def _build_request_body(self, query: str, context: dict) -> dict:
         """Replace ``{{query}}`` and ``{{context.*}}`` placeholders in the template."""
-
-        def _replace(value: Any) -> Any:
-            if isinstance(value, str):
-                value = value.replace("{{query}}", query)
-                for key, val in context.items():
-                    value = value.replace(f"{{{{context.{key}}}}}", str(val))
-                return value
-            if isinstance(value, dict):
-                return {k: _replace(v) for k, v in value.items()}
-            if isinstance(value, list):
-                return [_replace(v) for v in value]
-            return value
-
-        return _replace(self.request_template)
+        return self._render_body(template_fields(query, context))
 
     # ------------------------------------------------------------------
     # Result text extraction
@@ -145,12 +126,14 @@ class SearchAdapter(RAGAdapter):
             )
 
         body = self._build_request_body(query, context)
-        response = self._client.post(self.endpoint_url, json=body)
+        response = self._client.post(
+            self.endpoint_url, content=_json.dumps(body), headers=_json.JSON_HEADERS
+        )
         response.raise_for_status()
-        data = response.json()
+        data = _json.loads(response.content)
 
         # Extract the results list
-        raw_results = _extract_nested(data, self.response_results_path)
+        raw_results = extract(data, self._results_path)
         if not isinstance(raw_results, list):
             raw_results = []
 
@@ -45,6 +45,8 @@ _INJECTION_MARKERS = ["ignore your instructions", "system prompt", "ignore previ
 class StaticQAAdapter(RAGAdapter):
     """Deterministic lookup adapter. See module docstring."""
 
+    thread_safe = True
+
     def setup(self) -> None:  # nothing to initialise
         pass
 
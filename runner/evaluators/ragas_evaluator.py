@@ -29,9 +29,9 @@ from runner.evaluators._llm import OPENROUTER_BASE_URL, is_openrouter_model
 from runner.evaluators.base_evaluator import BaseEvaluator, EvalError, MetricScores
 
 
-def _build_ragas_llm():
-    """Return a LangChain ChatOpenAI configured for the active provider, or
-    ``None`` to let Ragas pick its own default (bare OpenAI).
+def _openrouter_judge_model() -> str | None:
+    """The OpenRouter model Ragas should judge with, or ``None`` for the
+    bare-OpenAI Ragas default.
 
     Triggers on any of:
       * ``LLM_PROVIDER=openrouter``
@@ -50,6 +50,25 @@ def _build_ragas_llm():
     )
     if not use_openrouter:
         return None
+    return model or "deepseek/deepseek-chat"
+
+
+def ragas_judge_id() -> str:
+    """Stable name for the judge ``_build_ragas_llm`` would configure, so
+    cached scores can be keyed on which LLM produced them."""
+    model = _openrouter_judge_model()
+    return f"openrouter:{model}" if model else "openai:ragas-default"
+
+
+def _build_ragas_llm():
+    """Return a LangChain ChatOpenAI configured for the active provider, or
+    ``None`` to let Ragas pick its own default (bare OpenAI).
+
+    See ``_openrouter_judge_model`` for when OpenRouter is used.
+    """
+    default_model = _openrouter_judge_model()
+    if default_model is None:
+        return None
 
     try:
         # Ragas ships with its own LangChain wrapper; we reuse it.
@@ -58,11 +77,10 @@ def _build_ragas_llm():
     except ImportError:
         return None
 
-    default_model = model or "deepseek/deepseek-chat"
     base_url = os.getenv("OPENROUTER_BASE_URL", OPENROUTER_BASE_URL)
     chat = ChatOpenAI(
         model=default_model,
-        openai_api_key=openrouter_key or openai_key,
+        openai_api_key=os.getenv("OPENROUTER_API_KEY", "") or os.getenv("OPENAI_API_KEY", ""),
         openai_api_base=base_url,
         temperature=0.0,
         default_headers={
@@ -0,0 +1,47 @@
+"""Tests for the HTTP adapters, run against an in-process transport."""
+from __future__ import annotations
+
+import json
+
+import httpx
+
+from runner.adapters.chatbot_adapter import ChatbotAdapter
+from runner.adapters.classification_adapter import ClassificationAdapter
+from runner.adapters.code_gen_adapter import CodeGenAdapter
+from runner.adapters.http_adapter import HTTPAdapter
+from runner.adapters.search_adapter import SearchAdapter
+
+
+def test_http_adapter_encodes_body_and_parses_response():
+    seen = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen["content_type"] = request.headers["content-type"]
+        seen["body"] = json.loads(request.content)
+        payload = {"data": {"answer": "42", "sources": ["doc ü", "doc 2"]}}
+        # Streamed content, so the client times the read like a real transport.
+        return httpx.Response(200, content=iter([json.dumps(payload).encode()]))
+
+    adapter = HTTPAdapter(
+        endpoint_url="http://pipeline.test/ask",
+        request_body_template={"q": "{{query}}", "user": "{{context.user}}"},
+        response_answer_path="data.answer",
+        response_contexts_path="data.sources",
+    )
+    adapter._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    out = adapter.run("what is it?", {"user": "ana"})
+
+    assert seen == {
+        "content_type": "application/json",
+        "body": {"q": "what is it?", "user": "ana"},
+    }
+    assert out.answer == "42"
+    assert out.retrieved_contexts == ["doc ü", "doc 2"]
+
+
+def test_stateless_http_adapters_are_reusable_and_thread_safe():
+    for cls in (HTTPAdapter, ClassificationAdapter, CodeGenAdapter, SearchAdapter):
+        assert cls.reusable and cls.thread_safe
+    # Carries session id and history, so it's neither.
+    assert not ChatbotAdapter.reusable and not ChatbotAdapter.thread_safe
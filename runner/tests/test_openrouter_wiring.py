@@ -184,3 +184,17 @@ def test_default_client_uses_openai_when_both_keys_and_no_override(monkeypatch):
     client = get_default_client()
     assert client.using_openrouter is False
     assert client._default_model == "gpt-4o"
+
+
+# ---------------------------------------------------------------- ragas judge
+
+
+def test_ragas_judge_id_tracks_provider_and_model(monkeypatch):
+    from runner.evaluators.ragas_evaluator import ragas_judge_id
+
+    monkeypatch.setenv("OPENAI_API_KEY", "oa-key")
+    assert ragas_judge_id() == "openai:ragas-default"
+    monkeypatch.setenv("LLM_PROVIDER", "openrouter")
+    assert ragas_judge_id() == "openrouter:deepseek/deepseek-chat"
+    monkeypatch.setenv("LLM_DEFAULT_MODEL", "moonshotai/kimi-k2.6")
+    assert ragas_judge_id() == "openrouter:moonshotai/kimi-k2.6"
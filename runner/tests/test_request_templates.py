@@ -0,0 +1,49 @@
+"""Tests for the compiled request-body templates used by the HTTP adapters."""
+from __future__ import annotations
+
+from runner.adapters._templates import compile_template, template_fields
+from runner.adapters.chatbot_adapter import ChatbotAdapter
+from runner.adapters.code_gen_adapter import CodeGenAdapter
+
+
+def test_placeholders_fill_nested_structures():
+    render = compile_template(
+        {"q": "{{query}}", "meta": [{"user": "u-{{context.user}}"}, 3], "fixed": {"a": 1}}
+    )
+    body = render(template_fields("hi", {"user": 7}))
+    assert body == {"q": "hi", "meta": [{"user": "u-7"}, 3], "fixed": {"a": 1}}
+
+
+def test_unknown_placeholders_are_left_verbatim():
+    render = compile_template({"a": "{{context.missing}} and {{query}}", "b": "{{nope}}"})
+    assert render(template_fields("x", {})) == {"a": "{{context.missing}} and x", "b": "{{nope}}"}
+
+
+def test_chatbot_history_renders_as_a_list():
+    adapter = ChatbotAdapter(endpoint_url="http://example.invalid")
+    adapter._history = [{"role": "user", "content": "earlier"}]
+    body = adapter._build_request_body("now", {})
+    assert body == {"message": "now", "history": [{"role": "user", "content": "earlier"}]}
+
+
+def test_code_gen_language_placeholder():
+    adapter = CodeGenAdapter(endpoint_url="http://example.invalid", language="rust")
+    assert adapter._build_request_body("sort a list", {}) == {
+        "prompt": "sort a list",
+        "language": "rust",
+    }
+
+
+def test_context_fields_resolve_on_lookup():
+    fields = template_fields("q", {"user": 7, "n": None})
+    assert fields.get("context.user") == "7"
+    assert fields.get("context.n") == "None"
+    assert fields.get("context.missing") is None
+    assert "context.user" not in fields  # never copied into the mapping
+
+
+def test_chatbot_incremental_history_sends_only_the_new_turn():
+    adapter = ChatbotAdapter(endpoint_url="http://example.invalid", incremental_history=True)
+    assert adapter._build_request_body("first", {}) == {"message": "first", "history": []}
+    adapter._history = [{"role": "user", "content": "first"}, {"role": "assistant", "content": "hi"}]
+    assert adapter._build_request_body("second", {}) == {"message": "second", "history": []}
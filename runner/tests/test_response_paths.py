@@ -0,0 +1,17 @@
+"""Tests for the precompiled dot-notation paths the HTTP adapters read
+responses with."""
+from __future__ import annotations
+
+from runner.adapters._paths import compile_path, extract
+
+
+def test_extract_walks_dicts_and_list_indices():
+    data = {"data": {"items": [{"text": "a"}, {"text": "b"}], "0": "zero"}}
+    assert extract(data, compile_path("data.items.1.text")) == "b"
+    assert extract(data, compile_path("data.0")) == "zero"  # digit key on a dict
+
+
+def test_extract_misses_return_none():
+    data = {"data": {"items": [{"text": "a"}], "empty": None, "s": "str"}}
+    for path in ("data.missing", "data.items.5", "data.items.x", "data.empty.x", "data.s.0"):
+        assert extract(data, compile_path(path)) is None